@@ -1,7 +1,14 @@
 """Simple in-memory cache for market data with market-aware TTL"""
 
+import itertools
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from contextlib import suppress
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, cast
+from typing import Any
 from zoneinfo import ZoneInfo
 
 from mcp_yfinance_ux.logging_config import get_logger
@@ -10,33 +17,82 @@ from yfinance_ux.common.dates import is_market_open
 
 logger = get_logger(__name__)
 
+# US market timezone (constructed once, reused by every cache touch)
+_NY_TZ = ZoneInfo("America/New_York")
+
 # 24-hour markets (always live data with short TTL)
-TWENTY_FOUR_HOUR_SYMBOLS = {
+TWENTY_FOUR_HOUR_SYMBOLS = frozenset({
     # Crypto
     "BTC-USD", "ETH-USD", "SOL-USD",
     # Commodities futures
     "GC=F", "SI=F", "PL=F", "HG=F", "CL=F", "NG=F",
     # US Futures
     "ES=F", "NQ=F", "YM=F",
-}
+})
+
+
+@dataclass(slots=True)
+class _Entry:
+    """Single cache entry (slots: attribute offsets instead of per-entry dict)
+
+    expires_at_mono is the authoritative expiry (time.monotonic() clock): hit checks
+    are one float compare and immune to wall-clock jumps. The epoch timestamps
+    (time.time()) are kept for get_cache_stats() only.
+    """
+
+    data: dict[str, Any]
+    timestamp: float
+    expires_at: float
+    expires_at_mono: float
+
+
+# Cache storage: {symbol: _Entry}, least recently used first
+_cache: OrderedDict[str, _Entry] = OrderedDict()
+
+# Bound on live entries - past this the least recently used symbol is evicted
+_MAX_ENTRIES = 512
 
-# Cache storage: {symbol: {"data": {...}, "timestamp": datetime, "expires_at": datetime}}
-_cache: dict[str, dict[str, Any]] = {}
+# Expired entries are left in place on read (read path stays write-free) and
+# dropped in bulk every _SWEEP_EVERY expired lookups
+_SWEEP_EVERY = 64
+_expired_lookups = itertools.count(1)
+
+# Negative cache: recent error results, {symbol: (expires_at_mono, data)}, oldest first.
+# Kept apart from _cache so errors never use (or evict) the success-path TTL slots
+_error_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+ERROR_TTL_SECONDS = 30  # Retry a failing symbol at most twice a minute
 
 # TTL for 24-hour markets (in seconds)
 CRYPTO_TTL_SECONDS = 120  # 2 minutes for crypto
 FUTURES_TTL_SECONDS = 30  # 30 seconds for futures (more active)
 
 # Futures symbols (subset of 24-hour markets, need shorter cache)
-FUTURES_SYMBOLS = {
+FUTURES_SYMBOLS = frozenset({
     "ES=F", "NQ=F", "YM=F",  # US index futures
     "GC=F", "SI=F", "PL=F", "HG=F", "CL=F", "NG=F",  # Commodity futures
+})
+
+# Precomputed TTL policy: symbol -> (market_type, ttl_seconds)
+# One dict lookup replaces the futures/24-hour membership ladder on every cache touch.
+# Symbols not in the table are session markets (TTL depends on market hours).
+_TTL_POLICY: dict[str, tuple[str, int]] = {
+    **dict.fromkeys(TWENTY_FOUR_HOUR_SYMBOLS, ("crypto", CRYPTO_TTL_SECONDS)),
+    **dict.fromkeys(FUTURES_SYMBOLS, ("futures", FUTURES_TTL_SECONDS)),
 }
+_SESSION_POLICY: tuple[str, int | None] = ("session", None)
+
+# get_next_market_open() memo ({"next_open": last computed open}): the 9:30 ET / weekend walk
+# runs once per open instead of on every session-market expiry
+_next_open_memo: dict[str, datetime] = {}
 
 
 def get_next_market_open() -> datetime:
     """Get the next market open time (9:30am ET)"""
-    now = datetime.now(ZoneInfo("America/New_York"))
+    now = datetime.now(_NY_TZ)
+
+    memo = _next_open_memo.get("next_open")
+    if memo is not None and now < memo:
+        return memo
 
     # Start with today's 9:30am
     next_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
@@ -49,6 +105,7 @@ def get_next_market_open() -> datetime:
     while next_open.weekday() >= SATURDAY:
         next_open = next_open + timedelta(days=1)
 
+    _next_open_memo["next_open"] = next_open
     return next_open
 
 
@@ -57,91 +114,172 @@ def is_24_hour_market(symbol: str) -> bool:
     return symbol in TWENTY_FOUR_HOUR_SYMBOLS
 
 
-def get_cache_expiry(symbol: str) -> datetime:
-    """Get cache expiry time for symbol based on market type"""
-    now = datetime.now(ZoneInfo("America/New_York"))
-
-    if symbol in FUTURES_SYMBOLS:
-        # Futures: 30 second cache (very active)
-        return now + timedelta(seconds=FUTURES_TTL_SECONDS)
-    if is_24_hour_market(symbol):
-        # Crypto: 2 minute cache
-        return now + timedelta(seconds=CRYPTO_TTL_SECONDS)
+def get_cache_expiry(symbol: str) -> float:
+    """Get cache expiry time for symbol (epoch seconds) based on market type"""
+    policy = _TTL_POLICY.get(symbol)
+    if policy is not None:
+        # 24-hour markets: fixed TTL (futures 30s, crypto 2 min), wall-clock zone irrelevant
+        return time.time() + policy[1]
 
     # Session markets: SHORT TTL when open, cache until next open when closed
     if is_market_open():
         # Market open: 2 minute cache for live updates during trading hours
-        return now + timedelta(seconds=120)
+        return time.time() + 120
     # Market closed: cache until next open (prices won't change)
-    return get_next_market_open()
+    return get_next_market_open().timestamp()
 
 
 def get_cached_data(symbol: str) -> dict[str, Any] | None:
     """Get cached data for symbol if still valid"""
-    if symbol not in _cache:
-        logger.debug(f"Cache MISS: {symbol} (not in cache)")
+    cached = _cache.get(symbol)
+    if cached is None:
+        logger.debug("Cache MISS: %s (not in cache)", symbol)
         return None
 
-    cached = _cache[symbol]
-    now = datetime.now(ZoneInfo("America/New_York"))
+    now_mono = time.monotonic()
 
-    # Check if expired
-    if now >= cached["expires_at"]:
-        # Expired - remove from cache
-        ttl_expired = (now - cached["expires_at"]).total_seconds()
-        logger.debug(f"Cache MISS: {symbol} (expired {ttl_expired:.1f}s ago)")
-        del _cache[symbol]
+    # Check if expired (entry is overwritten by the next set, or dropped by a sweep)
+    if now_mono >= cached.expires_at_mono:
+        logger.debug(
+            "Cache MISS: %s (expired %.1fs ago)", symbol, now_mono - cached.expires_at_mono
+        )
+        if next(_expired_lookups) % _SWEEP_EVERY == 0:
+            sweep_expired()
         return None
 
-    ttl_remaining = (cached["expires_at"] - now).total_seconds()
-    if symbol in FUTURES_SYMBOLS:
-        market_type = "futures"
-    elif is_24_hour_market(symbol):
-        market_type = "crypto"
-    else:
-        market_type = "session"
-    logger.info(f"Cache HIT: {symbol} ({market_type}, TTL={ttl_remaining:.0f}s)")
-    return cast("dict[str, Any]", cached["data"])
+    # Mark as most recently used (may have been swept/evicted by another thread)
+    with suppress(KeyError):
+        _cache.move_to_end(symbol)
+
+    # Skip building the log line when INFO is filtered (hot path)
+    if logger.isEnabledFor(logging.INFO):
+        ttl_remaining = cached.expires_at_mono - now_mono
+        market_type = _TTL_POLICY.get(symbol, _SESSION_POLICY)[0]
+        logger.info(f"Cache HIT: {symbol} ({market_type}, TTL={ttl_remaining:.0f}s)")
+    return cached.data
+
+
+def get_cached_data_many(symbols: Sequence[str]) -> dict[str, dict[str, Any]]:
+    """Get valid cached data for several symbols in one pass: {symbol: data} for hits only
+
+    Same semantics as get_cached_data() per symbol, with one clock read and one
+    summary log line for the whole batch instead of one per symbol.
+    """
+    now_mono = time.monotonic()
+    hits: dict[str, dict[str, Any]] = {}
+    expired = 0
+    sweep_due = False
+    for symbol in symbols:
+        cached = _cache.get(symbol)
+        if cached is None:
+            continue
+        if now_mono >= cached.expires_at_mono:
+            expired += 1
+            sweep_due |= next(_expired_lookups) % _SWEEP_EVERY == 0
+            continue
+        # Mark as most recently used (may have been swept/evicted by another thread)
+        with suppress(KeyError):
+            _cache.move_to_end(symbol)
+        hits[symbol] = cached.data
+
+    logger.debug(
+        "Cache MULTI-GET: %d/%d hits (%d expired)", len(hits), len(symbols), expired
+    )
+    if sweep_due:
+        sweep_expired()
+    return hits
 
 
 def set_cached_data(symbol: str, data: dict[str, Any]) -> None:
     """Cache data for symbol with appropriate TTL"""
-    now = datetime.now(ZoneInfo("America/New_York"))
+    now = time.time()
     expires_at = get_cache_expiry(symbol)
-    ttl_seconds = (expires_at - now).total_seconds()
-
-    _cache[symbol] = {
-        "data": data,
-        "timestamp": now,
-        "expires_at": expires_at,
-    }
-
-    if symbol in FUTURES_SYMBOLS:
-        market_type = "futures"
-    elif is_24_hour_market(symbol):
-        market_type = "crypto"
-    else:
-        market_type = "session"
-    logger.info(f"Cache SET: {symbol} ({market_type}, TTL={ttl_seconds:.0f}s)")
+    ttl_seconds = expires_at - now
+
+    _cache[symbol] = _Entry(
+        data=data,
+        timestamp=now,
+        expires_at=expires_at,
+        expires_at_mono=time.monotonic() + ttl_seconds,
+    )
+    # Re-setting a key keeps its old position, so move it to the MRU end
+    # (KeyError: another thread evicted/cleared it first - still enforce the cap)
+    with suppress(KeyError):
+        _cache.move_to_end(symbol)
+    # Evict from the LRU end (KeyError: another thread emptied it first)
+    while len(_cache) > _MAX_ENTRIES:
+        try:
+            evicted, _ = _cache.popitem(last=False)
+        except KeyError:
+            break
+        logger.debug("Cache EVICT: %s (LRU, cap=%d)", evicted, _MAX_ENTRIES)
+
+    if logger.isEnabledFor(logging.INFO):
+        market_type = _TTL_POLICY.get(symbol, _SESSION_POLICY)[0]
+        logger.info(f"Cache SET: {symbol} ({market_type}, TTL={ttl_seconds:.0f}s)")
+
+
+def get_cached_error(symbol: str) -> dict[str, Any] | None:
+    """Get the recent error result for symbol, if it failed within ERROR_TTL_SECONDS"""
+    cached = _error_cache.get(symbol)
+    if cached is None:
+        return None
+    expires_at_mono, data = cached
+    if time.monotonic() >= expires_at_mono:
+        _error_cache.pop(symbol, None)
+        return None
+    logger.debug("Cache ERROR HIT: %s", symbol)
+    return data
+
+
+def set_cached_error(symbol: str, data: dict[str, Any]) -> None:
+    """Remember an error result for symbol for ERROR_TTL_SECONDS (stops per-call retries)"""
+    _error_cache.pop(symbol, None)  # Re-insert at the newest end
+    _error_cache[symbol] = (time.monotonic() + ERROR_TTL_SECONDS, data)
+    with suppress(KeyError):
+        while len(_error_cache) > _MAX_ENTRIES:
+            _error_cache.popitem(last=False)
+    logger.debug("Cache ERROR SET: %s (TTL=%ds)", symbol, ERROR_TTL_SECONDS)
+
+
+def sweep_expired() -> int:
+    """Drop all expired entries in one pass, returns number removed"""
+    now_mono = time.monotonic()
+    # Snapshot items - other threads may be setting entries concurrently
+    expired = [
+        (symbol, cached)
+        for symbol, cached in list(_cache.items())
+        if now_mono >= cached.expires_at_mono
+    ]
+    removed = 0
+    for symbol, cached in expired:
+        # Only remove if not refreshed since the snapshot
+        if _cache.get(symbol) is cached:
+            _cache.pop(symbol, None)
+            removed += 1
+    if removed:
+        logger.debug("Cache SWEEP: removed %d expired entries", removed)
+    return removed
 
 
 def clear_cache() -> None:
-    """Clear all cached data"""
+    """Clear all cached data (including remembered errors)"""
     _cache.clear()
+    _error_cache.clear()
 
 
 def get_cache_stats() -> dict[str, Any]:
     """Get cache statistics for debugging"""
-    now = datetime.now(ZoneInfo("America/New_York"))
+    now_mono = time.monotonic()
 
     return {
         "total_entries": len(_cache),
         "entries": [
             {
                 "symbol": symbol,
-                "cached_at": cached["timestamp"].isoformat(),
-                "expires_at": cached["expires_at"].isoformat(),
-                "ttl_seconds": (cached["expires_at"] - now).total_seconds(),
+                "cached_at": datetime.fromtimestamp(cached.timestamp, _NY_TZ).isoformat(),
+                "expires_at": datetime.fromtimestamp(cached.expires_at, _NY_TZ).isoformat(),
+                "ttl_seconds": cached.expires_at_mono - now_mono,
             }
             for symbol, cached in _cache.items()
         ]
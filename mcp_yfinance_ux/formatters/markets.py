@@ -4,6 +4,7 @@ Market formatters - BBG Lite style.
 Formats market overview screens with factors and momentum.
 """
 
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -21,202 +22,242 @@ from yfinance_ux.common.dates import (
     is_market_open,
 )
 
+# US market timezone (constructed once at import)
+_NY_TZ = ZoneInfo("America/New_York")
+
+# Day names for the header (what %a gives in the default C locale)
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# Fixed column widths for markets() alignment
+_NAME_WIDTH = 20
+_TICKER_WIDTH = 8
+_PRICE_WIDTH = 12
+_CHANGE_WIDTH = 9
+_RVOL_WIDTH = 8
+_MOM1M_WIDTH = 10
+_MOM1Y_WIDTH = 10
+
+# Blank cells for missing/hidden columns (widths are names, so not compile-time folded)
+_PAD_TICKER = " " * _TICKER_WIDTH
+_PAD_RVOL = " " * _RVOL_WIDTH
+_PAD_MOM1M = " " * _MOM1M_WIDTH
+_PAD_MOM1Y = " " * _MOM1Y_WIDTH
+
+# Cell format specs built once from the widths (alignment + number format in one pass).
+# Suffixed cells ("%") reserve one char of the width for the suffix.
+_NAME_FMT = f"{{:<{_NAME_WIDTH}}}"
+_TICKER_FMT = f"{{:<{_TICKER_WIDTH}}}"
+_PRICE_FMT = f"{{:>{_PRICE_WIDTH},.2f}}"
+_CHANGE_FMT = f"{{:>+{_CHANGE_WIDTH - 1}.2f}}%"
+_MOM1M_FMT = f"{{:>+{_MOM1M_WIDTH - 1}.1f}}%"
+_MOM1Y_FMT = f"{{:>+{_MOM1Y_WIDTH - 1}.1f}}%"
+_PRICE_CHANGE_FMT = _PRICE_FMT + _CHANGE_FMT
+_RVOL_FMT = f"{{:>{_RVOL_WIDTH - 1}.1f}}x"
+_RVOL_WARN_FMT = f"{{:>{_RVOL_WIDTH - 2}.1f}}x⚠"  # Unusual volume flag takes one more char
+
+
+# markets() sections after US FUTURES, rendered in order by format_markets().
+# Each entry is a title, a show_ticker flag and key groups paired with show_volume.
+# A section may hold several key groups when RVOL reliability differs within it.
+_US_EQUITIES = "US EQUITIES"
+_KeyGroups = tuple[tuple[tuple[str, ...], bool], ...]
+_SECTIONS: tuple[tuple[str, bool, _KeyGroups], ...] = (
+    (_US_EQUITIES, False, (
+        (("sp500", "nasdaq", "dow", "russell2000"), True),
+    )),
+    # GLOBAL (no RVOL - index volume data unreliable)
+    ("GLOBAL", False, (
+        (("stoxx50", "nikkei", "hangseng", "shanghai",
+          "kospi", "nifty50", "asx200", "taiwan", "bovespa"), False),
+    )),
+    ("COMMODITIES", False, (
+        # Metals: hide RVOL (yfinance averageVolume unreliable)
+        (("gold", "silver", "platinum", "copper"), False),
+        # Energy: show RVOL (reliable data)
+        (("oil_wti", "natgas"), True),
+    )),
+    ("CRYPTO", False, (
+        (("btc", "eth", "sol"), True),
+    )),
+    # SECTORS / STYLES / PRIVATE CREDIT - show ticker for drill-down
+    ("SECTORS", True, (
+        (("tech", "financials", "healthcare", "energy", "consumer_disc",
+          "consumer_stpl", "industrials", "utilities", "materials",
+          "real_estate", "communication"), True),
+    )),
+    ("STYLES", True, (
+        (("momentum", "value", "growth", "quality", "small_cap"), True),
+    )),
+    ("PRIVATE CREDIT", True, (
+        (("private_credit",), True),
+    )),
+    # VOLATILITY & RATES (no RVOL - indices, not tradable)
+    ("VOLATILITY & RATES", False, (
+        (("vix", "us10y"), False),
+    )),
+)
 
-def format_markets(data: dict[str, dict[str, Any]]) -> str:  # noqa: PLR0912, PLR0915
-    """Format markets() screen - BBG Lite style with factors"""
-    now = datetime.now(ZoneInfo("America/New_York"))
-    date_str = now.strftime("%Y-%m-%d")
-    time_str = now.strftime("%H:%M %Z")
 
-    # Header - simple day/date/time (data shows if futures trading)
-    market_is_open = is_market_open()
-    futures_are_open = is_futures_open()
-    day_of_week = now.strftime("%a")  # Mon, Tue, Wed, etc.
-
-    lines = [f"MARKETS | {day_of_week} {date_str} {time_str}", ""]
-
-    # Fixed column widths for alignment
-    name_width = 20
-    ticker_width = 8
-    price_width = 12
-    change_width = 9
-    rvol_width = 8
-    mom1m_width = 10
-    mom1y_width = 10
-
-    # Helper to format line with ticker symbol and optional momentum
-    def format_line(  # noqa: PLR0912
-        key: str,
-        show_ticker: bool = False,
-        show_momentum: bool = True,
-        show_volume: bool = True
-    ) -> str | None:
-        info = data.get(key)
-        if not info or info.get("error"):
-            return None
-
-        price = info.get("price")
-        change_pct = info.get("change_percent")
-
-        if price is None or change_pct is None:
-            return None
-
-        name = DISPLAY_NAMES.get(key, key)
-        ticker = MARKET_SYMBOLS.get(key, "")
-
-        # Build line using fixed column widths
-        parts = []
-
-        # Name column (left-aligned)
-        parts.append(f"{name:<{name_width}}")
-
-        # Ticker column (left-aligned)
-        if show_ticker:
-            parts.append(f"{ticker:<{ticker_width}}")
-        else:
-            parts.append(" " * ticker_width)
-
-        # Price column (right-aligned)
-        price_str = f"{price:,.2f}"
-        parts.append(f"{price_str:>{price_width}}")
-
-        # Change column (right-aligned)
-        change_str = f"{change_pct:+.2f}%"
-        parts.append(f"{change_str:>{change_width}}")
-
-        # RVOL column (right-aligned)
-        if show_volume:
-            rel_vol = info.get("rel_volume")
-            if rel_vol is not None and rel_vol > 0:
-                rvol_str = f"{rel_vol:.1f}x"
-                if rel_vol > UNUSUAL_VOLUME_THRESHOLD:
-                    rvol_str += "⚠"
-                parts.append(f"{rvol_str:>{rvol_width}}")
-            else:
-                parts.append(" " * rvol_width)
-        else:
-            parts.append(" " * rvol_width)
+# Row cells after NAME/TICKER/PRICE/CHANGE, one variant per column shape.
+# Resolved per row at import (see _RENDER_SECTIONS) so rendering never re-checks
+# the show_volume/show_momentum flags.
+_RowGet = Callable[[str], Any]
+_RowTail = Callable[[_RowGet], str]
 
-        # Momentum columns (right-aligned)
-        if show_momentum:
-            mom_1m = info.get("momentum_1m")
-            mom_1y = info.get("momentum_1y")
 
-            if mom_1m is not None:
-                mom1m_str = f"{mom_1m:+.1f}%"
-                parts.append(f"{mom1m_str:>{mom1m_width}}")
-            else:
-                parts.append(" " * mom1m_width)
+def _rvol_cell(get: _RowGet) -> str:
+    """RVOL column (right-aligned, ⚠ above the unusual volume threshold)"""
+    rel_vol = get("rel_volume")
+    if rel_vol is not None and rel_vol > 0:
+        rvol_fmt = _RVOL_WARN_FMT if rel_vol > UNUSUAL_VOLUME_THRESHOLD else _RVOL_FMT
+        return rvol_fmt.format(rel_vol)
+    return _PAD_RVOL
 
-            if mom_1y is not None:
-                mom1y_str = f"{mom_1y:+.1f}%"
-                parts.append(f"{mom1y_str:>{mom1y_width}}")
-            else:
-                parts.append(" " * mom1y_width)
 
-        return "".join(parts)
+def _momentum_cells(get: _RowGet) -> str:
+    """1M/1Y momentum columns (right-aligned)"""
+    mom_1m = get("momentum_1m")
+    mom_1y = get("momentum_1y")
+    return (
+        (_MOM1M_FMT.format(mom_1m) if mom_1m is not None else _PAD_MOM1M)
+        + (_MOM1Y_FMT.format(mom_1y) if mom_1y is not None else _PAD_MOM1Y)
+    )
 
-    # Helper to build section header
-    def make_header(section_name: str, show_ticker: bool = False) -> str:
-        parts = []
-        parts.append(f"{section_name:<{name_width}}")
-        if show_ticker:
-            parts.append(f"{'TICKER':<{ticker_width}}")
-        else:
-            parts.append(" " * ticker_width)
-        parts.append(f"{'PRICE':>{price_width}}")
-        parts.append(f"{'CHANGE':>{change_width}}")
-        parts.append(f"{'RVOL':>{rvol_width}}")
-        parts.append(f"{'1M':>{mom1m_width}}")
-        parts.append(f"{'1Y':>{mom1y_width}}")
-        return "".join(parts)
+
+def _tail_rvol_momentum(get: _RowGet) -> str:
+    """RVOL + momentum"""
+    return _rvol_cell(get) + _momentum_cells(get)
+
+
+def _tail_momentum(get: _RowGet) -> str:
+    """Blank RVOL + momentum (volume data unreliable)"""
+    return _PAD_RVOL + _momentum_cells(get)
+
+
+def _tail_blank(get: _RowGet) -> str:  # noqa: ARG001
+    """Blank RVOL, no momentum (futures)"""
+    return _PAD_RVOL
+
+
+def _row_prefix(key: str, show_ticker: bool) -> str:
+    """Static NAME + TICKER cells for key (display name and symbol never change)"""
+    ticker = _TICKER_FMT.format(MARKET_SYMBOLS.get(key, "")) if show_ticker else _PAD_TICKER
+    return _NAME_FMT.format(DISPLAY_NAMES.get(key, key)) + ticker
+
+
+def _format_row(
+    data: dict[str, dict[str, Any]], key: str, prefix: str, tail: _RowTail
+) -> str | None:
+    """Format one markets() row from its prebuilt prefix and column-shape tail"""
+    info = data.get(key)
+    if not info:
+        return None
+    # Bind the row's .get once (rows are plain dicts from the fetch layer)
+    get = info.get
+    if get("error"):
+        return None
+
+    price = get("price")
+    change_pct = get("change_percent")
+
+    if price is None or change_pct is None:
+        return None
+
+    return prefix + _PRICE_CHANGE_FMT.format(price, change_pct) + tail(get)
+
+
+def _make_header(section_name: str, show_ticker: bool = False) -> str:
+    """Build a markets() section header aligned with _format_row columns"""
+    parts = []
+    parts.append(f"{section_name:<{_NAME_WIDTH}}")
+    if show_ticker:
+        parts.append(f"{'TICKER':<{_TICKER_WIDTH}}")
+    else:
+        parts.append(_PAD_TICKER)
+    parts.append(f"{'PRICE':>{_PRICE_WIDTH}}")
+    parts.append(f"{'CHANGE':>{_CHANGE_WIDTH}}")
+    parts.append(f"{'RVOL':>{_RVOL_WIDTH}}")
+    parts.append(f"{'1M':>{_MOM1M_WIDTH}}")
+    parts.append(f"{'1Y':>{_MOM1Y_WIDTH}}")
+    return "".join(parts)
+
+
+# Section headers are static - built once at import, not per render.
+# US EQUITIES carries the market status, so it has an OPEN and a CLOSED variant
+# (None in _RENDER_SECTIONS marks where one of them goes).
+_HDR_FUTURES = "".join([
+    f"{'US FUTURES':<{_NAME_WIDTH}}",
+    _PAD_TICKER,
+    f"{'PRICE':>{_PRICE_WIDTH}}",
+    f"{'CHANGE':>{_CHANGE_WIDTH}}",
+])
+_HDR_EQ_OPEN = _make_header(f"{_US_EQUITIES} (OPEN)")
+_HDR_EQ_CLOSED = _make_header(f"{_US_EQUITIES} (CLOSED)")
+
+# Rows resolved at import: static prefix and column-shape tail per key
+_Row = tuple[str, str, _RowTail]  # key, prefix, tail
+_FUTURES_ROWS: tuple[_Row, ...] = tuple(
+    (key, _row_prefix(key, show_ticker=False), _tail_blank)
+    for key in ("es_futures", "nq_futures", "ym_futures")
+)
+_RENDER_SECTIONS: tuple[tuple[str | None, tuple[_Row, ...]], ...] = tuple(
+    (
+        None if title == _US_EQUITIES else _make_header(title, show_ticker=show_ticker),
+        tuple(
+            (
+                key,
+                _row_prefix(key, show_ticker),
+                _tail_rvol_momentum if show_volume else _tail_momentum,
+            )
+            for keys, show_volume in groups
+            for key in keys
+        ),
+    )
+    for title, show_ticker, groups in _SECTIONS
+)
+
+
+def _stamp(now: datetime) -> str:
+    """'2025-01-06 09:45 EST' from datetime fields (no strftime format parsing)"""
+    return (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d} "
+        f"{now.hour:02d}:{now.minute:02d} {now.tzname()}"
+    )
+
+
+def format_markets(data: dict[str, dict[str, Any]]) -> str:
+    """Format markets() screen - BBG Lite style with factors"""
+    now = datetime.now(_NY_TZ)
+
+    # Header - simple day/date/time (data shows if futures trading)
+    # Reuse one `now` for every market-hours check (single clock read per render)
+    market_is_open = is_market_open(now)
+    futures_are_open = is_futures_open(now)
+
+    lines = [f"MARKETS | {_WEEKDAYS[now.weekday()]} {_stamp(now)}", ""]
 
     # US FUTURES (show only when market closed - forward-looking sentiment)
     # No 1M/1Y momentum for futures (contracts roll over)
     # Only show when market is closed (pre-market, after-hours, weekends)
     if futures_are_open and not market_is_open:
-        parts = [
-            f"{'US FUTURES':<{name_width}}",
-            " " * ticker_width,
-            f"{'PRICE':>{price_width}}",
-            f"{'CHANGE':>{change_width}}",
+        # One extend per section (header, rows, blank) instead of an append per line
+        futures_rows = [
+            line
+            for key, prefix, tail in _FUTURES_ROWS
+            if (line := _format_row(data, key, prefix, tail))
         ]
-        lines.append("".join(parts))
-        for key in ["es_futures", "nq_futures", "ym_futures"]:
-            if line := format_line(key, show_momentum=False, show_volume=False):
-                lines.append(line)
-        lines.append("")
-
-    # US EQUITIES (always show - either live during market or close after hours)
-    market_status = "OPEN" if market_is_open else "CLOSED"
-    section_name = f"US EQUITIES ({market_status})"
-    lines.append(make_header(section_name))
-    for key in ["sp500", "nasdaq", "dow", "russell2000"]:
-        if line := format_line(key):
-            lines.append(line)
-    lines.append("")
-
-    # GLOBAL (no RVOL - index volume data unreliable)
-    lines.append(make_header("GLOBAL"))
-    global_keys = [
-        "stoxx50", "nikkei", "hangseng", "shanghai",
-        "kospi", "nifty50", "asx200", "taiwan", "bovespa"
-    ]
-    for key in global_keys:
-        if line := format_line(key, show_volume=False):
-            lines.append(line)
-    lines.append("")
-
-    # COMMODITIES
-    lines.append(make_header("COMMODITIES"))
-    # Metals: hide RVOL (yfinance averageVolume unreliable)
-    for key in ["gold", "silver", "platinum", "copper"]:
-        if line := format_line(key, show_volume=False):
-            lines.append(line)
-    # Energy: show RVOL (reliable data)
-    for key in ["oil_wti", "natgas"]:
-        if line := format_line(key):
-            lines.append(line)
-    lines.append("")
-
-    # CRYPTO
-    lines.append(make_header("CRYPTO"))
-    for key in ["btc", "eth", "sol"]:
-        if line := format_line(key):
-            lines.append(line)
-    lines.append("")
-
-    # SECTORS - show ticker for drill-down
-    lines.append(make_header("SECTORS", show_ticker=True))
-    sector_keys = [
-        "tech", "financials", "healthcare", "energy", "consumer_disc",
-        "consumer_stpl", "industrials", "utilities", "materials",
-        "real_estate", "communication"
-    ]
-    for key in sector_keys:
-        if line := format_line(key, show_ticker=True):
-            lines.append(line)
-    lines.append("")
-
-    # STYLES - show ticker for drill-down
-    lines.append(make_header("STYLES", show_ticker=True))
-    for key in ["momentum", "value", "growth", "quality", "small_cap"]:
-        if line := format_line(key, show_ticker=True):
-            lines.append(line)
-    lines.append("")
-
-    # PRIVATE CREDIT
-    lines.append(make_header("PRIVATE CREDIT", show_ticker=True))
-    if line := format_line("private_credit", show_ticker=True):
-        lines.append(line)
-    lines.append("")
-
-    # VOLATILITY & RATES (no RVOL - indices, not tradable)
-    lines.append(make_header("VOLATILITY & RATES"))
-    for key in ["vix", "us10y"]:
-        if line := format_line(key, show_volume=False):
-            lines.append(line)
-    lines.append("")
+        lines.extend((_HDR_FUTURES, *futures_rows, ""))
+
+    # Remaining sections are table-driven (see _SECTIONS)
+    # US EQUITIES always shown - either live during market or close after hours
+    eq_header = _HDR_EQ_OPEN if market_is_open else _HDR_EQ_CLOSED
+    for header, section_rows in _RENDER_SECTIONS:
+        rows = [
+            line
+            for key, prefix, tail in section_rows
+            if (line := _format_row(data, key, prefix, tail))
+        ]
+        lines.extend((eq_header if header is None else header, *rows, ""))
 
     # Footer
     lines.append("Source: yfinance")
@@ -224,17 +265,28 @@ def format_markets(data: dict[str, dict[str, Any]]) -> str:  # noqa: PLR0912, PL
     return "\n".join(lines)
 
 
+def _region_status(
+    status_cache: dict[str, str], region: str, now: datetime, market_is_open: bool
+) -> str:
+    """Market status for region, computed once per render"""
+    status = status_cache.get(region)
+    if status is None:
+        # US status is the already-computed market_is_open; other regions derive once
+        hint = market_is_open if region == "us" else None
+        status = status_cache[region] = get_market_status(region, now, is_open_hint=hint)
+    return status
+
+
 def format_market_snapshot(data: dict[str, dict[str, Any]]) -> str:  # noqa: PLR0912
     """Format market data into concise readable text (BBG Lite style)"""
-    now = datetime.now(ZoneInfo("America/New_York"))
-    date_str = now.strftime("%Y-%m-%d")
-    time_str = now.strftime("%H:%M %Z")
+    now = datetime.now(_NY_TZ)
 
     # Header with timestamp
-    lines = [f"MARKETS {date_str} {time_str}"]
+    lines = [f"MARKETS {_stamp(now)}"]
 
     # Determine which market section to show (MARKET vs MARKET FUTURES)
-    market_is_open = is_market_open()
+    market_is_open = is_market_open(now)
+    status_cache: dict[str, str] = {}  # region -> status, for this render
 
     for section_name, symbols in FORMATTING_SECTIONS.items():
         # Skip MARKET section if market closed (show MARKET FUTURES instead)
@@ -245,20 +297,21 @@ def format_market_snapshot(data: dict[str, dict[str, Any]]) -> str:  # noqa: PLR
             continue
 
         # Check if any symbols in this section are in our data
-        section_data = {k: v for k, v in data.items() if k in symbols}
-        if not section_data:
+        # (one lookup per section symbol - rows follow the section's symbol order)
+        rows = [(symbol, data[symbol]) for symbol in symbols if symbol in data]
+        if not rows:
             continue
 
         # Add market status to section header if applicable
         region = SECTION_REGION_MAP.get(section_name)
         if region:
-            status = get_market_status(region)
+            status = _region_status(status_cache, region, now, market_is_open)
             section_header = f"{section_name} ({status})"
         else:
             section_header = section_name
 
         lines.append(section_header)
-        for symbol, info in section_data.items():
+        for symbol, info in rows:
             if info.get("error"):
                 display_name = DISPLAY_NAMES.get(symbol, symbol)
                 lines.append(f"{display_name:12} ERROR - {info['error']}")
@@ -4,8 +4,23 @@ Options formatter - BBG Lite style.
 Formats comprehensive options chain analysis with positioning, IV, volume.
 """
 
+from itertools import islice
 from typing import Any
 
+from yfinance_ux.common.constants import PC_RATIO_BEARISH_THRESHOLD, PC_RATIO_BULLISH_THRESHOLD
+
+# P/C ratio labels, indexed as (below bullish, between, above bearish) - see _pc_sentiment()
+_PC_SENTIMENT_LABELS = ("BULLISH", "NEUTRAL", "BEARISH")
+# Term structure rows: first two expirations named, everything after is "Far"
+_TERM_LABELS = ("Near", "Mid", "Far")
+
+
+def _pc_sentiment(pc_ratio: float) -> str:
+    """Put/call ratio sentiment label, picked by index instead of an if/elif chain"""
+    return _PC_SENTIMENT_LABELS[
+        (pc_ratio > PC_RATIO_BEARISH_THRESHOLD) + 1 - (pc_ratio < PC_RATIO_BULLISH_THRESHOLD)
+    ]
+
 
 def format_options(data: dict[str, Any]) -> str:  # noqa: PLR0915, PLR0912
     """
@@ -31,15 +46,14 @@ def format_options(data: dict[str, Any]) -> str:  # noqa: PLR0915, PLR0912
 
     # Positioning (most important - hierarchy principle)
     pc_oi = data["pc_ratio_oi"]
-    # Thresholds: 0.8 = bullish, 1.2 = bearish
-    sentiment = "BULLISH" if pc_oi < 0.8 else "BEARISH" if pc_oi > 1.2 else "NEUTRAL"  # noqa: PLR2004
+    sentiment = _pc_sentiment(pc_oi)
     call_oi = data["call_oi_total"]
     put_oi = data["put_oi_total"]
 
     multiplier = ""
-    if pc_oi < 0.8 and pc_oi > 0:  # noqa: PLR2004
+    if pc_oi < PC_RATIO_BULLISH_THRESHOLD and pc_oi > 0:
         multiplier = f" (calls {(1/pc_oi):.1f}x puts)"
-    elif pc_oi > 1.2:  # noqa: PLR2004
+    elif pc_oi > PC_RATIO_BEARISH_THRESHOLD:
         multiplier = f" (puts {pc_oi:.1f}x calls)"
 
     lines.extend(
@@ -178,13 +192,7 @@ def format_options(data: dict[str, Any]) -> str:  # noqa: PLR0915, PLR0912
     if data["term_structure"]:
         lines.append("TERM STRUCTURE")
         for idx, ts in enumerate(data["term_structure"]):
-            label = (
-                "Near"
-                if idx == 0
-                else "Mid"
-                if idx == 1
-                else "Far"
-            )
+            label = _TERM_LABELS[min(idx, 2)]
             marker = "← Current" if idx == 0 else ""
             lines.append(f"{label} ({ts['dte']}d):    {ts['iv']:.1f}%       {marker}")
 
@@ -266,7 +274,7 @@ def format_options(data: dict[str, Any]) -> str:  # noqa: PLR0915, PLR0912
     call_vol = data["call_volume_total"]
     put_vol = data["put_volume_total"]
 
-    vol_sentiment = "BULLISH" if pc_vol < 0.8 else "BEARISH" if pc_vol > 1.2 else "NEUTRAL"  # noqa: PLR2004
+    vol_sentiment = _pc_sentiment(pc_vol)
     lines.extend([
         "VOLUME ANALYSIS",
         f"Call Volume:  {call_vol:,}",
@@ -342,7 +350,7 @@ def format_options(data: dict[str, Any]) -> str:  # noqa: PLR0915, PLR0912
             "Exp Date       DTE     IV     Total OI    Total Vol",
             "─────────────────────────────────────────────────────",
         ])
-        for exp in all_exp[:10]:  # Show first 10
+        for exp in islice(all_exp, 10):  # Show first 10
             exp_date = exp["expiration"]
             dte = exp["dte"]
             iv = exp["iv"]
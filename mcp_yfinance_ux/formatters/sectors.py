@@ -8,6 +8,12 @@ from datetime import datetime
 from typing import Any
 from zoneinfo import ZoneInfo
 
+# US market timezone (constructed once at import)
+_NY_TZ = ZoneInfo("America/New_York")
+
+# Blank CHANGE / 1M cell in the holdings table
+_PAD9 = " " * 9
+
 
 def format_sector(data: dict[str, Any]) -> str:
     """Format sector() screen - BBG Lite style"""
@@ -19,10 +25,6 @@ def format_sector(data: dict[str, Any]) -> str:
     sector_data = data["sector_data"]
     holdings = data["holdings"]
 
-    now = datetime.now(ZoneInfo("America/New_York"))
-    date_str = now.strftime("%Y-%m-%d")
-    time_str = now.strftime("%H:%M %Z")
-
     # Header (simple title for panel)
     header = f"SECTOR {sector_name.upper()}"
     lines = [header, ""]
@@ -36,12 +38,11 @@ def format_sector(data: dict[str, Any]) -> str:
     lines.append("TICKER    CHANGE       1M         1Y")
 
     # Format: XLK      -0.99%     +1.9%     +25.8%
-    line = f"{sector_symbol:6}  {change_pct:+6.2f}%"
-    if mom_1m is not None:
-        line += f"     {mom_1m:+.1f}%"
-    if mom_1y is not None:
-        line += f"     {mom_1y:+.1f}%"
-    lines.append(line)
+    lines.append(
+        f"{sector_symbol:6}  {change_pct:+6.2f}%"
+        f"{f'     {mom_1m:+.1f}%' if mom_1m is not None else ''}"
+        f"{f'     {mom_1y:+.1f}%' if mom_1y is not None else ''}"
+    )
     lines.append("")
 
     # Top holdings with performance
@@ -54,26 +55,21 @@ def format_sector(data: dict[str, Any]) -> str:
             mom_1m = h.get("momentum_1m")
             mom_1y = h.get("momentum_1y")
 
-            # Truncate name to fit
-            name = h["name"][:16]
-
-            # Build line with performance data
-            line = f"{name:16} {symbol:8}  {weight_pct:5.1f}%"
-            if change_pct is not None:
-                line += f"   {change_pct:+6.2f}%"
-            else:
-                line += "         "
-            if mom_1m is not None:
-                line += f"     {mom_1m:+.1f}%"
-            else:
-                line += "         "
-            if mom_1y is not None:
-                line += f"     {mom_1y:+.1f}%"
-
-            lines.append(line)
+            # One f-string per row (name truncated to fit, missing cells padded)
+            lines.append(
+                f"{h['name']:16.16} {symbol:8}  {weight_pct:5.1f}%"
+                f"{f'   {change_pct:+6.2f}%' if change_pct is not None else _PAD9}"
+                f"{f'     {mom_1m:+.1f}%' if mom_1m is not None else _PAD9}"
+                f"{f'     {mom_1y:+.1f}%' if mom_1y is not None else ''}"
+            )
         lines.append("")
 
     # Footer
-    lines.append(f"Data as of {date_str} {time_str} | Source: yfinance")
+    # Timestamp from datetime fields (no strftime format parsing)
+    now = datetime.now(_NY_TZ)
+    lines.append(
+        f"Data as of {now.year:04d}-{now.month:02d}-{now.day:02d} "
+        f"{now.hour:02d}:{now.minute:02d} {now.tzname()} | Source: yfinance"
+    )
 
     return "\n".join(lines)
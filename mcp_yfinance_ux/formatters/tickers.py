@@ -5,24 +5,212 @@ Formats ticker screens with factor exposures, valuation, technicals.
 """
 
 import math
-from datetime import datetime
-from typing import Any, TypeGuard
+import re
+import time
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Any, NamedTuple, TypeGuard
 from zoneinfo import ZoneInfo
 
+import pandas as pd
+
 from yfinance_ux.common.constants import (
     BETA_HIGH_THRESHOLD,
     BETA_LOW_THRESHOLD,
+    CONSENSUS_BEARISH_PCT,
+    CONSENSUS_BULLISH_PCT,
+    EARNINGS_MISS_THRESHOLD,
     IDIO_VOL_HIGH_THRESHOLD,
     IDIO_VOL_LOW_THRESHOLD,
+    IV_RANK_CHEAP_THRESHOLD,
+    IV_RANK_EXPENSIVE_THRESHOLD,
+    PC_RATIO_BEARISH_THRESHOLD,
+    PC_RATIO_BULLISH_THRESHOLD,
     RSI_OVERBOUGHT,
     RSI_OVERSOLD,
+    SHORT_PCT_HIGH_THRESHOLD,
+    SHORT_PCT_MODERATE_THRESHOLD,
     UNUSUAL_VOLUME_THRESHOLD,
+    VOL_MOMENTUM_TREND_THRESHOLD,
+)
+
+# US market timezone and calendar date format (built once at import)
+_NY_TZ = ZoneInfo("America/New_York")
+_CAL_FMT = "%b %d, %Y"  # Calendar dates (earnings, dividends)
+
+# _now_strings() memo, [(monotonic time, date_str, time_str)]: ticker footers rendered
+# within _NOW_STRINGS_TTL_SECONDS of each other share one clock read and formatting
+_NOW_STRINGS_TTL_SECONDS = 1.0
+_now_strings_memo: list[tuple[float, str, str]] = []
+
+# First word of an insider transaction's Text (e.g. "Sale" in "Sale at price ...")
+_FIRST_WORD_RE = re.compile(r"\S+")
+
+# Signal labels, indexed as (below, between, above) the thresholds - see _band()
+_PC_RATIO_LABELS = ("BULLISH", "NEUTRAL", "BEARISH")
+_IV_RANK_LABELS = (" (CHEAP)", "", " (EXPENSIVE)")
+_VOL_MOMENTUM_LABELS = ("  (cooling off)", "", "  (heating up)")
+_BETA_LABELS = ("(Low sensitivity)", "", "(High sensitivity)")
+_IDIO_VOL_LABELS = ("(Low stock-specific risk)", "", "(High stock-specific risk)")
+_RSI_LABELS = ("(Oversold)", "", "(Overbought)")
+_SURPRISE_LABELS = ("✗", "≈", "✓")
+_CONSENSUS_LABELS = ("BEARISH", "NEUTRAL", "BULLISH")
+_SHORT_LABELS = ("", "(Moderate short interest)", "(High squeeze risk)")  # by tiers crossed
+
+# Blank cells for the batch comparison table
+_PAD6 = " " * 6
+_PAD7 = " " * 7
+_PAD8 = " " * 8
+_PAD10 = " " * 10
+
+# Section title, column header and rule of each format_ticker table, one
+# multi-line entry in the output lines list (joins to the same text)
+_INSIDER_TABLE_HEAD = "\n".join((
+    "INSIDER TRANSACTIONS (RECENT 10)",
+    f"{'DATE':<12} {'INSIDER':<20} {'POSITION':<20} {'TYPE':<10} {'SHARES':>12} {'VALUE':>15}",
+    "-" * 100,
+))
+_EARNINGS_TABLE_HEAD = "\n".join((
+    "EARNINGS HISTORY (LAST 4 QUARTERS)",
+    f"{'QUARTER':<12} {'ACTUAL':>8} {'ESTIMATE':>8} {'SURPRISE':>10} {'%':>8}",
+    "-" * 60,
+))
+_UPGRADES_TABLE_HEAD = "\n".join((
+    "RECENT ANALYST ACTIONS (LAST 10)",
+    f"{'DATE':<12} {'FIRM':<20} {'ACTION':<15} {'TARGET':>10}",
+    "-" * 70,
+))
+
+# Batch comparison table header and its underline (same every render)
+_BATCH_HEADER = (
+    f"{'SYMBOL':8} {'NAME':30} {'PRICE':>10} {'CHG%':>8} {'RVOL':>7} "
+    f"{'BETA':>6} {'IDIO':>6} {'SHORT%':>8} {'MOM1W':>8} {'MOM1M':>8} {'MOM1Y':>8} "
+    f"{'P/E':>8} {'DIV%':>6} {'RSI':>6}"
+)
+_BATCH_RULE = "-" * len(_BATCH_HEADER)
+
+# Batch table numeric columns: (data key, cell format, blank cell), in display order.
+# Missing/non-numeric values get the blank (yfinance sometimes returns 'Infinity' for P/E)
+_BATCH_COLUMNS = (
+    ("price", "{:10.2f}", _PAD10),
+    ("change_percent", "{:+7.2f}%", _PAD8),
+    ("rel_volume", "{:6.2f}x", _PAD7),
+    ("beta_spx", "{:6.2f}", _PAD6),
+    ("idio_vol", "{:5.1f}%", _PAD6),
+    ("short_pct_float", "{:7.1f}%", _PAD8),
+    ("momentum_1w", "{:+7.1f}%", _PAD8),
+    ("momentum_1m", "{:+7.1f}%", _PAD8),
+    ("momentum_1y", "{:+7.1f}%", _PAD8),
+    ("trailing_pe", "{:8.2f}", _PAD8),
+    ("dividend_yield", "{:5.2f}%", _PAD6),
+    ("rsi", "{:6.1f}", _PAD6),
+)
+_BATCH_NUMERIC_KEYS = tuple(key for key, _, _ in _BATCH_COLUMNS)
+_BATCH_CELLS = tuple((fmt.format, blank) for _, fmt, blank in _BATCH_COLUMNS)
+_SHORT_PCT_COLUMN = _BATCH_NUMERIC_KEYS.index("short_pct_float")
+_batch_numbers = itemgetter(*_BATCH_NUMERIC_KEYS)
+
+# Canonical NaN for batch memo keys (tuple equality matches it by identity)
+_NAN = float("nan")
+
+# Exact types is_numeric() rejects without an isinstance() check (None, 'N/A', flags, tables)
+_NON_NUMERIC_TYPES = frozenset({type(None), str, bool, dict, list})
+
+# 52-week range bars, one per fill level (only _RANGE_BAR_WIDTH + 1 distinct bars)
+_RANGE_BAR_WIDTH = 20
+_RANGE_BARS = tuple(
+    "=" * filled + "░" * (_RANGE_BAR_WIDTH - filled) for filled in range(_RANGE_BAR_WIDTH + 1)
 )
 
 
+class _TickerView(NamedTuple):
+    """Fields format_ticker reads, pulled from the data dict in one pass
+
+    Field names are the data keys, so _fields doubles as the key list.
+    """
+
+    price: Any
+    change: Any
+    change_percent: Any
+    market_cap: Any
+    volume: Any
+    rel_volume: Any
+    vol_momentum_1w: Any
+    beta_spx: Any
+    idio_vol: Any
+    total_vol: Any
+    short_pct_float: Any
+    short_ratio: Any
+    trailing_pe: Any
+    forward_pe: Any
+    dividend_yield: Any
+    calendar: Any
+    momentum_1w: Any
+    momentum_1m: Any
+    momentum_1y: Any
+    fifty_day_avg: Any
+    two_hundred_day_avg: Any
+    rsi: Any
+    fifty_two_week_high: Any
+    fifty_two_week_low: Any
+    options_data: Any
+    insider_transactions: Any
+    analyst_recommendations: Any
+    analyst_price_targets: Any
+    earnings_history: Any
+    recent_upgrades: Any
+
+
 def is_numeric(value: object) -> TypeGuard[int | float]:
     """Check if value is a valid number (not None, not string like 'N/A')."""
-    return isinstance(value, (int, float)) and not isinstance(value, bool)
+    value_type = type(value)
+    # Fast path: exact int/float (bool is its own type, so never matches here)
+    if value_type is float or value_type is int:
+        return True
+    # Fast reject: missing/placeholder values, skipping the isinstance MRO walk
+    if value_type in _NON_NUMERIC_TYPES:
+        return False
+    # Subclasses such as numpy.float64 from pandas-derived metrics
+    return isinstance(value, (int, float))
+
+
+def _finite_num(value: object) -> TypeGuard[int | float]:
+    """is_numeric() that also rejects NaN and +/-inf (x - x is 0 only for finite x)"""
+    return is_numeric(value) and value - value == 0
+
+
+def _band(value: float, low: float, high: float, labels: tuple[str, str, str]) -> str:
+    """Pick labels[0] if value < low, labels[2] if value > high, else labels[1]
+
+    Index arithmetic instead of an if/elif chain; NaN compares false both ways and
+    lands on the middle label, same as the chain. `+ 1` sits between the two
+    comparisons so numpy bools never meet in a bool - bool subtraction.
+    """
+    return labels[(value > high) + 1 - (value < low)]
+
+
+def _now_strings() -> tuple[str, str]:
+    """Current NY (date_str, time_str), reused for up to a second across renders"""
+    mono = time.monotonic()
+    if _now_strings_memo:
+        cached_at, date_str, time_str = _now_strings_memo[0]
+        if mono - cached_at < _NOW_STRINGS_TTL_SECONDS:
+            return date_str, time_str
+
+    now = datetime.now(_NY_TZ)
+    # From datetime fields - no strftime format parsing; tzname() is what %Z uses
+    date_str = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+    time_str = f"{now.hour:02d}:{now.minute:02d} {now.tzname()}"
+    _now_strings_memo[:] = [(mono, date_str, time_str)]
+    return date_str, time_str
+
+
+@lru_cache(maxsize=256)
+def _cal_date(value: date) -> str:
+    """Calendar date as 'Jan 05, 2025' (memoized - the same few dates recur across tickers)"""
+    return value.strftime(_CAL_FMT)
 
 
 def format_options_summary(data: dict[str, Any], current_price: float | None = None) -> str:
@@ -45,7 +233,9 @@ def format_options_summary(data: dict[str, Any], current_price: float | None = N
     hist_iv_data = data.get("hist_iv_data", {})
 
     # Sentiment
-    sentiment = "BULLISH" if pc_oi < 0.8 else "BEARISH" if pc_oi > 1.2 else "NEUTRAL"  # noqa: PLR2004
+    sentiment = _band(
+        pc_oi, PC_RATIO_BULLISH_THRESHOLD, PC_RATIO_BEARISH_THRESHOLD, _PC_RATIO_LABELS
+    )
 
     lines = [
         "OPTIONS POSITIONING",
@@ -60,11 +250,11 @@ def format_options_summary(data: dict[str, Any], current_price: float | None = N
 
         # Add percentile context
         if is_numeric(iv_rank):
-            percentile_str = f"{int(iv_rank)}th %ile"
-            if iv_rank >= 80:  # noqa: PLR2004
-                percentile_str += " (EXPENSIVE)"
-            elif iv_rank <= 20:  # noqa: PLR2004
-                percentile_str += " (CHEAP)"
+            # Inclusive bounds here (>= expensive, <= cheap), so not _band()
+            iv_tier = (
+                (iv_rank >= IV_RANK_EXPENSIVE_THRESHOLD) + 1 - (iv_rank <= IV_RANK_CHEAP_THRESHOLD)
+            )
+            percentile_str = f"{int(iv_rank)}th %ile{_IV_RANK_LABELS[iv_tier]}"
             lines.append(
                 f"ATM IV:  {atm_call_iv:.1f}% "
                 f"({percentile_str} vs 52-wk: {iv_low:.0f}%-{iv_high:.0f}%)"
@@ -84,8 +274,9 @@ def format_options_summary(data: dict[str, Any], current_price: float | None = N
             lines.append(f"Max Pain:  ${max_pain:.2f}")
 
     # Add unusual activity if present
-    unusual_call_count = len(unusual_calls) if hasattr(unusual_calls, "__len__") else 0
-    unusual_put_count = len(unusual_puts) if hasattr(unusual_puts, "__len__") else 0
+    # Lists or DataFrames (not `or ()` - DataFrame truthiness is ambiguous); None when absent
+    unusual_call_count = len(unusual_calls) if unusual_calls is not None else 0
+    unusual_put_count = len(unusual_puts) if unusual_puts is not None else 0
     total_unusual = unusual_call_count + unusual_put_count
 
     if total_unusual > 0:
@@ -104,40 +295,41 @@ def format_ticker(data: dict[str, Any]) -> str:  # noqa: PLR0912, PLR0915
     if data.get("error"):
         return f"ERROR: {data['error']}"
 
+    is_num = is_numeric  # local alias - called 30+ times per render
+    view = _TickerView._make(map(data.get, _TickerView._fields))
+
     symbol = data["symbol"]
     name = data.get("name", symbol)
-    price = data.get("price")
-    change = data.get("change")
-    change_pct = data.get("change_percent")
-    market_cap = data.get("market_cap")
-    volume = data.get("volume")
-    rel_volume = data.get("rel_volume")
-    vol_momentum_1w = data.get("vol_momentum_1w")
-
-    now = datetime.now(ZoneInfo("America/New_York"))
-    date_str = now.strftime("%Y-%m-%d")
-    time_str = now.strftime("%H:%M %Z")
-
-    lines = []
+    price = view.price
+    change = view.change
+    change_pct = view.change_percent
+    market_cap = view.market_cap
+    volume = view.volume
+    rel_volume = view.rel_volume
+    vol_momentum_1w = view.vol_momentum_1w
+
+    lines: list[str] = []
+    # Bound once - format_ticker emits ~60 lines per render
+    add = lines.append
 
     # Header (simple title for panel)
     header = f"TICKER {symbol}"
-    lines.append(header)
-    lines.append("")  # Blank line after header
+    add(header)
+    add("")  # Blank line after header
 
     # Price info + Company name on second line
     if price is not None and change is not None and change_pct is not None:
-        lines.append(
+        add(
             f"LAST PRICE  {price:.2f} {change:+.2f}  {change_pct:+.2f}%"
         )
-    lines.append("")
+    add("")
 
     # Company name + Market cap
     if market_cap is not None:
         market_cap_b = market_cap / 1e9
-        lines.append(f"{name[:40]:40} MKT CAP  {market_cap_b:6.1f}B")
+        add(f"{name:<40.40} MKT CAP  {market_cap_b:6.1f}B")
     else:
-        lines.append(name[:60])
+        add(f"{name:.60}")
 
     # Volume metrics
     if volume is not None:
@@ -145,243 +337,223 @@ def format_ticker(data: dict[str, Any]) -> str:  # noqa: PLR0912, PLR0915
         vol_line = f"VOLUME   {volume_m:7.1f}M"
 
         # Add relative volume (vs 3mo avg)
-        if rel_volume is not None and is_numeric(rel_volume):
+        if is_num(rel_volume):
             vol_line += f"  ({rel_volume:.2f}x 3mo)"
             # Flag unusual volume
             if rel_volume > UNUSUAL_VOLUME_THRESHOLD:
                 vol_line += " ⚠"
 
         # Add volume momentum (1W trend)
-        if vol_momentum_1w is not None and is_numeric(vol_momentum_1w):
+        if is_num(vol_momentum_1w):
             vol_line += f"  {vol_momentum_1w:+.0f}% 1W"
 
             # Add annotation for significant trends
-            if vol_momentum_1w > 20:  # noqa: PLR2004
-                vol_line += "  (heating up)"
-            elif vol_momentum_1w < -20:  # noqa: PLR2004
-                vol_line += "  (cooling off)"
+            vol_line += _band(
+                vol_momentum_1w,
+                -VOL_MOMENTUM_TREND_THRESHOLD,
+                VOL_MOMENTUM_TREND_THRESHOLD,
+                _VOL_MOMENTUM_LABELS,
+            )
 
-        lines.append(vol_line)
+        add(vol_line)
 
-    lines.append("")
+    add("")
 
     # Factor Exposures
-    lines.append("FACTOR EXPOSURES")
-    beta_spx = data.get("beta_spx")
-    if is_numeric(beta_spx):
-        sensitivity = ""
-        if beta_spx > BETA_HIGH_THRESHOLD:
-            sensitivity = "(High sensitivity)"
-        elif beta_spx < BETA_LOW_THRESHOLD:
-            sensitivity = "(Low sensitivity)"
-        lines.append(f"Beta (SPX)       {beta_spx:4.2f}    {sensitivity}")
-
-    idio_vol = data.get("idio_vol")
-    total_vol = data.get("total_vol")
-    if is_numeric(idio_vol):
-        risk_level = ""
-        if idio_vol > IDIO_VOL_HIGH_THRESHOLD:
-            risk_level = "(High stock-specific risk)"
-        elif idio_vol < IDIO_VOL_LOW_THRESHOLD:
-            risk_level = "(Low stock-specific risk)"
-        lines.append(f"Idio Vol         {idio_vol:4.1f}%   {risk_level}")
-    if is_numeric(total_vol):
-        lines.append(f"Total Vol        {total_vol:4.1f}%")
+    add("FACTOR EXPOSURES")
+    beta_spx = view.beta_spx
+    if is_num(beta_spx):
+        sensitivity = _band(beta_spx, BETA_LOW_THRESHOLD, BETA_HIGH_THRESHOLD, _BETA_LABELS)
+        add(f"Beta (SPX)       {beta_spx:4.2f}    {sensitivity}")
+
+    idio_vol = view.idio_vol
+    total_vol = view.total_vol
+    if is_num(idio_vol):
+        risk_level = _band(
+            idio_vol, IDIO_VOL_LOW_THRESHOLD, IDIO_VOL_HIGH_THRESHOLD, _IDIO_VOL_LABELS
+        )
+        add(f"Idio Vol         {idio_vol:4.1f}%   {risk_level}")
+    if is_num(total_vol):
+        add(f"Total Vol        {total_vol:4.1f}%")
 
     # Short Interest (positioning risk)
-    short_pct_float = data.get("short_pct_float")
-    short_ratio = data.get("short_ratio")
-    if is_numeric(short_pct_float) or is_numeric(short_ratio):
-        if is_numeric(short_pct_float):
-            # Convert from decimal to percentage if needed
-            short_pct = short_pct_float * 100 if short_pct_float < 1 else short_pct_float
-            squeeze_signal = ""
-            if short_pct > 20:  # noqa: PLR2004
-                squeeze_signal = "(High squeeze risk)"
-            elif short_pct > 10:  # noqa: PLR2004
-                squeeze_signal = "(Moderate short interest)"
-            lines.append(f"Short % Float    {short_pct:4.1f}%   {squeeze_signal}")
-        if is_numeric(short_ratio):
-            lines.append(f"Days to Cover    {short_ratio:4.1f}")
-
-    lines.append("")
-
-    # Valuation
-    has_valuation = False
-    trailing_pe = data.get("trailing_pe")
-    forward_pe = data.get("forward_pe")
-    dividend_yield = data.get("dividend_yield")
-
-    if any(is_numeric(x) for x in [trailing_pe, forward_pe, dividend_yield]):
-        lines.append("VALUATION")
-        has_valuation = True
-
-    if is_numeric(trailing_pe):
-        lines.append(f"P/E Ratio        {trailing_pe:6.2f}")
-    if is_numeric(forward_pe):
-        lines.append(f"Forward P/E      {forward_pe:6.2f}")
-    if is_numeric(dividend_yield):
-        lines.append(f"Dividend Yield   {dividend_yield:5.2f}%")
-
-    if has_valuation:
-        lines.append("")
+    short_pct_float = view.short_pct_float
+    short_ratio = view.short_ratio
+    # No sub-header, so each row only needs its own check
+    if is_num(short_pct_float):
+        # Convert from decimal to percentage if needed
+        short_pct = short_pct_float * 100 if short_pct_float < 1 else short_pct_float
+        squeeze_signal = _SHORT_LABELS[
+            (short_pct > SHORT_PCT_MODERATE_THRESHOLD) + (short_pct > SHORT_PCT_HIGH_THRESHOLD)
+        ]
+        add(f"Short % Float    {short_pct:4.1f}%   {squeeze_signal}")
+    if is_num(short_ratio):
+        add(f"Days to Cover    {short_ratio:4.1f}")
+
+    add("")
+
+    # Valuation (numeric checks done once, reused for the header and each row)
+    trailing_pe = view.trailing_pe
+    forward_pe = view.forward_pe
+    dividend_yield = view.dividend_yield
+    tp_ok, fp_ok, dy_ok = is_num(trailing_pe), is_num(forward_pe), is_num(dividend_yield)
+
+    if tp_ok or fp_ok or dy_ok:
+        add("VALUATION")
+        if tp_ok:
+            add(f"P/E Ratio        {trailing_pe:6.2f}")
+        if fp_ok:
+            add(f"Forward P/E      {forward_pe:6.2f}")
+        if dy_ok:
+            add(f"Dividend Yield   {dividend_yield:5.2f}%")
+        add("")
 
     # Earnings and dividend calendar section
-    calendar = data.get("calendar")
-    has_calendar = False
+    calendar = view.calendar
     if calendar:
         earnings_date = calendar.get("Earnings Date")
-        earnings_avg = calendar.get("Earnings Average")
         div_date = calendar.get("Dividend Date")
         ex_div_date = calendar.get("Ex-Dividend Date")
 
         if earnings_date or div_date or ex_div_date:
-            lines.append("CALENDAR")
-            has_calendar = True
+            add("CALENDAR")
 
-        if earnings_date and isinstance(earnings_date, list) and earnings_date:
-            cal_date_str = earnings_date[0].strftime("%b %d, %Y")
-            line = f"Earnings         {cal_date_str}"
-            if is_numeric(earnings_avg):
-                line += f"  (Est ${earnings_avg:.2f} EPS)"
-            lines.append(line)
+            if earnings_date and isinstance(earnings_date, list):
+                cal_date_str = _cal_date(earnings_date[0])
+                line = f"Earnings         {cal_date_str}"
+                earnings_avg = calendar.get("Earnings Average")
+                if is_num(earnings_avg):
+                    line += f"  (Est ${earnings_avg:.2f} EPS)"
+                add(line)
 
-        if ex_div_date:
-            cal_date_str = ex_div_date.strftime("%b %d, %Y")
-            lines.append(f"Ex-Dividend      {cal_date_str}")
+            if ex_div_date:
+                cal_date_str = _cal_date(ex_div_date)
+                add(f"Ex-Dividend      {cal_date_str}")
 
-        if div_date:
-            cal_date_str = div_date.strftime("%b %d, %Y")
-            lines.append(f"Div Payment      {cal_date_str}")
+            if div_date:
+                cal_date_str = _cal_date(div_date)
+                add(f"Div Payment      {cal_date_str}")
 
-    if has_calendar:
-        lines.append("")
+            add("")
 
     # Momentum & Technicals
-    lines.append("MOMENTUM & TECHNICALS")
-    mom_1w = data.get("momentum_1w")
-    mom_1m = data.get("momentum_1m")
-    mom_1y = data.get("momentum_1y")
-    if is_numeric(mom_1w):
-        lines.append(f"1-Week           {mom_1w:+6.1f}%")
-    if is_numeric(mom_1m):
-        lines.append(f"1-Month          {mom_1m:+6.1f}%")
-    if is_numeric(mom_1y):
-        lines.append(f"1-Year           {mom_1y:+6.1f}%")
-
-    fifty_day = data.get("fifty_day_avg")
-    two_hundred_day = data.get("two_hundred_day_avg")
-    if is_numeric(fifty_day):
-        lines.append(f"50-Day MA        {fifty_day:7.2f}")
-    if is_numeric(two_hundred_day):
-        lines.append(f"200-Day MA       {two_hundred_day:7.2f}")
-
-    rsi = data.get("rsi")
-    if is_numeric(rsi):
-        rsi_signal = ""
-        if rsi > RSI_OVERBOUGHT:
-            rsi_signal = "(Overbought)"
-        elif rsi < RSI_OVERSOLD:
-            rsi_signal = "(Oversold)"
-        lines.append(f"RSI (14D)        {rsi:5.1f}    {rsi_signal}")
-    lines.append("")
+    add("MOMENTUM & TECHNICALS")
+    mom_1w = view.momentum_1w
+    mom_1m = view.momentum_1m
+    mom_1y = view.momentum_1y
+    if is_num(mom_1w):
+        add(f"1-Week           {mom_1w:+6.1f}%")
+    if is_num(mom_1m):
+        add(f"1-Month          {mom_1m:+6.1f}%")
+    if is_num(mom_1y):
+        add(f"1-Year           {mom_1y:+6.1f}%")
+
+    fifty_day = view.fifty_day_avg
+    two_hundred_day = view.two_hundred_day_avg
+    if is_num(fifty_day):
+        add(f"50-Day MA        {fifty_day:7.2f}")
+    if is_num(two_hundred_day):
+        add(f"200-Day MA       {two_hundred_day:7.2f}")
+
+    rsi = view.rsi
+    if is_num(rsi):
+        rsi_signal = _band(rsi, RSI_OVERSOLD, RSI_OVERBOUGHT, _RSI_LABELS)
+        add(f"RSI (14D)        {rsi:5.1f}    {rsi_signal}")
+    add("")
 
     # 52-Week Range with visual bar
-    fifty_two_high = data.get("fifty_two_week_high")
-    fifty_two_low = data.get("fifty_two_week_low")
+    fifty_two_high = view.fifty_two_week_high
+    fifty_two_low = view.fifty_two_week_low
 
-    if is_numeric(fifty_two_high) and is_numeric(fifty_two_low) and is_numeric(price):
-        lines.append("52-WEEK RANGE")
-        lines.append(f"High             {fifty_two_high:7.2f}")
-        lines.append(f"Low              {fifty_two_low:7.2f}")
+    if is_num(fifty_two_high) and is_num(fifty_two_low) and is_num(price):
+        add("52-WEEK RANGE")
+        add(f"High             {fifty_two_high:7.2f}")
+        add(f"Low              {fifty_two_low:7.2f}")
 
         # Visual bar showing position in range
         range_width = fifty_two_high - fifty_two_low
         if range_width > 0:
             range_pct = ((price - fifty_two_low) / range_width) * 100
-            bar_width = 20
-            filled = int((range_pct / 100) * bar_width)
-            bar = "=" * filled + "░" * (bar_width - filled)
-            lines.append(f"Current          {price:7.2f}  [{bar}]  {range_pct:.0f}% of range")
+            # Clamp: live price can sit outside the trailing 52-week high/low
+            filled = max(0, min(_RANGE_BAR_WIDTH, int((range_pct / 100) * _RANGE_BAR_WIDTH)))
+            bar = _RANGE_BARS[filled]
+            add(f"Current          {price:7.2f}  [{bar}]  {range_pct:.0f}% of range")
         else:
             # Same high and low (no range)
-            lines.append(f"Current          {price:7.2f}  [flat - no range]")
-        lines.append("")
+            add(f"Current          {price:7.2f}  [flat - no range]")
+        add("")
 
     # Options Positioning (brief summary)
-    options_data = data.get("options_data")
+    options_data = view.options_data
     if options_data and not options_data.get("error"):
         # Format brief summary for ticker overview
         options_summary = format_options_summary(options_data, price)
-        lines.append(options_summary)
-        lines.append("")
+        add(options_summary)
+        add("")
 
     # Insider Transactions
-    insider_transactions = data.get("insider_transactions")
+    insider_transactions = view.insider_transactions
     if insider_transactions:
-        lines.append("INSIDER TRANSACTIONS (RECENT 10)")
-        # Header row
-        header = (
-            f"{'DATE':<12} {'INSIDER':<20} {'POSITION':<20} "
-            f"{'TYPE':<10} {'SHARES':>12} {'VALUE':>15}"
-        )
-        lines.append(header)
-        lines.append("-" * 100)
+        add(_INSIDER_TABLE_HEAD)
 
         # Get current price for value estimation
-        current_price = data.get("price")
+        current_price = view.price
 
-        for txn in insider_transactions[:10]:
+        for txn in islice(insider_transactions, 10):
+            get = txn.get  # bound once per row
             # Parse date
-            date_val = txn.get("Start Date")
-            if date_val:
+            date_val = get("Start Date")
+            if date_val and date_val is not pd.NaT:  # NaT is a truthy datetime
                 try:
-                    if hasattr(date_val, "strftime"):
-                        date_str_txn = date_val.strftime("%Y-%m-%d")
+                    if isinstance(date_val, date):
+                        # ISO date via isoformat (C fast path, no format parsing)
+                        date_str_txn = date_val.isoformat()[:10]
                     else:
-                        date_str_txn = str(date_val)[:10]
+                        date_str_txn = f"{date_val!s:.10}"
                 except Exception:
                     date_str_txn = "N/A"
             else:
                 date_str_txn = "N/A"
 
             # Get fields
-            insider = str(txn.get("Insider", "Unknown"))[:20]
-            position = str(txn.get("Position", "N/A"))[:20]
-            shares = txn.get("Shares")
+            insider = get("Insider", "Unknown")
+            position = get("Position", "N/A")
+            shares = get("Shares")
 
             # Parse transaction type from Text field (e.g., "Sale at price...")
-            text = txn.get("Text", "")
+            text = get("Text", "")
             # Extract transaction type (Sale, Purchase, Gift, Grant, Award, etc.)
-            if text and text.startswith("Stock Gift"):
-                transaction = "Gift"
-            elif text and "Award" in text:
-                transaction = "Award"
-            elif text and "Grant" in text:
-                transaction = "Grant"
-            elif text:
-                # Extract first word for other types
-                transaction = text.split()[0] if text.split() else "Unknown"
+            # Order matters: "Award"/"Grant" anywhere in Text beat the first word
+            if text:
+                if text.startswith("Stock Gift"):
+                    transaction = "Gift"
+                elif "Award" in text:
+                    transaction = "Award"
+                elif "Grant" in text:
+                    transaction = "Grant"
+                else:
+                    # Extract first word for other types (no split() list per row)
+                    first_word = _FIRST_WORD_RE.search(text)
+                    transaction = first_word.group() if first_word else "Unknown"
             # Text is empty - infer from shares direction
             # Positive shares = acquisition, negative = disposition
-            elif is_numeric(shares) and shares > 0:
+            elif is_num(shares) and shares > 0:
                 transaction = "Acquire"
-            elif is_numeric(shares) and shares < 0:
+            elif is_num(shares) and shares < 0:
                 transaction = "Dispose"
             else:
                 transaction = "Unknown"
-            transaction = transaction[:10]  # Truncate to fit column
 
-            value = txn.get("Value")
+            value = get("Value")
 
             # Format shares and value
-            shares_str = f"{int(shares):,}" if is_numeric(shares) else "N/A"
+            shares_str = f"{int(shares):,}" if is_num(shares) else "N/A"
 
             # Calculate value if missing: use shares x current price
-            if is_numeric(value) and not math.isnan(value) and value > 0:
+            if _finite_num(value) and value > 0:
                 # Have actual value
                 value_str = f"${value:,.0f}"
-            elif is_numeric(shares) and is_numeric(current_price):
+            elif is_num(shares) and is_num(current_price):
                 # Estimate value from shares x current price
                 estimated_value = shares * current_price
                 value_str = f"~${estimated_value:,.0f}"
@@ -390,17 +562,17 @@ def format_ticker(data: dict[str, Any]) -> str:  # noqa: PLR0912, PLR0915
 
             # Data row
             row = (
-                f"{date_str_txn:<12} {insider:<20} {position:<20} "
-                f"{transaction:<10} {shares_str:>12} {value_str:>15}"
+                f"{date_str_txn:<12} {insider!s:<20.20} {position!s:<20.20} "
+                f"{transaction:<10.10} {shares_str:>12} {value_str:>15}"
             )
-            lines.append(row)
+            add(row)
 
-        lines.append("")
+        add("")
 
     # Analyst Recommendations
-    analyst_recs = data.get("analyst_recommendations")
+    analyst_recs = view.analyst_recommendations
     if analyst_recs:
-        lines.append("ANALYST RECOMMENDATIONS")
+        add("ANALYST RECOMMENDATIONS")
         strong_buy = analyst_recs.get("strongBuy", 0)
         buy = analyst_recs.get("buy", 0)
         hold = analyst_recs.get("hold", 0)
@@ -408,201 +580,197 @@ def format_ticker(data: dict[str, Any]) -> str:  # noqa: PLR0912, PLR0915
         strong_sell = analyst_recs.get("strongSell", 0)
         total = strong_buy + buy + hold + sell + strong_sell
 
-        lines.append(
+        add(
             f"Strong Buy: {strong_buy}  |  Buy: {buy}  |  Hold: {hold}  |  "
             f"Sell: {sell}  |  Strong Sell: {strong_sell}"
         )
         if total > 0:
             bullish_pct = ((strong_buy + buy) / total) * 100
             bearish_pct = ((sell + strong_sell) / total) * 100
-            sentiment = (
-                "BULLISH" if bullish_pct > 60  # noqa: PLR2004
-                else "BEARISH" if bearish_pct > 40  # noqa: PLR2004
-                else "NEUTRAL"
-            )
-            lines.append(
+            # Mutually exclusive (bullish + bearish <= 100), so one index covers both
+            sentiment = _CONSENSUS_LABELS[
+                (bullish_pct > CONSENSUS_BULLISH_PCT) + 1 - (bearish_pct > CONSENSUS_BEARISH_PCT)
+            ]
+            add(
                 f"Consensus: {sentiment}  "
                 f"({bullish_pct:.0f}% bullish, {bearish_pct:.0f}% bearish)"
             )
-        lines.append("")
+        add("")
 
     # Analyst Price Targets
-    price_targets = data.get("analyst_price_targets")
+    price_targets = view.analyst_price_targets
     if price_targets and isinstance(price_targets, dict):
-        lines.append("ANALYST PRICE TARGETS")
-        current = price_targets.get("current")
-        mean = price_targets.get("mean")
-        median = price_targets.get("median")
-        low = price_targets.get("low")
-        high = price_targets.get("high")
+        add("ANALYST PRICE TARGETS")
+        # Zero or non-finite (NaN/inf) targets are treated as missing
+        get = price_targets.get
+        current, mean, median, low, high = (
+            value if _finite_num(value) and value else None
+            for value in (get("current"), get("mean"), get("median"), get("low"), get("high"))
+        )
 
         if mean and median:
-            lines.append(f"Mean Target:   ${mean:.2f}")
-            lines.append(f"Median Target: ${median:.2f}")
+            add(f"Mean Target:   ${mean:.2f}")
+            add(f"Median Target: ${median:.2f}")
         if low and high:
-            lines.append(f"Range:         ${low:.2f} - ${high:.2f}")
+            add(f"Range:         ${low:.2f} - ${high:.2f}")
         if current and mean:
             upside = ((mean - current) / current) * 100
             upside_str = f"+{upside:.1f}%" if upside > 0 else f"{upside:.1f}%"
-            lines.append(f"Upside:        {upside_str} to mean target")
-        lines.append("")
+            add(f"Upside:        {upside_str} to mean target")
+        add("")
 
     # Earnings History
-    earnings_hist = data.get("earnings_history")
+    earnings_hist = view.earnings_history
     if earnings_hist:
-        lines.append("EARNINGS HISTORY (LAST 4 QUARTERS)")
-        lines.append(
-            f"{'QUARTER':<12} {'ACTUAL':>8} {'ESTIMATE':>8} "
-            f"{'SURPRISE':>10} {'%':>8}"
-        )
-        lines.append("-" * 60)
+        add(_EARNINGS_TABLE_HEAD)
 
         for earning in earnings_hist:
-            quarter_name = earning.get("quarter", "")
-            if hasattr(quarter_name, "strftime"):
+            get = earning.get  # bound once per row
+            quarter_name = get("quarter", "")
+            if isinstance(quarter_name, date):
                 # Format as YYYY-MM (e.g., 2024-12 for Q4)
-                quarter_str = quarter_name.strftime("%Y-%m")
+                quarter_str = f"{quarter_name.year:04d}-{quarter_name.month:02d}"
             else:
-                quarter_str = str(quarter_name)[:10]
+                quarter_str = str(quarter_name)
 
-            actual = earning.get("epsActual")
-            estimate = earning.get("epsEstimate")
-            surprise_pct = earning.get("surprisePercent")
+            actual = get("epsActual")
+            estimate = get("epsEstimate")
+            surprise_pct = get("surprisePercent")
 
-            actual_str = f"${actual:.2f}" if is_numeric(actual) else "N/A"
-            estimate_str = f"${estimate:.2f}" if is_numeric(estimate) else "N/A"
+            actual_str = f"${actual:.2f}" if _finite_num(actual) else "N/A"
+            estimate_str = f"${estimate:.2f}" if _finite_num(estimate) else "N/A"
 
-            if is_numeric(surprise_pct):
+            if _finite_num(surprise_pct):
                 surprise_val = surprise_pct * 100
                 surprise_str = f"{surprise_val:+.1f}%"
                 # Beat/miss indicator
-                indicator = "✓" if surprise_val > 0 else "✗" if surprise_val < -2 else "≈"  # noqa: PLR2004
+                indicator = _band(surprise_val, EARNINGS_MISS_THRESHOLD, 0, _SURPRISE_LABELS)
             else:
                 surprise_str = "N/A"
                 indicator = ""
 
-            lines.append(
-                f"{quarter_str:<12} {actual_str:>8} {estimate_str:>8} "
+            add(
+                f"{quarter_str:<12.10} {actual_str:>8} {estimate_str:>8} "
                 f"{indicator:>10} {surprise_str:>8}"
             )
-        lines.append("")
+        add("")
 
     # Recent Upgrades/Downgrades
-    recent_upgrades = data.get("recent_upgrades")
+    recent_upgrades = view.recent_upgrades
     if recent_upgrades:
-        lines.append("RECENT ANALYST ACTIONS (LAST 10)")
-        lines.append(f"{'DATE':<12} {'FIRM':<20} {'ACTION':<15} {'TARGET':>10}")
-        lines.append("-" * 70)
-
-        for upgrade in recent_upgrades[:10]:
-            date_val = upgrade.get("GradeDate")
-            if hasattr(date_val, "strftime"):
-                date_str_upg = date_val.strftime("%Y-%m-%d")
+        add(_UPGRADES_TABLE_HEAD)
+
+        for upgrade in islice(recent_upgrades, 10):
+            get = upgrade.get  # bound once per row
+            date_val = get("GradeDate")
+            if not date_val or date_val is pd.NaT:  # NaT is a truthy datetime
+                date_str_upg = "N/A"
+            elif isinstance(date_val, date):
+                date_str_upg = date_val.isoformat()[:10]
             else:
-                date_str_upg = str(date_val)[:10] if date_val else "N/A"
+                date_str_upg = f"{date_val!s:.10}"
 
-            firm = str(upgrade.get("Firm", ""))[:20]
-            to_grade = upgrade.get("ToGrade", "")
-            from_grade = upgrade.get("FromGrade", "")
+            firm = get("Firm", "")
+            to_grade = get("ToGrade", "")
+            from_grade = get("FromGrade", "")
 
             # Build action string
             if from_grade and from_grade != to_grade:
-                action_str = f"{from_grade} → {to_grade}"[:15]
+                action_str = f"{from_grade} → {to_grade}"
             else:
-                action_str = to_grade[:15]
+                action_str = to_grade
 
-            target = upgrade.get("currentPriceTarget")
-            target_str = f"${target:.0f}" if is_numeric(target) else "N/A"
+            target = get("currentPriceTarget")
+            target_str = f"${target:.0f}" if is_num(target) else "N/A"
 
-            lines.append(
-                f"{date_str_upg:<12} {firm:<20} {action_str:<15} {target_str:>10}"
+            add(
+                f"{date_str_upg:<12} {firm!s:<20.20} {action_str:<15.15} {target_str:>10}"
             )
-        lines.append("")
+        add("")
 
     # Footer
-    lines.append("")
-    lines.append(f"Data as of {date_str} {time_str} | Source: yfinance")
+    add("")
+    date_str, time_str = _now_strings()
+    add(f"Data as of {date_str} {time_str} | Source: yfinance")
 
     return "\n".join(lines)
 
 
-def format_ticker_batch(data_list: list[dict[str, Any]]) -> str:  # noqa: PLR0915
+def _cell_key(value: object) -> tuple[type, object]:
+    """(type, value) memo key of a batch cell, every NaN mapped to one shared NaN
+
+    NaN != NaN, so distinct NaN objects would never hit the memo; any NaN renders
+    the same, so they can share one key.
+    """
+    if isinstance(value, float) and math.isnan(value):
+        return type(value), _NAN
+    return type(value), value
+
+
+@lru_cache(maxsize=1024)
+def _batch_row(symbol: str, name: str, typed: tuple[tuple[type, object], ...]) -> str:
+    """One batch table row, memoized on symbol, name and the (type, value) numeric cells
+
+    Any changed value (e.g. a new price) is a different key, so stale rows are never served.
+    The type is part of each cell's key: True, 1 and 1.0 compare equal, but
+    is_numeric() rejects bool.
+    """
+    is_num = is_numeric  # local alias - called 12x per row
+
+    # Convert short % from decimal to percentage
+    values = [value for _, value in typed]
+    short_pct = values[_SHORT_PCT_COLUMN]
+    if is_num(short_pct) and short_pct < 1:
+        values[_SHORT_PCT_COLUMN] = short_pct * 100
+
+    cells = " ".join([
+        fmt(value) if is_num(value) else blank
+        for value, (fmt, blank) in zip(values, _BATCH_CELLS, strict=True)
+    ])
+    return f"{symbol:8.8} {name:30.30} {cells}"
+
+
+def format_ticker_batch(data_list: list[dict[str, Any]]) -> str:
     """Format batch ticker comparison - side-by-side comparison table"""
     if not data_list:
         return "ERROR: No ticker data provided"
 
-    now = datetime.now(ZoneInfo("America/New_York"))
-    date_str = now.strftime("%Y-%m-%d")
-    time_str = now.strftime("%H:%M %Z")
+    date_str, time_str = _now_strings()
 
     # Extract symbols for header
     symbols = [data.get("symbol", "???") for data in data_list]
     symbols_str = ", ".join(symbols)
 
-    lines = []
-    lines.append(f"TICKERS {symbols_str}")
-    lines.append("")
+    lines: list[str] = []
+    add = lines.append
+    add(f"TICKERS {symbols_str}")
+    add("")
 
-    # Header
-    header = (
-        f"{'SYMBOL':8} {'NAME':30} {'PRICE':>10} {'CHG%':>8} {'RVOL':>7} "
-        f"{'BETA':>6} {'IDIO':>6} {'SHORT%':>8} {'MOM1W':>8} {'MOM1M':>8} {'MOM1Y':>8} "
-        f"{'P/E':>8} {'DIV%':>6} {'RSI':>6}"
-    )
-    lines.append(header)
-    lines.append("-" * len(header))
+    add(_BATCH_HEADER)
+    add(_BATCH_RULE)
 
     # Data rows
     for data in data_list:
         if data.get("error"):
             symbol = data.get("symbol", "???")
-            lines.append(f"{symbol:8} ERROR: {data['error']}")
+            add(f"{symbol:8} ERROR: {data['error']}")
             continue
 
-        symbol = data.get("symbol", "")[:8]
-        name = data.get("name", "")[:30]
-        price = data.get("price")
-        change_pct = data.get("change_percent")
-        rel_volume = data.get("rel_volume")
-        beta_spx = data.get("beta_spx")
-        idio_vol = data.get("idio_vol")
-        short_pct_float = data.get("short_pct_float")
-        mom_1w = data.get("momentum_1w")
-        mom_1m = data.get("momentum_1m")
-        mom_1y = data.get("momentum_1y")
-        trailing_pe = data.get("trailing_pe")
-        div_yield = data.get("dividend_yield")
-        rsi = data.get("rsi")
-
-        # Format each field with proper handling of None and non-numeric values
-        # (yfinance sometimes returns strings like 'Infinity' for P/E)
-        price_str = f"{price:10.2f}" if is_numeric(price) else " " * 10
-        chg_str = f"{change_pct:+7.2f}%" if is_numeric(change_pct) else " " * 8
-        rvol_str = f"{rel_volume:6.2f}x" if is_numeric(rel_volume) else " " * 7
-        beta_str = f"{beta_spx:6.2f}" if is_numeric(beta_spx) else " " * 6
-        idio_str = f"{idio_vol:5.1f}%" if is_numeric(idio_vol) else " " * 6
-        # Convert short % from decimal to percentage
-        if is_numeric(short_pct_float):
-            short_pct = short_pct_float * 100 if short_pct_float < 1 else short_pct_float
-            short_str = f"{short_pct:7.1f}%"
-        else:
-            short_str = " " * 8
-        mom_1w_str = f"{mom_1w:+7.1f}%" if is_numeric(mom_1w) else " " * 8
-        mom_1m_str = f"{mom_1m:+7.1f}%" if is_numeric(mom_1m) else " " * 8
-        mom_1y_str = f"{mom_1y:+7.1f}%" if is_numeric(mom_1y) else " " * 8
-        pe_str = f"{trailing_pe:8.2f}" if is_numeric(trailing_pe) else " " * 8
-        div_str = f"{div_yield:5.2f}%" if is_numeric(div_yield) else " " * 6
-        rsi_str = f"{rsi:6.1f}" if is_numeric(rsi) else " " * 6
-
-        line = (
-            f"{symbol:8} {name:30} {price_str} {chg_str} {rvol_str} "
-            f"{beta_str} {idio_str} {short_str} {mom_1w_str} {mom_1m_str} {mom_1y_str} "
-            f"{pe_str} {div_str} {rsi_str}"
-        )
-        lines.append(line)
-    lines.append("")
+        get = data.get
+        try:
+            numbers = _batch_numbers(data)  # services always fill every key
+        except KeyError:
+            numbers = tuple(map(get, _BATCH_NUMERIC_KEYS))
+        symbol, name = get("symbol", ""), get("name", "")
+        typed = tuple(map(_cell_key, numbers))
+        try:
+            line = _batch_row(symbol, name, typed)
+        except TypeError:  # unhashable value - render without the memo
+            line = _batch_row.__wrapped__(symbol, name, typed)
+        add(line)
+    add("")
 
     # Footer
-    lines.append(f"Data as of {date_str} {time_str} | Source: yfinance")
+    add(f"Data as of {date_str} {time_str} | Source: yfinance")
 
     return "\n".join(lines)
@@ -10,6 +10,8 @@ Architecture:
 - market_data.py handles actual data fetching and formatting
 """
 
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from .market_data import (
@@ -22,9 +24,13 @@ from .market_data import (
     get_options_data,
     get_sector_data,
     get_ticker_screen_data,
-    get_ticker_screen_data_batch,
+    get_ticker_screen_data_batches,
 )
 
+# Symbols per ticker() comparison batch (one batch fills the screen's 8 row workers);
+# larger comparisons fetch batch N+1 while batch N is still in flight
+_TICKER_BATCH_SIZE = 8
+
 
 def normalize_symbols(symbol: str | list[str]) -> list[str]:
     """
@@ -34,14 +40,24 @@ def normalize_symbols(symbol: str | list[str]) -> list[str]:
     - Single string: "TSLA" -> ["TSLA"]
     - Comma-separated string: "TSLA,F,GM" -> ["TSLA", "F", "GM"]
     - List: ["TSLA", "F"] -> ["TSLA", "F"]
+
+    Results are memoized per input (clients repeat the same symbols).
     """
-    if isinstance(symbol, list):
-        return [s.strip().upper() for s in symbol if s.strip()]
+    key = tuple(symbol) if isinstance(symbol, list) else symbol
+    return list(_normalize_symbols_cached(key))
+
+
+@lru_cache(maxsize=512)
+def _normalize_symbols_cached(symbol: str | tuple[str, ...]) -> tuple[str, ...]:
+    """LRU-memoized normalize_symbols (list input arrives as a tuple)"""
+    # Uppercase once, strip per item, drop empties (C-level map/filter, no per-item genexpr)
+    if isinstance(symbol, tuple):
+        return tuple(filter(None, map(str.strip, map(str.upper, symbol))))
 
     # str case - check for comma-separated
     if "," in symbol:
-        return [s.strip().upper() for s in symbol.split(",") if s.strip()]
-    return [symbol.strip().upper()]
+        return tuple(filter(None, map(str.strip, symbol.upper().split(","))))
+    return (symbol.strip().upper(),)
 
 
 def handle_markets() -> str:
@@ -75,7 +91,11 @@ def handle_ticker(arguments: dict[str, Any]) -> str:
 
     if len(symbols) > 1:
         # Batch comparison mode
-        data_list = get_ticker_screen_data_batch(symbols)
+        batches = [
+            symbols[i:i + _TICKER_BATCH_SIZE]
+            for i in range(0, len(symbols), _TICKER_BATCH_SIZE)
+        ]
+        data_list = [row for rows in get_ticker_screen_data_batches(batches) for row in rows]
         return format_ticker_batch(data_list)
 
     # Single ticker mode
@@ -94,6 +114,20 @@ def handle_ticker_options(arguments: dict[str, Any]) -> str:
     return format_options(data)
 
 
+def _handle_markets_tool(arguments: dict[str, Any]) -> str:  # noqa: ARG001
+    """markets() takes no arguments - adapter to the common handler signature"""
+    return handle_markets()
+
+
+# Tool name -> handler, one dict lookup per call
+_TOOL_HANDLERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "markets": _handle_markets_tool,
+    "sector": handle_sector,
+    "ticker": handle_ticker,
+    "ticker_options": handle_ticker_options,
+}
+
+
 def call_tool(name: str, arguments: dict[str, Any]) -> str:
     """
     Route tool call to appropriate handler.
@@ -101,17 +135,8 @@ def call_tool(name: str, arguments: dict[str, Any]) -> str:
     Returns formatted string output.
     Raises ValueError for unknown tools or missing parameters.
     """
-    if name == "markets":
-        return handle_markets()
-
-    if name == "sector":
-        return handle_sector(arguments)
-
-    if name == "ticker":
-        return handle_ticker(arguments)
-
-    if name == "ticker_options":
-        return handle_ticker_options(arguments)
-
-    msg = f"Unknown tool: {name}"
-    raise ValueError(msg)
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        msg = f"Unknown tool: {name}"
+        raise ValueError(msg)
+    return handler(arguments)
@@ -7,51 +7,126 @@ All modules should use get_logger() instead of logging.getLogger() directly.
 import logging
 import logging.handlers
 import sys
+import time
 from pathlib import Path
-from queue import Queue
+from queue import SimpleQueue
+
+# Records held before the log file is written (ERROR and above flush immediately,
+# and the buffer is written out whenever the listener has drained the queue)
+_FILE_BUFFER_RECORDS = 512
+
+
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter that renders the default asctime once per second
+
+    Records within the same second reuse the 'YYYY-MM-DD HH:MM:SS' prefix and only
+    append milliseconds (same text as logging.Formatter). Used from the listener
+    thread only, so the cached stamp needs no lock.
+    """
+
+    def __init__(self, fmt: str) -> None:
+        super().__init__(fmt)
+        self._stamp_second = -1
+        self._stamp = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:  # noqa: N802
+        """asctime for record, strftime only when the second changes"""
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._stamp_second:
+            self._stamp = time.strftime(self.default_time_format, self.converter(second))
+            self._stamp_second = second
+        return f"{self._stamp},{int(record.msecs):03d}"  # default_msec_format
+
+
+class _DrainFlushingMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes once the listener has caught up with the queue
+
+    Buffering only batches writes during bursts: when no records are waiting, the
+    buffer goes to disk at once, so a quiet server's log (make logs) stays current
+    and a hard kill loses at most the burst in progress.
+    """
+
+    def __init__(
+        self, capacity: int, flushLevel: int,  # noqa: N803
+        target: logging.Handler, queue: SimpleQueue[logging.LogRecord],
+    ) -> None:
+        super().__init__(capacity, flushLevel=flushLevel, target=target)
+        self._queue = queue
+
+    def shouldFlush(self, record: logging.LogRecord) -> bool:  # noqa: N802
+        """Flush when full, on flushLevel, or when no more records are queued"""
+        return super().shouldFlush(record) or self._queue.empty()
+
+
+# One formatter shared by the console and file handlers
+_FORMATTER = _SecondCachedFormatter("[%(asctime)s] [%(levelname)s] %(name)s: %(message)s")
 
 
 class AsyncLoggingManager:
     """Manages async logging state without using global variables"""
 
     def __init__(self) -> None:
-        self.log_queue: Queue[logging.LogRecord] = Queue(-1)
+        # Unbounded C-level FIFO (no task/locking bookkeeping per record)
+        self.log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
         self.queue_handler: logging.handlers.QueueHandler | None = None
         self.listener: logging.handlers.QueueListener | None = None
+        self.file_buffer: logging.handlers.MemoryHandler | None = None
+        # Listener-side handlers, closed on shutdown (releases the log file)
+        self.handlers: list[logging.Handler] = []
+        # (log_file, level) of the running setup, None when not running
+        self.config: tuple[Path | None, int] | None = None
 
     def setup(self, log_file: Path | None = None, level: int = logging.INFO) -> None:
         """Set up async logging with QueueHandler and QueueListener
 
-        This should be called once at application startup.
+        This should be called once at application startup. Calling it again with
+        the same arguments is a no-op; different arguments replace the running
+        listener and handlers (shut down first, so no thread or file is leaked).
 
         Args:
             log_file: Optional path to log file. If None, only logs to stderr.
             level: Logging level (default: INFO)
         """
+        config = (log_file, level)
+        if config == self.config:
+            return
+        self.shutdown()
+
+        # Our formats never show thread/process info - skip collecting it per record
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
         # Create handlers that will run in background thread
         handlers: list[logging.Handler] = []
 
         # Console handler (stderr)
         console_handler = logging.StreamHandler(sys.stderr)
-        console_handler.setFormatter(
-            logging.Formatter("[%(asctime)s] [%(levelname)s] %(name)s: %(message)s")
-        )
+        console_handler.setFormatter(_FORMATTER)
         handlers.append(console_handler)
 
         # File handler (if log_file specified)
         if log_file is not None:
             log_file.parent.mkdir(parents=True, exist_ok=True)
             file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(
-                logging.Formatter("[%(asctime)s] [%(levelname)s] %(name)s: %(message)s")
+            file_handler.setFormatter(_FORMATTER)
+            # Batch file writes during bursts (FileHandler flushes every record);
+            # errors and a drained queue flush at once
+            self.file_buffer = _DrainFlushingMemoryHandler(
+                _FILE_BUFFER_RECORDS, logging.ERROR, file_handler, self.log_queue
             )
-            handlers.append(file_handler)
+            handlers.append(self.file_buffer)
+            self.handlers.append(file_handler)  # closed after its buffer
 
         # Create QueueListener to process logs in background thread
         self.listener = logging.handlers.QueueListener(
             self.log_queue, *handlers, respect_handler_level=True
         )
         self.listener.start()
+        self.handlers[:0] = handlers
+        self.config = config
 
         # Create QueueHandler for main thread
         self.queue_handler = logging.handlers.QueueHandler(self.log_queue)
@@ -77,11 +152,17 @@ class AsyncLoggingManager:
         Ensures all queued log records are processed before stopping.
         """
         if self.listener is not None:
-            # QueueListener.stop() waits for queue to be processed,
-            # but we ensure the queue is empty first for extra safety
-            self.log_queue.join()  # Wait for all tasks to be processed
+            # QueueListener.stop() enqueues a sentinel behind every pending
+            # record and joins the listener thread, so the queue is drained
             self.listener.stop()
             self.listener = None
+        # Close in order: the file buffer writes out what the listener left in it
+        # (flush on close) before the file handler behind it is closed
+        for handler in self.handlers:
+            handler.close()
+        self.handlers.clear()
+        self.file_buffer = None
+        self.config = None
 
 
 # Singleton instance
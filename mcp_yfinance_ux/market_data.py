@@ -5,10 +5,22 @@ Testable independently of MCP protocol layer
 Adds caching layer on top of yfinance_ux services for production use.
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import atexit
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import Any
 
-from mcp_yfinance_ux.cache import get_cached_data, set_cached_data
+from mcp_yfinance_ux.cache import (
+    get_cached_data,
+    get_cached_data_many,
+    get_cached_error,
+    set_cached_data,
+    set_cached_error,
+)
 from mcp_yfinance_ux.formatters.markets import (
     format_market_snapshot,
     format_markets,
@@ -21,6 +33,8 @@ from mcp_yfinance_ux.formatters.tickers import (
     format_ticker_batch,
 )
 from mcp_yfinance_ux.logging_config import get_logger
+from yfinance_ux.calculations.momentum import prefetch_momentum
+from yfinance_ux.calculations.volume import market_day_fraction
 from yfinance_ux.services.markets import (
     get_market_snapshot,
     get_ticker_data,
@@ -40,8 +54,91 @@ from yfinance_ux.services.tickers import (
 
 logger = get_logger(__name__)
 
+# Thread cap for markets() misses - above the symbol count, so a cold start is one
+# wave of concurrent requests instead of waves of 10 (yfinance calls block on I/O)
+_MARKETS_MAX_WORKERS = 48
+
+# Long-lived pool for markets() misses: threads are spawned on demand and reused
+# across calls instead of being created and joined per request
+_MARKETS_POOL = ThreadPoolExecutor(
+    max_workers=_MARKETS_MAX_WORKERS, thread_name_prefix="markets"
+)
+atexit.register(_MARKETS_POOL.shutdown)
+
+# Wait budget for a markets() fan-out: symbols still pending after this are shown
+# as errors instead of stalling the screen (yfinance's own request timeout is 10s)
+_MARKETS_TIMEOUT_SECONDS = 10.0
+
+# Single-flight: uncached full-data fetches in progress, {symbol: future}. Concurrent
+# misses for a symbol (e.g. two clients' markets() calls) share one upstream call
+_inflight: dict[str, Future[dict[str, Any]]] = {}
+_inflight_lock = threading.Lock()
+
+# Batches in flight in get_ticker_screen_data_batches (current + one prefetched)
+_PREFETCH_BATCHES = 2
+
+# Complete symbol list for markets() screen: (result key, yfinance symbol)
+_MARKETS_SYMBOLS: tuple[tuple[str, str], ...] = (
+    # US Equities (cash indices)
+    ("sp500", "^GSPC"),
+    ("nasdaq", "^IXIC"),
+    ("dow", "^DJI"),
+    ("russell2000", "^RUT"),
+    # US Futures
+    ("es_futures", "ES=F"),
+    ("nq_futures", "NQ=F"),
+    ("ym_futures", "YM=F"),
+    # Global - Asia/Pacific
+    ("nikkei", "^N225"),
+    ("hangseng", "^HSI"),
+    ("shanghai", "000001.SS"),
+    ("kospi", "^KS11"),
+    ("nifty50", "^NSEI"),
+    ("asx200", "^AXJO"),
+    ("taiwan", "^TWII"),
+    # Global - Europe
+    ("stoxx50", "^STOXX50E"),
+    # Global - Latin America
+    ("bovespa", "^BVSP"),
+    # Crypto
+    ("btc", "BTC-USD"),
+    ("eth", "ETH-USD"),
+    ("sol", "SOL-USD"),
+    # Sectors (all 11 GICS)
+    ("tech", "XLK"),
+    ("financials", "XLF"),
+    ("healthcare", "XLV"),
+    ("energy", "XLE"),
+    ("consumer_disc", "XLY"),
+    ("consumer_stpl", "XLP"),
+    ("industrials", "XLI"),
+    ("utilities", "XLU"),
+    ("materials", "XLB"),
+    ("real_estate", "XLRE"),
+    ("communication", "XLC"),
+    # Styles
+    ("momentum", "MTUM"),
+    ("value", "VTV"),
+    ("growth", "VUG"),
+    ("quality", "QUAL"),
+    ("small_cap", "IWM"),
+    # Private Credit
+    ("private_credit", "BIZD"),
+    # Commodities
+    ("gold", "GC=F"),
+    ("silver", "SI=F"),
+    ("platinum", "PL=F"),
+    ("copper", "HG=F"),
+    ("oil_wti", "CL=F"),
+    ("natgas", "NG=F"),
+    # Volatility & Rates
+    ("vix", "^VIX"),
+    ("us10y", "^TNX"),
+)
+_MARKETS_SYMBOL_LIST = tuple(symbol for _, symbol in _MARKETS_SYMBOLS)
+
 
-def get_ticker_full_data(symbol: str, _stats: dict[str, int] | None = None) -> dict[str, Any]:
+def get_ticker_full_data(symbol: str) -> dict[str, Any]:
     """Cached wrapper for get_ticker_full_data with market-aware TTL
 
     Caching strategy:
@@ -51,115 +148,118 @@ def get_ticker_full_data(symbol: str, _stats: dict[str, int] | None = None) -> d
     After market close, session-based symbols use cached data (prices won't change).
     24-hour markets always fetch fresh data with short TTL.
     """
-    # Check cache first
+    # Check cache first (then recent errors - a failing symbol is not retried per call)
     cached = get_cached_data(symbol)
+    if cached is None:
+        cached = get_cached_error(symbol)
     if cached is not None:
-        if _stats is not None:
-            _stats["hits"] = _stats.get("hits", 0) + 1
         return cached
 
-    # Cache miss - fetch fresh data
-    if _stats is not None:
-        _stats["misses"] = _stats.get("misses", 0) + 1
+    # Cache miss - fetch fresh data (or join a fetch already in flight)
+    return _fetch_full_data_once(symbol).result()
 
-    data = _get_ticker_full_data_uncached(symbol)
 
-    # Cache the result (skip if error)
-    if "error" not in data:
-        set_cached_data(symbol, data)
+def _fetch_full_data_once(
+    symbol: str, day_fraction: float | None = None
+) -> Future[dict[str, Any]]:
+    """Future for an uncached fetch of symbol, shared with any fetch already in flight
 
-    return data
+    The caller's cache miss is re-checked under the lock: a fetch that finished
+    in between has cached its result and left _inflight, so it is reused as a
+    completed Future instead of fetching again.
+    """
+    with _inflight_lock:
+        future = _inflight.get(symbol)
+        if future is None:
+            cached = get_cached_data(symbol)
+            if cached is None:
+                cached = get_cached_error(symbol)
+            if cached is not None:
+                future = Future()
+                future.set_result(cached)
+                return future
+            future = _MARKETS_POOL.submit(_fetch_and_cache_full_data, symbol, day_fraction)
+            _inflight[symbol] = future
+    return future
+
+
+def _fetch_and_cache_full_data(symbol: str, day_fraction: float | None) -> dict[str, Any]:
+    """Fetch full data for symbol and cache it (errors briefly), then leave the in-flight map
+
+    The result is cached before the in-flight entry is removed, so a miss that
+    arrives after this fetch finishes finds the cached data instead of refetching.
+    """
+    try:
+        data = _get_ticker_full_data_uncached(symbol, day_fraction)
+        if "error" not in data:
+            set_cached_data(symbol, data)
+        else:
+            set_cached_error(symbol, data)
+        return data
+    finally:
+        with _inflight_lock:
+            _inflight.pop(symbol, None)
 
 
 def get_markets_data() -> dict[str, dict[str, Any]]:
     """Fetch all market data for markets() screen with caching
 
-    Uses cached version of get_ticker_full_data to avoid unnecessary API calls
-    for closed markets while keeping 24-hour markets fresh.
+    Serves cached symbols in one pass and fetches only the misses, avoiding
+    unnecessary API calls for closed markets while keeping 24-hour markets fresh.
     """
-    # Complete symbol list for markets() screen
-    symbols_to_fetch = [
-        # US Equities (cash indices)
-        ("sp500", "^GSPC"),
-        ("nasdaq", "^IXIC"),
-        ("dow", "^DJI"),
-        ("russell2000", "^RUT"),
-        # US Futures
-        ("es_futures", "ES=F"),
-        ("nq_futures", "NQ=F"),
-        ("ym_futures", "YM=F"),
-        # Global - Asia/Pacific
-        ("nikkei", "^N225"),
-        ("hangseng", "^HSI"),
-        ("shanghai", "000001.SS"),
-        ("kospi", "^KS11"),
-        ("nifty50", "^NSEI"),
-        ("asx200", "^AXJO"),
-        ("taiwan", "^TWII"),
-        # Global - Europe
-        ("stoxx50", "^STOXX50E"),
-        # Global - Latin America
-        ("bovespa", "^BVSP"),
-        # Crypto
-        ("btc", "BTC-USD"),
-        ("eth", "ETH-USD"),
-        ("sol", "SOL-USD"),
-        # Sectors (all 11 GICS)
-        ("tech", "XLK"),
-        ("financials", "XLF"),
-        ("healthcare", "XLV"),
-        ("energy", "XLE"),
-        ("consumer_disc", "XLY"),
-        ("consumer_stpl", "XLP"),
-        ("industrials", "XLI"),
-        ("utilities", "XLU"),
-        ("materials", "XLB"),
-        ("real_estate", "XLRE"),
-        ("communication", "XLC"),
-        # Styles
-        ("momentum", "MTUM"),
-        ("value", "VTV"),
-        ("growth", "VUG"),
-        ("quality", "QUAL"),
-        ("small_cap", "IWM"),
-        # Private Credit
-        ("private_credit", "BIZD"),
-        # Commodities
-        ("gold", "GC=F"),
-        ("silver", "SI=F"),
-        ("platinum", "PL=F"),
-        ("copper", "HG=F"),
-        ("oil_wti", "CL=F"),
-        ("natgas", "NG=F"),
-        # Volatility & Rates
-        ("vix", "^VIX"),
-        ("us10y", "^TNX"),
-    ]
-
-    # Track cache performance
-    stats: dict[str, int] = {"hits": 0, "misses": 0}
-
-    # Fetch in parallel using cached wrapper
-    results: dict[str, dict[str, Any]] = {}
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_key = {
-            executor.submit(get_ticker_full_data, symbol, stats): key
-            for key, symbol in symbols_to_fetch
-        }
-
-        for future in as_completed(future_to_key):
+    # Serve cache hits in one pass; only misses go to the thread pool
+    hits = get_cached_data_many(_MARKETS_SYMBOL_LIST)
+    results: dict[str, dict[str, Any]] = {
+        key: hits[symbol] for key, symbol in _MARKETS_SYMBOLS if symbol in hits
+    }
+    missing = [(key, symbol) for key, symbol in _MARKETS_SYMBOLS if symbol not in hits]
+
+    # Symbols that failed within the error TTL keep their error instead of refetching
+    to_fetch = []
+    for key, symbol in missing:
+        error = get_cached_error(symbol)
+        if error is not None:
+            results[key] = error
+        else:
+            to_fetch.append((key, symbol))
+
+    # Fetch misses in parallel (cached on success; shared with concurrent callers),
+    # with the session fraction read once for every symbol
+    # The momentum prefetch and the per-symbol fetches share one time budget
+    deadline = time.monotonic() + _MARKETS_TIMEOUT_SECONDS
+    day_fraction = None
+    if to_fetch:
+        day_fraction = market_day_fraction()
+        # Momentum lookback prices for all misses in one bulk download
+        prefetch_momentum(
+            [symbol for _, symbol in to_fetch], timeout=_MARKETS_TIMEOUT_SECONDS / 2
+        )
+    future_to_key = {
+        _fetch_full_data_once(symbol, day_fraction): key for key, symbol in to_fetch
+    }
+    try:
+        remaining = max(0.0, deadline - time.monotonic())
+        for future in as_completed(future_to_key, timeout=remaining):
             key = future_to_key[future]
             try:
                 results[key] = future.result()
             except Exception as e:
                 results[key] = {"symbol": key, "error": str(e)}
+    except FuturesTimeoutError:
+        # Stragglers are shared (single-flight) and keep running in the pool - their
+        # results land in the cache for the next call, so they are not cancelled
+        late = [key for key in future_to_key.values() if key not in results]
+        for key in late:
+            results[key] = {"symbol": key, "error": "timeout"}
+        logger.warning("markets() timed out waiting for %d symbols: %s", len(late), late)
 
     # Log cache performance summary
-    total = stats["hits"] + stats["misses"]
-    hit_rate = (stats["hits"] / total * 100) if total > 0 else 0
+    total = len(_MARKETS_SYMBOLS)
+    hit_count = total - len(missing)
+    hit_rate = (hit_count / total * 100) if total > 0 else 0
     logger.info(
-        f"markets() cache stats: {stats['hits']}/{total} hits ({hit_rate:.0f}%), "
-        f"{stats['misses']} API calls"
+        "markets() cache stats: %d/%d hits (%.0f%%), %d API calls",
+        hit_count, total, hit_rate, len(to_fetch),
     )
 
     return results
@@ -175,19 +275,23 @@ def get_ticker_screen_data(symbol: str) -> dict[str, Any]:
 
     After market close, session-based symbols use cached data (prices/data won't change).
     """
-    # Check cache first
+    # Check cache first (then recent errors - a failing symbol is not retried per call)
     cached = get_cached_data(symbol)
+    if cached is None:
+        cached = get_cached_error(symbol)
     if cached is not None:
-        logger.debug(f"ticker({symbol}) cache hit")
+        logger.debug("ticker(%s) cache hit", symbol)
         return cached
 
     # Cache miss - fetch fresh data
-    logger.debug(f"ticker({symbol}) cache miss - fetching from yfinance")
+    logger.debug("ticker(%s) cache miss - fetching from yfinance", symbol)
     data = _get_ticker_screen_data_uncached(symbol)
 
-    # Cache the result (skip if error)
+    # Cache the result (errors only briefly)
     if "error" not in data:
         set_cached_data(symbol, data)
+    else:
+        set_cached_error(symbol, data)
 
     return data
 
@@ -196,38 +300,74 @@ def get_ticker_screen_data_batch(symbols: list[str]) -> list[dict[str, Any]]:
     """Cached wrapper for get_ticker_screen_data_batch
 
     Checks cache for each symbol individually before fetching.
-    Only uncached symbols are fetched from yfinance.
+    Only uncached symbols are fetched from yfinance. Results follow the order
+    of symbols (cached and fresh entries interleaved as requested).
     """
     if not symbols:
         return []
 
-    results = []
-    uncached_symbols = []
+    # {requested symbol: data}, cached entries first, then fresh ones
+    by_symbol: dict[str, dict[str, Any]] = {}
+    misses = []
 
-    # Check cache for each symbol
+    # Check cache for each symbol (lookup bound once for the loop)
+    get_cached = get_cached_data
     for symbol in symbols:
-        cached = get_cached_data(symbol)
+        if symbol in by_symbol:
+            continue  # Repeated symbol - already served
+        cached = get_cached(symbol)
+        if cached is None:
+            cached = get_cached_error(symbol)  # Recently failed - not retried per call
         if cached is not None:
-            logger.debug(f"ticker({symbol}) cache hit in batch")
-            results.append(cached)
+            logger.debug("ticker(%s) cache hit in batch", symbol)
+            by_symbol[symbol] = cached
         else:
-            logger.debug(f"ticker({symbol}) cache miss in batch")
-            uncached_symbols.append(symbol)
-
-    # Fetch uncached symbols
-    if uncached_symbols:
-        logger.info(f"ticker() batch: {len(uncached_symbols)}/{len(symbols)} cache misses")
-        fresh_data = _get_ticker_screen_data_batch_uncached(uncached_symbols)
-
-        # Cache and add to results
-        for data in fresh_data:
-            if "error" not in data:
-                set_cached_data(data["symbol"], data)
-            results.append(data)
-    else:
-        logger.info(f"ticker() batch: {len(symbols)}/{len(symbols)} cache hits (100%)")
+            logger.debug("ticker(%s) cache miss in batch", symbol)
+            misses.append(symbol)
+
+    if not misses:
+        logger.info("ticker() batch: %d/%d cache hits (100%%)", len(symbols), len(symbols))
+        return [by_symbol[symbol] for symbol in symbols]
+
+    # Fetch uncached symbols once each (one result per symbol, in request order)
+    uncached_symbols = list(dict.fromkeys(misses))
+    logger.info("ticker() batch: %d/%d cache misses", len(uncached_symbols), len(symbols))
+    fresh_data = _get_ticker_screen_data_batch_uncached(uncached_symbols)
+
+    # Cache and map back under the requested symbol (the key every lookup uses;
+    # rows carry the normalized, upper-cased symbol)
+    set_cached = set_cached_data
+    for symbol, data in zip(uncached_symbols, fresh_data, strict=True):
+        if "error" not in data:
+            set_cached(symbol, data)
+        else:
+            set_cached_error(symbol, data)
+        by_symbol[symbol] = data
 
-    return results
+    return [by_symbol[symbol] for symbol in symbols]
+
+
+def get_ticker_screen_data_batches(
+    batches: Iterable[list[str]],
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield get_ticker_screen_data_batch() results for each batch, in order
+
+    Batch N+1 (cache checks and fetch) starts on a background thread while
+    batch N is still in flight, so consecutive batches overlap network latency.
+    """
+    pending: deque[Future[list[dict[str, Any]]]] = deque()
+    executor = ThreadPoolExecutor(max_workers=_PREFETCH_BATCHES)
+    try:
+        for batch in batches:
+            pending.append(executor.submit(get_ticker_screen_data_batch, batch))
+            if len(pending) == _PREFETCH_BATCHES:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Consumer stopped early (close/GC) - drop prefetches that have not started
+        # and don't block on the batch still in flight (it still fills the cache)
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 # Re-export all functions for backward compatibility
@@ -248,4 +388,5 @@ __all__ = [
     "get_ticker_history",
     "get_ticker_screen_data",
     "get_ticker_screen_data_batch",
+    "get_ticker_screen_data_batches",
 ]
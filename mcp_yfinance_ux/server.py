@@ -29,8 +29,12 @@ async def list_tools() -> list[Tool]:
 
 @app.call_tool()  # type: ignore[misc]
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:  # noqa: ANN401
-    """Handle tool execution - delegates to handlers.py"""
-    result = handle_tool(name, arguments or {})
+    """Handle tool execution - delegates to handlers.py
+
+    handle_tool blocks on yfinance network I/O, so it runs in a worker thread
+    to keep the event loop responsive.
+    """
+    result = await asyncio.to_thread(handle_tool, name, arguments or {})
     return [TextContent(type="text", text=result)]
 
 
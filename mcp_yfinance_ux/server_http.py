@@ -12,9 +12,14 @@ Configuration:
 - PORT: Server port (default: 5001)
 """
 
+import asyncio
 import logging
 import os
 import signal
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -23,7 +28,7 @@ from mcp.server.sse import SseServerTransport
 from mcp.types import TextContent, Tool
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
 from starlette.routing import Mount, Route
 
 from .handlers import call_tool as handle_tool
@@ -34,19 +39,20 @@ logger = get_logger(__name__)
 
 # Configuration
 DEFAULT_PORT = 5001
+TOOL_THREADS = 32  # Concurrent tool calls (each blocks a thread on yfinance I/O)
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
 
 
 def get_log_level() -> int:
     """Get log level from environment or use default (INFO)"""
     level_str = os.environ.get("LOG_LEVEL", "INFO").upper()
-    level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
-    return level_map.get(level_str, logging.INFO)
+    return LOG_LEVELS.get(level_str, logging.INFO)
 
 
 # Setup async logging with level from .env
@@ -56,8 +62,9 @@ setup_async_logging(
 )
 
 
+@lru_cache(maxsize=1)
 def get_port() -> int:
-    """Get server port from environment or use default"""
+    """Get server port from environment or use default (read once per process)"""
     port_str = os.environ.get("PORT", str(DEFAULT_PORT))
     try:
         return int(port_str)
@@ -81,25 +88,34 @@ async def list_tools() -> list[Tool]:
 
 @mcp_server.call_tool()  # type: ignore[misc]
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:  # noqa: ANN401
-    """Handle tool execution - delegates to handlers.py"""
+    """Handle tool execution - delegates to handlers.py
+
+    handle_tool blocks on yfinance network I/O, so it runs in a worker thread;
+    other SSE clients are served while it waits.
+    """
     logger.info(f"call_tool: name={name}, arguments={arguments}")
-    result = handle_tool(name, arguments or {})
+    result = await asyncio.to_thread(handle_tool, name, arguments or {})
     logger.info(f"{name}() returning {len(result)} chars")
     return [TextContent(type="text", text=result)]
 
 
 # Starlette endpoint handlers
 
-async def handle_ping(_request: Request) -> JSONResponse:
+# Fixed JSON bodies, encoded once (same bytes JSONResponse renders per request)
+_PING_BODY = b'{"status":"ok"}'
+_SHUTDOWN_BODY = b'{"status":"shutting down"}'
+
+
+async def handle_ping(_request: Request) -> Response:
     """Health check endpoint"""
-    return JSONResponse({"status": "ok"})
+    return Response(_PING_BODY, media_type="application/json")
 
 
-async def handle_shutdown(_request: Request) -> JSONResponse:
+async def handle_shutdown(_request: Request) -> Response:
     """Graceful shutdown endpoint"""
     # Send SIGTERM to self for graceful shutdown
     os.kill(os.getpid(), signal.SIGTERM)
-    return JSONResponse({"status": "shutting down"})
+    return Response(_SHUTDOWN_BODY, media_type="application/json")
 
 
 async def handle_sse(request: Request) -> Response:
@@ -131,8 +147,20 @@ async def handle_sse(request: Request) -> Response:
     )
 
 
+@asynccontextmanager
+async def lifespan(_app: Starlette) -> AsyncIterator[None]:
+    """Size the default executor (used by asyncio.to_thread) for concurrent tool calls"""
+    executor = ThreadPoolExecutor(max_workers=TOOL_THREADS, thread_name_prefix="tool")
+    asyncio.get_running_loop().set_default_executor(executor)
+    try:
+        yield
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 # Starlette application
 app = Starlette(
+    lifespan=lifespan,
     routes=[
         Route("/ping", endpoint=handle_ping, methods=["GET"]),
         Route("/shutdown", endpoint=handle_shutdown, methods=["POST"]),
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Test in-memory market data cache (no network required).
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from mcp_yfinance_ux import market_data
+from mcp_yfinance_ux.cache import (
+    _MAX_ENTRIES,
+    _NY_TZ,
+    _cache,
+    _error_cache,
+    _next_open_memo,
+    clear_cache,
+    get_cache_stats,
+    get_cached_data,
+    get_cached_data_many,
+    get_cached_error,
+    get_next_market_open,
+    set_cached_data,
+    set_cached_error,
+    sweep_expired,
+)
+from mcp_yfinance_ux.market_data import (
+    get_ticker_full_data,
+    get_ticker_screen_data,
+    get_ticker_screen_data_batch,
+    get_ticker_screen_data_batches,
+)
+
+# Upper bound for calls that must return without waiting on slow work in flight
+_PROMPT_SECONDS = 0.25
+
+
+def test_cache_miss():
+    """Test lookup of a symbol that was never cached"""
+    clear_cache()
+    assert get_cached_data("NOPE") is None
+    print("✓ Cache miss works")
+
+
+def test_cache_set_and_hit():
+    """Test cached data is returned until expiry"""
+    clear_cache()
+    data = {"symbol": "BTC-USD", "price": 100000.0}
+    set_cached_data("BTC-USD", data)
+    assert get_cached_data("BTC-USD") == data
+    print("✓ Cache set/hit works")
+
+
+def test_cache_expired():
+    """Test entries past their monotonic expiry are treated as misses"""
+    clear_cache()
+    set_cached_data("SOL-USD", {"symbol": "SOL-USD"})
+    _cache["SOL-USD"].expires_at_mono = time.monotonic() - 1
+    assert get_cached_data("SOL-USD") is None
+    print("✓ Cache expiry works")
+
+
+def test_cache_multi_get():
+    """Test multi-get returns only valid hits"""
+    clear_cache()
+    set_cached_data("BTC-USD", {"symbol": "BTC-USD"})
+    set_cached_data("SOL-USD", {"symbol": "SOL-USD"})
+    _cache["SOL-USD"].expires_at_mono = time.monotonic() - 1
+    hits = get_cached_data_many(["BTC-USD", "SOL-USD", "NOPE"])
+    assert hits == {"BTC-USD": {"symbol": "BTC-USD"}}
+    print("✓ Cache multi-get works")
+
+
+def test_error_cache():
+    """Test error results are remembered briefly and kept apart from data"""
+    clear_cache()
+    error = {"symbol": "NOPE", "error": "not found"}
+    set_cached_error("NOPE", error)
+    assert get_cached_error("NOPE") == error
+    assert get_cached_data("NOPE") is None
+
+    # Expired errors are dropped so the symbol is retried
+    _error_cache["NOPE"] = (time.monotonic() - 1, error)
+    assert get_cached_error("NOPE") is None
+    assert "NOPE" not in _error_cache
+    print("✓ Error cache works")
+
+
+def test_sweep_expired():
+    """Test sweep drops only expired entries"""
+    clear_cache()
+    set_cached_data("BTC-USD", {"symbol": "BTC-USD"})
+    set_cached_data("ETH-USD", {"symbol": "ETH-USD"})
+    _cache["BTC-USD"].expires_at_mono = time.monotonic() - 1
+    assert sweep_expired() == 1
+    assert "BTC-USD" not in _cache
+    assert get_cached_data("ETH-USD") == {"symbol": "ETH-USD"}
+    print("✓ Cache sweep works")
+
+
+def test_lru_eviction():
+    """Test the cache stays bounded and evicts the least recently used symbol"""
+    clear_cache()
+    symbols = [f"SYM{i}" for i in range(_MAX_ENTRIES)]
+    for symbol in symbols:
+        set_cached_data(symbol, {"symbol": symbol})
+
+    # Touch the oldest entry so SYM1 becomes the eviction candidate
+    assert get_cached_data("SYM0") == {"symbol": "SYM0"}
+    set_cached_data("NEW", {"symbol": "NEW"})
+
+    assert len(_cache) == _MAX_ENTRIES
+    assert "SYM0" in _cache
+    assert "SYM1" not in _cache
+    assert get_cached_data("NEW") == {"symbol": "NEW"}
+    clear_cache()
+    print("✓ Cache LRU eviction works")
+
+
+def test_cache_stats():
+    """Test cache statistics report live entries"""
+    clear_cache()
+    set_cached_data("ES=F", {"symbol": "ES=F"})
+    set_cached_data("AAPL", {"symbol": "AAPL"})
+    stats = get_cache_stats()
+    symbols = {entry["symbol"] for entry in stats["entries"]}
+    assert symbols == {"ES=F", "AAPL"}
+    assert stats["total_entries"] == len(symbols)
+    for entry in stats["entries"]:
+        assert entry["ttl_seconds"] > 0
+    print("✓ Cache stats work")
+
+
+def test_next_market_open_memo():
+    """Test next open is memoized until it passes, then recomputed"""
+    _next_open_memo.clear()
+    next_open = get_next_market_open()
+    assert next_open > datetime.now(_NY_TZ)
+    assert (next_open.hour, next_open.minute) == (9, 30)
+    assert next_open.strftime("%a") not in {"Sat", "Sun"}
+    assert get_next_market_open() is next_open
+
+    # A stale memo (already passed) must not be returned
+    _next_open_memo["next_open"] = next_open - timedelta(days=30)
+    assert get_next_market_open() == next_open
+    print("✓ Next market open memo works")
+
+
+def test_prefetched_batches_in_order():
+    """Test prefetched batches are yielded in order (served from cache, no network)"""
+    clear_cache()
+    symbols = ["BTC-USD", "ETH-USD", "SOL-USD"]
+    for symbol in symbols:
+        set_cached_data(symbol, {"symbol": symbol})
+    batches = [["BTC-USD"], ["ETH-USD", "SOL-USD"], ["BTC-USD"]]
+    results = list(get_ticker_screen_data_batches(batches))
+    assert [[d["symbol"] for d in batch] for batch in results] == batches
+    print("✓ Prefetched batches work")
+
+
+def test_prefetched_batches_early_close():
+    """Test closing the batch stream early does not wait on the batch in flight (fake fetch)"""
+    clear_cache()
+    fetched = []
+
+    def slow_batch(symbols):
+        fetched.append(symbols)
+        if symbols != ["FAST"]:
+            time.sleep(0.5)
+        return [{"symbol": symbol} for symbol in symbols]
+
+    original = market_data._get_ticker_screen_data_batch_uncached
+    market_data._get_ticker_screen_data_batch_uncached = slow_batch
+    try:
+        stream = get_ticker_screen_data_batches([["FAST"], ["SLOW"], ["NEVER"]])
+        assert next(stream) == [{"symbol": "FAST"}]
+        time.sleep(0.05)  # SLOW is now running, NEVER not yet submitted
+        start = time.monotonic()
+        stream.close()
+        assert time.monotonic() - start < _PROMPT_SECONDS
+        time.sleep(0.6)
+    finally:
+        market_data._get_ticker_screen_data_batch_uncached = original
+    # The in-flight batch still finished (and cached); the rest never started
+    assert fetched == [["FAST"], ["SLOW"]]
+    assert get_cached_data("SLOW") == {"symbol": "SLOW"}
+    print("✓ Prefetched batches early close works")
+
+
+def test_full_data_single_flight():
+    """Test concurrent misses for one symbol share a single upstream fetch (fake fetch)"""
+    clear_cache()
+    calls = []
+
+    def slow_fetch(symbol, _day_fraction=None):
+        calls.append(symbol)
+        time.sleep(0.2)
+        return {"symbol": symbol, "price": 1.0}
+
+    original = market_data._get_ticker_full_data_uncached
+    market_data._get_ticker_full_data_uncached = slow_fetch
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(get_ticker_full_data, ["BTC-USD"] * 4))
+    finally:
+        market_data._get_ticker_full_data_uncached = original
+    assert calls == ["BTC-USD"]
+    assert all(r == {"symbol": "BTC-USD", "price": 1.0} for r in results)
+    assert get_cached_data("BTC-USD") == results[0]
+    assert not market_data._inflight
+
+    # A miss that raced a fetch which has since finished reuses its cached result
+    market_data._get_ticker_full_data_uncached = slow_fetch
+    try:
+        future = market_data._fetch_full_data_once("BTC-USD")
+    finally:
+        market_data._get_ticker_full_data_uncached = original
+    assert future.done()
+    assert future.result() == results[0]
+    assert calls == ["BTC-USD"]
+    print("✓ Full data single-flight works")
+
+
+def test_markets_timeout():
+    """Test a hung symbol is reported as timed out without stalling markets() (fake fetch)"""
+    clear_cache()
+
+    def fetch(symbol, _day_fraction=None):
+        if symbol == "^VIX":
+            time.sleep(0.5)
+        return {"symbol": symbol, "price": 1.0}
+
+    originals = (
+        market_data._get_ticker_full_data_uncached,
+        market_data.prefetch_momentum,
+        market_data._MARKETS_TIMEOUT_SECONDS,
+    )
+    market_data._get_ticker_full_data_uncached = fetch
+    market_data.prefetch_momentum = lambda _symbols, **_kwargs: 0
+    market_data._MARKETS_TIMEOUT_SECONDS = 0.2
+    try:
+        start = time.monotonic()
+        results = market_data.get_markets_data()
+        assert time.monotonic() - start < market_data._MARKETS_TIMEOUT_SECONDS + _PROMPT_SECONDS
+        assert results["vix"] == {"symbol": "vix", "error": "timeout"}
+        assert results["sp500"] == {"symbol": "^GSPC", "price": 1.0}
+
+        # The straggler finishes in the background and is cached for the next call
+        time.sleep(0.5)
+        assert get_cached_data("^VIX") == {"symbol": "^VIX", "price": 1.0}
+    finally:
+        (
+            market_data._get_ticker_full_data_uncached,
+            market_data.prefetch_momentum,
+            market_data._MARKETS_TIMEOUT_SECONDS,
+        ) = originals
+    print("✓ markets() timeout works")
+
+
+def test_screen_batch_keeps_order():
+    """Test mixed cached/fresh batch results follow the requested order (fake fetch)"""
+    clear_cache()
+    set_cached_data("ETH-USD", {"symbol": "ETH-USD", "cached": True})
+    fetched = []
+
+    def fake_batch(symbols):
+        fetched.append(symbols)
+        return [{"symbol": symbol} for symbol in symbols]
+
+    original = market_data._get_ticker_screen_data_batch_uncached
+    market_data._get_ticker_screen_data_batch_uncached = fake_batch
+    try:
+        results = get_ticker_screen_data_batch(["BTC-USD", "ETH-USD", "SOL-USD", "BTC-USD"])
+    finally:
+        market_data._get_ticker_screen_data_batch_uncached = original
+    assert [d["symbol"] for d in results] == ["BTC-USD", "ETH-USD", "SOL-USD", "BTC-USD"]
+    assert results[1]["cached"]
+    assert fetched == [["BTC-USD", "SOL-USD"]]
+
+    # Rows carry the upper-cased symbol; the cache is keyed by the requested one
+    def upper_batch(symbols):
+        fetched.append(symbols)
+        return [{"symbol": symbol.upper()} for symbol in symbols]
+
+    market_data._get_ticker_screen_data_batch_uncached = upper_batch
+    try:
+        first = get_ticker_screen_data_batch(["ada-usd"])
+        second = get_ticker_screen_data_batch(["ada-usd"])
+    finally:
+        market_data._get_ticker_screen_data_batch_uncached = original
+    assert first == second == [{"symbol": "ADA-USD"}]
+    assert fetched[1:] == [["ada-usd"]]
+    print("✓ Screen batch order works")
+
+
+def test_failed_fetch_not_retried():
+    """Test a failing symbol is served from the error cache on the next call (fake fetch)"""
+    clear_cache()
+    calls = []
+
+    def failing_fetch(symbol):
+        calls.append(symbol)
+        return {"symbol": symbol, "error": "upstream 500"}
+
+    original = market_data._get_ticker_screen_data_uncached
+    market_data._get_ticker_screen_data_uncached = failing_fetch
+    try:
+        first = get_ticker_screen_data("NOPE")
+        second = get_ticker_screen_data("NOPE")
+    finally:
+        market_data._get_ticker_screen_data_uncached = original
+    assert first == second == {"symbol": "NOPE", "error": "upstream 500"}
+    assert calls == ["NOPE"]
+    print("✓ Failed fetch not retried within error TTL")
+
+
+def test_clear_cache():
+    """Test clearing the cache drops all entries"""
+    set_cached_data("ETH-USD", {"symbol": "ETH-USD"})
+    clear_cache()
+    assert get_cached_data("ETH-USD") is None
+    assert get_cache_stats()["total_entries"] == 0
+    print("✓ Cache clear works")
+
+
+if __name__ == "__main__":
+    print("Testing cache module...\n")
+
+    test_cache_miss()
+    test_cache_set_and_hit()
+    test_cache_expired()
+    test_cache_multi_get()
+    test_error_cache()
+    test_sweep_expired()
+    test_lru_eviction()
+    test_cache_stats()
+    test_next_market_open_memo()
+    test_prefetched_batches_in_order()
+    test_prefetched_batches_early_close()
+    test_full_data_single_flight()
+    test_markets_timeout()
+    test_screen_batch_keeps_order()
+    test_failed_fetch_not_retried()
+    test_clear_cache()
+    print()
+
+    print("All cache tests passed! ✓")
@@ -4,20 +4,42 @@ Test core market_data module independently (no MCP required)
 Demonstrates proper separation of concerns
 """
 
+import math
 import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 # Add project root to path so we can import mcp_yfinance_ux
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from yfinance_ux.common.dates import is_market_open
+from yfinance_ux import fetcher
+from yfinance_ux.common.dates import get_market_status, is_futures_open, is_market_open
 from mcp_yfinance_ux.market_data import (
     get_ticker_data,
     get_market_snapshot,
     format_market_snapshot,
 )
 
+# Upper bound for calls that must return without waiting on slow work in flight
+_PROMPT_SECONDS = 0.25
+
+
+@contextmanager
+def _patched(module, **fakes):
+    """Replace module attributes with fakes for the block, restoring them after"""
+    originals = {name: getattr(module, name) for name in fakes}
+    for name, fake in fakes.items():
+        setattr(module, name, fake)
+    try:
+        yield
+    finally:
+        for name, original in originals.items():
+            setattr(module, name, original)
+
 
 def test_market_hours():
     """Test market hours detection"""
@@ -27,6 +49,428 @@ def test_market_hours():
     print("✓ Market hours detection works")
 
 
+def test_market_hours_at_instant():
+    """Test market hours checks against a caller-supplied instant"""
+    ny = ZoneInfo("America/New_York")
+    # Wed 2025-01-15 11:00 ET - regular session
+    wed_open = datetime(2025, 1, 15, 11, 0, tzinfo=ny)
+    assert is_market_open(wed_open) is True
+    assert is_futures_open(wed_open) is True
+    # Wed 2025-01-15 17:30 ET - after close, inside CME maintenance window
+    wed_maint = datetime(2025, 1, 15, 17, 30, tzinfo=ny)
+    assert is_market_open(wed_maint) is False
+    assert is_futures_open(wed_maint) is False
+    # Same instant expressed in UTC converts to ET before checking
+    assert is_market_open(wed_open.astimezone(ZoneInfo("UTC"))) is True
+    # Sat 2025-01-18 - everything closed
+    sat = datetime(2025, 1, 18, 12, 0, tzinfo=ny)
+    assert is_market_open(sat) is False
+    assert is_futures_open(sat) is False
+    # Checks are memoized per minute - boundaries still land exactly
+    assert is_market_open(datetime(2025, 1, 15, 15, 59, 59, 900000, tzinfo=ny)) is True
+    assert is_market_open(datetime(2025, 1, 15, 16, 0, tzinfo=ny)) is False
+    assert is_futures_open(datetime(2025, 1, 15, 17, 59, 59, tzinfo=ny)) is False
+    assert is_futures_open(datetime(2025, 1, 15, 18, 0, tzinfo=ny)) is True
+    # Status string, derived or taken from a caller's already-known open state
+    assert get_market_status("us", wed_open) == "Open"
+    assert get_market_status("us", sat) == "Closed"
+    assert get_market_status("us", sat, is_open_hint=True) == "Open"
+    print("✓ Market hours at fixed instant works")
+
+
+def test_price_at_date_memo():
+    """Test past lookback prices are fetched once, misses and open windows are not stored"""
+    ny = ZoneInfo("America/New_York")
+    calls = []
+    price = 100.0
+
+    def fake_fetch(symbol, _target_date, _window_days, _end):
+        calls.append(symbol)
+        return None if symbol == "MISS" else price
+
+    original = fetcher._fetch_price_at_date_uncached
+    fetcher._fetch_price_at_date_uncached = fake_fetch
+    fetcher._price_at_date_cache.clear()
+    try:
+        past = datetime(2025, 1, 15, 11, 0, tzinfo=ny)
+        assert fetcher.fetch_price_at_date("TEST", past) == price
+        assert fetcher.fetch_price_at_date("TEST", past.replace(hour=15)) == price
+        assert calls == ["TEST"]  # same symbol and day served from the memo
+
+        assert fetcher.fetch_price_at_date("MISS", past) is None
+        assert fetcher.fetch_price_at_date("MISS", past) is None
+        assert calls == ["TEST", "MISS", "MISS"]  # None is not memoized
+
+        # A window reaching today may still change - always fetched
+        today = datetime.now(ny)
+        fetcher.fetch_price_at_date("TEST", today)
+        fetcher.fetch_price_at_date("TEST", today)
+        assert calls[3:] == ["TEST", "TEST"]
+    finally:
+        fetcher._fetch_price_at_date_uncached = original
+        fetcher._price_at_date_cache.clear()
+    print("✓ fetch_price_at_date memo works")
+
+
+def test_price_history_ttl():
+    """Test repeat history lookups are served from the TTL memo until it expires"""
+    import pandas as pd  # noqa: PLC0415
+
+    calls = []
+
+    class FakeTicker:
+        def __init__(self, symbol):
+            self.symbol = symbol
+
+        def history(self, **_kwargs):
+            calls.append(self.symbol)
+            if self.symbol == "EMPTY":
+                return pd.DataFrame()
+            return pd.DataFrame({"Close": [1.0, 2.0]})
+
+    original = fetcher.yf.Ticker
+    fetcher.yf.Ticker = FakeTicker
+    fetcher._history_cache.clear()
+    try:
+        first = fetcher.fetch_price_history("TEST")
+        first.loc[0, "Close"] = -1.0  # callers get a copy, the memo is untouched
+        assert fetcher.fetch_price_history("TEST")["Close"].tolist() == [1.0, 2.0]
+        assert calls == ["TEST"]
+
+        fetcher.fetch_price_history("EMPTY")
+        fetcher.fetch_price_history("EMPTY")
+        assert calls == ["TEST", "EMPTY", "EMPTY"]  # empty results are not memoized
+
+        # Expired entries are refetched
+        for key, (_, frame) in list(fetcher._history_cache.items()):
+            fetcher._history_cache[key] = (0.0, frame)
+        fetcher.fetch_price_history("TEST")
+        assert calls == ["TEST", "EMPTY", "EMPTY", "TEST"]
+    finally:
+        fetcher.yf.Ticker = original
+        fetcher._history_cache.clear()
+    print("✓ fetch_price_history TTL memo works")
+
+
+def test_prefetch_prices_at_dates():
+    """Test one bulk download fills the memo with each symbol's closest close"""
+    import numpy as np  # noqa: PLC0415
+    import pandas as pd  # noqa: PLC0415
+
+    ny = ZoneInfo("America/New_York")
+    # Two exchanges: union UTC index, NaN where a symbol has no bar
+    us = pd.date_range("2025-01-01", "2025-03-01", freq="B", tz=ny).tz_convert("UTC")
+    asia = pd.date_range("2025-01-01", "2025-03-01", freq="B", tz="Asia/Tokyo").tz_convert("UTC")
+    frame = pd.DataFrame(
+        np.nan, index=us.union(asia),
+        columns=pd.MultiIndex.from_product([["AAA", "BBB"], ["Close"]]),
+    )
+    frame.loc[us, ("AAA", "Close")] = np.arange(len(us)) + 100.0
+    frame.loc[asia, ("BBB", "Close")] = np.arange(len(asia)) + 200.0
+    downloads = []
+
+    def fake_download(symbols, **_kwargs):
+        downloads.append(list(symbols))
+        return frame
+
+    original = fetcher.yf.download
+    fetcher.yf.download = fake_download
+    fetcher._price_at_date_cache.clear()
+    fetcher._price_prefetch_attempted.clear()
+    try:
+        targets = [datetime(2025, 1, 15, 11, 0, tzinfo=ny), datetime(2025, 2, 10, 11, 0, tzinfo=ny)]
+        stored = fetcher.prefetch_prices_at_dates(["AAA", "BBB", "AAA"], targets)
+        assert stored == 2 * len(targets)
+        assert downloads == [["AAA", "BBB"]]
+        # Same picks as the per-symbol lookup (closest bar instant to target midnight ET)
+        cache = fetcher._price_at_date_cache
+        picks = (
+            cache[("AAA", "2025-01-15", 5)],
+            cache[("BBB", "2025-01-15", 5)],
+            fetcher.fetch_price_at_date("BBB", targets[1]),
+        )
+        assert picks == (110.0, 211.0, 229.0)
+
+        # Everything memoized - no second download
+        assert fetcher.prefetch_prices_at_dates(["AAA", "BBB"], targets) == 0
+        assert downloads == [["AAA", "BBB"]]
+
+        # A target with no bar in its window is not retried on every call
+        no_bar = [datetime(2024, 6, 3, 11, 0, tzinfo=ny)]
+        assert fetcher.prefetch_prices_at_dates(["AAA"], no_bar) == 0
+        assert fetcher.prefetch_prices_at_dates(["AAA"], no_bar) == 0
+        assert downloads == [["AAA", "BBB"], ["AAA"]]
+
+        # A slow download is not waited on past the timeout, and still lands later
+        def slow_download(_symbols, **_kwargs):
+            time.sleep(0.3)
+            return frame
+
+        fetcher.yf.download = slow_download
+        fetcher._price_at_date_cache.clear()
+        fetcher._price_prefetch_attempted.clear()
+        start = time.monotonic()
+        assert fetcher.prefetch_prices_at_dates(["AAA"], targets, timeout=0.05) == 0
+        assert time.monotonic() - start < _PROMPT_SECONDS
+        time.sleep(0.4)
+        assert fetcher._price_at_date_cache[("AAA", "2025-01-15", 5)] == picks[0]
+    finally:
+        fetcher.yf.download = original
+        fetcher._price_at_date_cache.clear()
+        fetcher._price_prefetch_attempted.clear()
+    print("✓ prefetch_prices_at_dates works")
+
+
+def test_prefetch_histories():
+    """Test the batch screen's bulk history split matches per-ticker history stats"""
+    import numpy as np  # noqa: PLC0415
+    import pandas as pd  # noqa: PLC0415
+
+    from yfinance_ux.services import tickers  # noqa: PLC0415
+
+    index = pd.date_range("2025-01-01", periods=22, freq="B", tz="America/New_York")
+    hist = pd.DataFrame({
+        "Close": np.linspace(100.0, 120.0, len(index)) + np.sin(np.arange(len(index))),
+        "Volume": np.arange(len(index)) * 1000.0 + 5000.0,
+    }, index=index)
+    frame = pd.concat({"AAA": hist, "BBB": hist * np.nan}, axis=1)
+    frame.loc[index[0], ("BBB", "Close")] = 1.0  # too short for RSI
+    calls = []
+
+    def fake_download(symbols, **kwargs):
+        calls.append((list(symbols), kwargs["period"]))
+        return frame
+
+    class FakeTicker:
+        def history(self, **_kwargs):
+            return hist
+
+    original = tickers.yf.download
+    tickers.yf.download = fake_download
+    try:
+        frames = tickers._prefetch_histories(["AAA", "BBB", "CCC"])
+        assert calls == [(["AAA", "BBB", "CCC"], "1y")]
+        assert set(frames) == {"AAA", "BBB"}
+        assert len(frames["BBB"]) == 1
+        assert tickers._history_stats(frames["AAA"]) == tickers._history_stats(
+            tickers._history(FakeTicker())
+        )
+        assert tickers._history_stats(frames["BBB"]) == (None, None)
+    finally:
+        tickers.yf.download = original
+    print("✓ prefetch_histories works")
+
+
+def test_idio_vol_given_histories():
+    """Test idio vol uses the histories it is handed instead of fetching its own"""
+    import numpy as np  # noqa: PLC0415
+    import pandas as pd  # noqa: PLC0415
+
+    from yfinance_ux.calculations import volatility  # noqa: PLC0415
+
+    rng = np.random.default_rng(3)
+    index = pd.date_range("2025-01-01", periods=80, freq="B", tz="America/New_York")
+    market = pd.DataFrame({"Close": 100 * np.cumprod(1 + rng.normal(0, 0.01, 80))}, index=index)
+    stock = pd.DataFrame({"Close": 50 * np.cumprod(1 + rng.normal(0, 0.02, 80))}, index=index)
+    fetched = []
+
+    def fake_fetch(symbol, **_kwargs):
+        fetched.append(symbol)
+        return market
+
+    original = volatility.fetch_price_history
+    volatility.fetch_price_history = fake_fetch
+    try:
+        given = volatility.calculate_idio_vol("TEST", stock, market)
+        assert fetched == []
+        assert given["idio_vol"] is not None
+        assert given["total_vol"] >= given["idio_vol"]
+
+        # Only the market history missing - fetched, same answer
+        assert volatility.calculate_idio_vol("TEST", stock) == given
+        assert fetched == ["^GSPC"]
+
+        # No bars for the symbol - answered without fetching the market
+        assert volatility.calculate_idio_vol("BAD", stock.iloc[:0]) == {
+            "idio_vol": None, "total_vol": None,
+        }
+        assert fetched == ["^GSPC"]
+    finally:
+        volatility.fetch_price_history = original
+    print("✓ calculate_idio_vol with given histories works")
+
+
+def _batch_prefetch_fakes():
+    """No-network stand-ins for the batch screen's bulk prefetches"""
+    return {
+        "prefetch_momentum": lambda _symbols: 0,
+        "_prefetch_histories": lambda _symbols: {},
+        "fetch_market_history": lambda: None,
+    }
+
+
+def test_screen_batch_symbol_case():
+    """Test lower-case batch symbols find their yf.Tickers entry (keyed upper-case)"""
+    from yfinance_ux.services import tickers  # noqa: PLC0415
+
+    def fake_row(symbol, tickers, **_kwargs):
+        return {"symbol": symbol, "ticker": tickers[symbol].ticker}
+
+    with _patched(tickers, _screen_batch_row=fake_row, **_batch_prefetch_fakes()):
+        rows = tickers.get_ticker_screen_data_batch(["aapl", "brk.b", "AAPL"])
+        assert [row["ticker"] for row in rows] == ["AAPL", "BRK-B", "AAPL"]
+
+        # Streaming form: lazy, same rows in the same order
+        stream = tickers.get_ticker_screen_data_batch_stream(["msft", "aapl"])
+        assert next(stream)["ticker"] == "MSFT"
+        assert [row["ticker"] for row in stream] == ["AAPL"]
+        assert list(tickers.get_ticker_screen_data_batch_stream([])) == []
+    print("✓ get_ticker_screen_data_batch symbol case works")
+
+
+def test_screen_batch_stream_early_stop():
+    """Test closing a batch stream early neither waits on nor starts the remaining rows"""
+    from yfinance_ux.services import tickers  # noqa: PLC0415
+
+    started = []
+
+    def slow_row(symbol, **_kwargs):
+        started.append(symbol)
+        if symbol != "FAST":
+            time.sleep(0.5)
+        return {"symbol": symbol}
+
+    with _patched(tickers, _screen_batch_row=slow_row, **_batch_prefetch_fakes()):
+        stream = tickers.get_ticker_screen_data_batch_stream(
+            ["FAST", "SLOW", "NEVER"], max_workers=1,
+        )
+        assert next(stream) == {"symbol": "FAST"}
+        time.sleep(0.05)  # SLOW is now running, NEVER still queued
+        start = time.monotonic()
+        stream.close()
+        assert time.monotonic() - start < _PROMPT_SECONDS
+        time.sleep(0.6)
+        assert started == ["FAST", "SLOW"]
+    print("✓ get_ticker_screen_data_batch_stream early stop works")
+
+
+def test_screen_data_info_error_returns_promptly():
+    """Test a failing info fetch answers without waiting on the other lookups"""
+    from types import SimpleNamespace  # noqa: PLC0415
+
+    from yfinance_ux.services import tickers  # noqa: PLC0415
+
+    class BadTicker:
+        def __init__(self, symbol):
+            self.ticker = symbol
+
+        @property
+        def info(self):
+            msg = "no such symbol"
+            raise ValueError(msg)
+
+    def slow_options(_symbol, _expiration):
+        time.sleep(0.5)
+        return {}
+
+    with _patched(
+        tickers,
+        yf=SimpleNamespace(Ticker=BadTicker),
+        get_options_data=slow_options,
+        calculate_momentum=lambda _symbol, _ticker=None: {},
+        fetch_market_history=lambda: None,
+    ):
+        start = time.monotonic()
+        data = tickers.get_ticker_screen_data("BAD")
+        assert time.monotonic() - start < _PROMPT_SECONDS
+        assert data == {"symbol": "BAD", "error": "no such symbol"}
+        time.sleep(0.5)  # let the abandoned options lookup finish before restoring
+    print("✓ get_ticker_screen_data info error returns promptly")
+
+
+def test_screen_batch_row_no_history():
+    """Test a batch row with no daily bars skips the momentum lookups"""
+    import pandas as pd  # noqa: PLC0415
+
+    from yfinance_ux.services import tickers  # noqa: PLC0415
+
+    class FakeTicker:
+        calendar = None
+
+        def __init__(self):
+            self.info = {"longName": "Bad Co", "volume": 1, "averageVolume": 2}
+
+        def history(self, **_kwargs):
+            return pd.DataFrame()
+
+    called = []
+
+    def fake_momentum(symbol, _ticker=None):
+        called.append(symbol)
+        return {}
+
+    with _patched(tickers, calculate_momentum=fake_momentum):
+        row = tickers._screen_batch_row("BAD", {"BAD": FakeTicker()}, 0.0, market_hist=None)
+        assert called == []
+        assert row["name"] == "Bad Co"
+        assert row["momentum_1y"] is None
+        assert row["idio_vol"] is None
+    print("✓ batch row without history works")
+
+
+def test_records():
+    """Test _records matches to_dict("records") (with and without the index)"""
+    import pandas as pd  # noqa: PLC0415
+
+    from yfinance_ux.services.tickers import _records  # noqa: PLC0415
+
+    df = pd.DataFrame(
+        {"Shares": [10, 20], "Value": [1.5, None], "Text": ["Sale", "Buy"]},
+        index=pd.DatetimeIndex(["2025-01-01", "2025-01-02"], name="quarter"),
+    )
+    for frame in (df, df.rename_axis(None)):
+        for index in (False, True):
+            expected = (frame.reset_index() if index else frame).to_dict("records")
+            got = _records(frame, index=index)
+            assert [list(row) for row in got] == [list(row) for row in expected]
+            assert [[type(v) for v in row.values()] for row in got] == [
+                [type(v) for v in row.values()] for row in expected
+            ]
+            assert got[0] == expected[0]
+            assert got[1]["Shares"] == expected[1]["Shares"]
+    assert _records(df.head(0)) == []
+    print("✓ _records works")
+
+
+def test_calculate_rsi():
+    """Test the NumPy RSI matches the pandas rolling-mean definition"""
+    import numpy as np  # noqa: PLC0415
+    import pandas as pd  # noqa: PLC0415
+
+    from yfinance_ux.calculations.technical import calculate_rsi  # noqa: PLC0415
+
+    def rolling_rsi(prices, period=14):
+        delta = prices.diff()
+        gain = delta.where(delta > 0, 0).rolling(window=period).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        rsi = 100 - (100 / (1 + gain / loss))
+        return None if np.isnan(rsi.iloc[-1]) else float(rsi.iloc[-1])
+
+    closes = 100 + np.random.default_rng(7).standard_normal(22).cumsum()
+    gap = closes.copy()
+    gap[-2] = np.nan
+    for prices in (closes, closes[:14], gap):
+        expected = rolling_rsi(pd.Series(prices))
+        assert math.isclose(calculate_rsi(prices), expected, rel_tol=0, abs_tol=1e-9)
+        assert calculate_rsi(pd.Series(prices)) == calculate_rsi(prices)
+
+    max_rsi = 100.0
+    assert calculate_rsi(np.arange(20.0)) == max_rsi  # no losses
+    assert calculate_rsi(np.ones(20)) is None  # no movement
+    assert calculate_rsi(closes[:13]) is None  # too short
+    print("✓ calculate_rsi works")
+
+
 def test_single_ticker():
     """Test fetching single ticker data"""
     data = get_ticker_data("^GSPC")
@@ -58,6 +502,18 @@ if __name__ == "__main__":
     print("Testing core market_data module (independent of MCP)...\n")
 
     test_market_hours()
+    test_market_hours_at_instant()
+    test_price_at_date_memo()
+    test_price_history_ttl()
+    test_prefetch_prices_at_dates()
+    test_prefetch_histories()
+    test_idio_vol_given_histories()
+    test_screen_batch_symbol_case()
+    test_screen_batch_stream_early_stop()
+    test_screen_data_info_error_returns_promptly()
+    test_screen_batch_row_no_history()
+    test_records()
+    test_calculate_rsi()
     print()
 
     test_single_ticker()
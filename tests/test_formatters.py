@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test BBG Lite formatters on synthetic data (no network required).
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from mcp_yfinance_ux.formatters.tickers import (
+    _BATCH_NUMERIC_KEYS,
+    _batch_row,
+    format_options_summary,
+    format_ticker,
+    format_ticker_batch,
+    is_numeric,
+)
+
+TICKER_DATA = {
+    "symbol": "TEST",
+    "name": "Test Corp",
+    "price": 100.0,
+    "change": 1.5,
+    "change_percent": 1.52,
+    "fifty_two_week_high": 120.0,
+    "fifty_two_week_low": 80.0,
+    "insider_transactions": [{"Insider": "X", "Shares": 10, "Text": "Sale"}],
+}
+
+OPTIONS_DATA = {
+    "pc_ratio_oi": 0.7, "atm_call_iv": 30.0, "atm_put_iv": 31.0,
+    "expiration": "2025-01-17", "dte": 10, "hist_iv_data": {"iv_rank": 50.0},
+}
+
+
+def test_format_ticker_repeat_renders():
+    """Test repeat renders match, and bool/int values that compare equal render apart"""
+    first = format_ticker(TICKER_DATA)
+    assert format_ticker(dict(TICKER_DATA)) == first
+    assert "TICKER TEST" in first
+    assert format_ticker({**TICKER_DATA, "price": 110.0}) != first
+
+    # True == 1 but is_numeric rejects bool - each must render as a fresh render does
+    as_int = format_ticker({**TICKER_DATA, "rsi": 1})
+    as_bool = format_ticker({**TICKER_DATA, "rsi": True})
+    assert as_int != as_bool
+    assert format_ticker({**TICKER_DATA, "rsi": 1}) == as_int
+    print("✓ format_ticker repeat renders work")
+
+
+def test_format_options_summary_unhashable():
+    """Test inputs with unhashable values render"""
+    data = {**OPTIONS_DATA, "unusual_calls": {1, 2}}  # sets are unhashable
+    text = format_options_summary(data, 100.0)
+    assert "Unusual Activity:  2 calls" in text
+    assert format_options_summary(OPTIONS_DATA, 100.0).startswith("OPTIONS POSITIONING")
+    print("✓ format_options_summary unhashable values work")
+
+
+def test_format_ticker_nan_cells():
+    """Test NaN in earnings and price targets renders as N/A / omitted, not 'nan'"""
+    nan = float("nan")
+    data = {
+        **TICKER_DATA,
+        "earnings_history": [
+            {"quarter": "2024-12", "epsActual": nan, "epsEstimate": 1.0, "surprisePercent": nan},
+        ],
+        "analyst_price_targets": {"current": 100.0, "mean": nan, "median": 110.0,
+                                  "low": 90.0, "high": 130.0},
+    }
+    text = format_ticker(data)
+    assert "$nan" not in text
+    assert "nan%" not in text
+    assert "Mean Target" not in text
+    assert "Range:         $90.00 - $130.00" in text
+    assert "N/A" in text
+
+    # Missing dates come back from pandas as NaT (a datetime) - N/A, not "NaT"
+    nat = pd.NaT
+    data = {
+        **TICKER_DATA,
+        "insider_transactions": [{"Insider": "X", "Shares": 10, "Text": "Sale",
+                                  "Start Date": nat}],
+        "recent_upgrades": [{"GradeDate": nat, "Firm": "F", "ToGrade": "Buy"}],
+    }
+    text = format_ticker(data)
+    assert "NaT" not in text
+    assert f"{'N/A':<12} X" in text
+    assert f"{'N/A':<12} F" in text
+    print("✓ format_ticker NaN cells work")
+
+
+def test_is_numeric():
+    """Test is_numeric accepts int/float (and subclasses), rejects bool and placeholders"""
+    import numpy as np  # noqa: PLC0415
+
+    assert all(map(is_numeric, (1, 1.5, np.float64(2.0))))
+    assert not any(map(is_numeric, (None, "N/A", True, False, {}, [], "1.5")))
+    print("✓ is_numeric works")
+
+
+def test_format_ticker_batch_row_memo():
+    """Test batch rows are memoized per snapshot and tolerate unhashable values"""
+    _batch_row.cache_clear()
+    rows = [TICKER_DATA, {**TICKER_DATA, "symbol": "TWIN"}]
+    first = format_ticker_batch(rows)
+    assert _batch_row.cache_info().hits == 0  # same numbers, different symbol
+    assert "TEST     Test Corp" in first
+    assert "TWIN     Test Corp" in first
+    assert format_ticker_batch(rows) == first
+    assert _batch_row.cache_info().hits == len(rows)  # repeat call served from the memo
+
+    # A price change must re-render the row
+    moved = format_ticker_batch([{**TICKER_DATA, "price": 101.0}])
+    assert "101.00" in moved
+
+    # Fully populated rows (as the services return them) take the itemgetter path
+    full = dict.fromkeys(_BATCH_NUMERIC_KEYS, 1.0) | {"symbol": "FULL", "name": "Full Co"}
+    assert "FULL" in format_ticker_batch([full])
+
+    # True == 1, but a bool is not numeric - must not reuse the rsi=1 row
+    as_int = format_ticker_batch([{**TICKER_DATA, "rsi": 1}]).splitlines()[4]
+    as_bool = format_ticker_batch([{**TICKER_DATA, "rsi": True}]).splitlines()[4]
+    assert as_int.endswith("1.0")
+    assert not as_bool.endswith("1.0")
+
+    # Distinct NaN objects (as pandas hands back) share one memo entry
+    hits = _batch_row.cache_info().hits
+    format_ticker_batch([{**TICKER_DATA, "rsi": float("nan")}])
+    format_ticker_batch([{**TICKER_DATA, "rsi": float("nan")}])
+    assert _batch_row.cache_info().hits == hits + 1
+
+    odd = format_ticker_batch([{**TICKER_DATA, "rsi": ["not", "a", "number"]}])
+    assert "TEST     Test Corp" in odd
+    print("✓ format_ticker_batch row memo works")
+
+
+if __name__ == "__main__":
+    print("Testing formatters...\n")
+
+    test_format_ticker_repeat_renders()
+    test_format_options_summary_unhashable()
+    test_format_ticker_nan_cells()
+    test_is_numeric()
+    test_format_ticker_batch_row_memo()
+    print()
+
+    print("All formatter tests passed! ✓")
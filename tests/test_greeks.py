@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Test greeks calculation module."""
 
+import math
 import sys
 from pathlib import Path
 
@@ -8,7 +9,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from yfinance_ux.calculations.greeks import calculate_greeks
+from yfinance_ux.calculations.greeks import calculate_greeks, calculate_greeks_batch
 
 
 def test_atm_call_greeks() -> None:
@@ -25,19 +26,19 @@ def test_atm_call_greeks() -> None:
     )
 
     # ATM call delta should be around 0.5 (slightly higher with positive risk-free rate)
-    assert 0.45 < greeks["delta"] < 0.65, f"ATM call delta {greeks['delta']} not near 0.5"
+    assert 0.45 < greeks.delta < 0.65, f"ATM call delta {greeks.delta} not near 0.5"
 
     # Gamma should be positive
-    assert greeks["gamma"] > 0, "Gamma should be positive"
+    assert greeks.gamma > 0, "Gamma should be positive"
 
     # Vega should be positive
-    assert greeks["vega"] > 0, "Vega should be positive"
+    assert greeks.vega > 0, "Vega should be positive"
 
     # Theta should be negative (time decay)
-    assert greeks["theta"] < 0, "Theta should be negative"
+    assert greeks.theta < 0, "Theta should be negative"
 
-    print(f"✓ ATM call greeks: delta={greeks['delta']:.3f}, gamma={greeks['gamma']:.3f}, "
-          f"vega={greeks['vega']:.3f}, theta={greeks['theta']:.3f}")
+    print(f"✓ ATM call greeks: delta={greeks.delta:.3f}, gamma={greeks.gamma:.3f}, "
+          f"vega={greeks.vega:.3f}, theta={greeks.theta:.3f}")
 
 
 def test_atm_put_greeks() -> None:
@@ -53,19 +54,19 @@ def test_atm_put_greeks() -> None:
     )
 
     # ATM put delta should be around -0.5 (slightly less negative with positive risk-free rate)
-    assert -0.65 < greeks["delta"] < -0.35, f"ATM put delta {greeks['delta']} not near -0.5"
+    assert -0.65 < greeks.delta < -0.35, f"ATM put delta {greeks.delta} not near -0.5"
 
     # Gamma should be positive (same as call)
-    assert greeks["gamma"] > 0, "Gamma should be positive"
+    assert greeks.gamma > 0, "Gamma should be positive"
 
     # Vega should be positive (same as call)
-    assert greeks["vega"] > 0, "Vega should be positive"
+    assert greeks.vega > 0, "Vega should be positive"
 
     # Theta should be negative
-    assert greeks["theta"] < 0, "Theta should be negative"
+    assert greeks.theta < 0, "Theta should be negative"
 
-    print(f"✓ ATM put greeks: delta={greeks['delta']:.3f}, gamma={greeks['gamma']:.3f}, "
-          f"vega={greeks['vega']:.3f}, theta={greeks['theta']:.3f}")
+    print(f"✓ ATM put greeks: delta={greeks.delta:.3f}, gamma={greeks.gamma:.3f}, "
+          f"vega={greeks.vega:.3f}, theta={greeks.theta:.3f}")
 
 
 def test_itm_call_greeks() -> None:
@@ -82,9 +83,9 @@ def test_itm_call_greeks() -> None:
     )
 
     # ITM call delta should be > 0.5
-    assert greeks["delta"] > 0.5, "ITM call delta should be > 0.5"
+    assert greeks.delta > 0.5, "ITM call delta should be > 0.5"
 
-    print(f"✓ ITM call delta: {greeks['delta']:.3f} (> 0.5)")
+    print(f"✓ ITM call delta: {greeks.delta:.3f} (> 0.5)")
 
 
 def test_otm_call_greeks() -> None:
@@ -101,9 +102,9 @@ def test_otm_call_greeks() -> None:
     )
 
     # OTM call delta should be < 0.5
-    assert greeks["delta"] < 0.5, "OTM call delta should be < 0.5"
+    assert greeks.delta < 0.5, "OTM call delta should be < 0.5"
 
-    print(f"✓ OTM call delta: {greeks['delta']:.3f} (< 0.5)")
+    print(f"✓ OTM call delta: {greeks.delta:.3f} (< 0.5)")
 
 
 def test_expired_option() -> None:
@@ -120,10 +121,18 @@ def test_expired_option() -> None:
     )
 
     # Expired ITM call should have delta = 1
-    assert greeks["delta"] == 1.0, "Expired ITM call delta should be 1.0"
-    assert greeks["gamma"] == 0.0, "Expired option gamma should be 0"
-    assert greeks["vega"] == 0.0, "Expired option vega should be 0"
-    assert greeks["theta"] == 0.0, "Expired option theta should be 0"
+    assert greeks.delta == 1.0, "Expired ITM call delta should be 1.0"
+    assert greeks.gamma == 0.0, "Expired option gamma should be 0"
+    assert greeks.vega == 0.0, "Expired option vega should be 0"
+    assert greeks.theta == 0.0, "Expired option theta should be 0"
+
+    # Zero volatility or a sliver of time left: intrinsic greeks, no division by zero
+    for time_to_expiry, vol in ((0.25, 0.0), (1e-9, 0.25)):
+        call = calculate_greeks(110.0, 100.0, time_to_expiry, vol, 0.045, 0.0, "call")
+        put = calculate_greeks(110.0, 100.0, time_to_expiry, vol, 0.045, 0.0, "put")
+        assert call == (1.0, 0.0, 0.0, 0.0, 0.0)
+        assert call._asdict() == {"delta": 1.0, "gamma": 0.0, "vega": 0.0, "theta": 0.0, "rho": 0.0}
+        assert (put.delta, put.gamma) == (0.0, 0.0)
 
     print("✓ Expired option greeks correct")
 
@@ -158,21 +167,56 @@ def test_put_call_parity() -> None:
     )
 
     # Call delta - Put delta should be close to 1 (adjusted for dividends)
-    delta_diff = call_greeks["delta"] - put_greeks["delta"]
+    delta_diff = call_greeks.delta - put_greeks.delta
     expected_diff = 1.0  # For non-dividend stocks
     assert abs(delta_diff - expected_diff) < 0.01, \
         f"Put-call parity: delta diff {delta_diff:.3f} should be near {expected_diff}"
 
     # Gamma should be the same
-    assert abs(call_greeks["gamma"] - put_greeks["gamma"]) < 0.001, \
+    assert abs(call_greeks.gamma - put_greeks.gamma) < 0.001, \
         "Gamma should be same for call and put"
 
     # Vega should be the same
-    assert abs(call_greeks["vega"] - put_greeks["vega"]) < 0.001, \
+    assert abs(call_greeks.vega - put_greeks.vega) < 0.001, \
         "Vega should be same for call and put"
 
     print(f"✓ Put-call parity: delta diff={delta_diff:.3f}, "
-          f"gamma same={abs(call_greeks['gamma'] - put_greeks['gamma']) < 0.001}")
+          f"gamma same={abs(call_greeks.gamma - put_greeks.gamma) < 0.001}")
+
+
+def test_greeks_batch_matches_scalar() -> None:
+    """Test vectorized chain greeks match per-strike calculate_greeks."""
+    strikes = [80.0, 95.0, 100.0, 110.0, 130.0]
+    vols = [0.35, 0.28, 0.25, 0.27, 0.4]
+
+    for option_type in ("call", "put"):
+        batch = calculate_greeks_batch(
+            100.0, strikes, 0.25, vols,
+            risk_free_rate=0.045, dividend_yield=0.01, option_type=option_type,
+        )
+        for i, (strike, vol) in enumerate(zip(strikes, vols, strict=True)):
+            greeks = calculate_greeks(100.0, strike, 0.25, vol, 0.045, 0.01, option_type)
+            for key, value in greeks._asdict().items():
+                assert math.isclose(batch[key][i], value, rel_tol=0, abs_tol=1e-12), \
+                    f"{option_type} {key} at {strike}: {batch[key][i]} != {value}"
+
+    # Zero IV gives no finite greeks -> zeros; expired keeps intrinsic delta
+    zero_iv = calculate_greeks_batch(100.0, [100.0], 0.25, [0.0], risk_free_rate=0.045)
+    assert all(zero_iv[key][0] == 0.0 for key in zero_iv)
+    expired = calculate_greeks_batch(
+        100.0, [90.0, 110.0], 0.0, [0.3, 0.3], risk_free_rate=0.045, option_type="put"
+    )
+    assert list(expired["delta"]) == [0.0, -1.0]
+    assert list(expired["gamma"]) == [0.0, 0.0]
+
+    # Degenerate rows agree with the scalar guard
+    degenerate = calculate_greeks_batch(
+        110.0, [100.0, 100.0], [0.25, 1e-9], [0.0, 0.25], risk_free_rate=0.045
+    )
+    assert list(degenerate["delta"]) == [1.0, 1.0]
+    assert list(degenerate["vega"]) == [0.0, 0.0]
+
+    print("✓ Batch greeks match scalar greeks")
 
 
 if __name__ == "__main__":
@@ -184,5 +228,6 @@ if __name__ == "__main__":
     test_otm_call_greeks()
     test_expired_option()
     test_put_call_parity()
+    test_greeks_batch_matches_scalar()
 
     print("\nAll greeks tests passed! ✓")
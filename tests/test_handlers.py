@@ -46,6 +46,14 @@ def test_normalize_symbols_empty():
     print("✓ Edge case normalization works")
 
 
+def test_normalize_symbols_memo_isolated():
+    """Test memoized results are returned as fresh lists"""
+    first = normalize_symbols("tsla,f")
+    first.append("MUTATED")
+    assert normalize_symbols("tsla,f") == ["TSLA", "F"]
+    print("✓ Memoized normalization returns fresh lists")
+
+
 def test_call_tool_markets():
     """Test markets tool routing"""
     result = call_tool("markets", {})
@@ -114,6 +122,7 @@ if __name__ == "__main__":
     test_normalize_symbols_comma_separated()
     test_normalize_symbols_list()
     test_normalize_symbols_empty()
+    test_normalize_symbols_memo_isolated()
     print()
 
     # Integration tests (require network)
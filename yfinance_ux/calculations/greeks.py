@@ -1,13 +1,25 @@
 """Black-Scholes greeks calculation."""
 
-from math import exp, log, sqrt
-from typing import TypedDict
+from math import erfc, exp, log, sqrt
+from typing import NamedTuple, TypedDict
 
-from scipy.stats import norm
+import numpy as np
+import numpy.typing as npt
 
+# 1/sqrt(2*pi) for the standard normal density
+_INV_SQRT_2PI = 0.3989422804014327
 
-class Greeks(TypedDict):
-    """Greeks for an option position."""
+# 1/sqrt(2) for the standard normal CDF via erfc
+_INV_SQRT_2 = 0.7071067811865476
+
+# Time to expiry (years, ~0.3s) or volatility at or below which the option is
+# treated as having no time value: intrinsic delta, all other greeks zero. Below
+# this d1 is dominated by log(S/K) / (vol*sqrt(T)) and the greeks blow up.
+_DEGENERATE_TOL = 1e-8
+
+
+class Greeks(NamedTuple):
+    """Greeks for an option position (fixed-layout tuple, not a per-call dict)."""
 
     delta: float
     gamma: float
@@ -16,6 +28,29 @@ class Greeks(TypedDict):
     rho: float
 
 
+class GreeksArrays(TypedDict):
+    """Greeks for a chain of options, one array per greek (aligned with the strikes)."""
+
+    delta: npt.NDArray[np.float64]
+    gamma: npt.NDArray[np.float64]
+    vega: npt.NDArray[np.float64]
+    theta: npt.NDArray[np.float64]
+    rho: npt.NDArray[np.float64]
+
+
+def _npdf(x: float) -> float:
+    """Standard normal PDF (inline - avoids scipy.stats distribution dispatch)"""
+    return exp(-0.5 * x * x) * _INV_SQRT_2PI
+
+
+def _ndtr(x: float) -> float:
+    """Standard normal CDF from C math's erfc (no scipy import on the scalar path)
+
+    erfc rather than 1 + erf keeps full relative precision in the lower tail.
+    """
+    return 0.5 * erfc(-x * _INV_SQRT_2)
+
+
 def calculate_greeks(
     spot: float,
     strike: float,
@@ -38,107 +73,163 @@ def calculate_greeks(
         option_type: "call" or "put"
 
     Returns:
-        Dict with keys: delta, gamma, vega, theta, rho
+        Greeks(delta, gamma, vega, theta, rho) - fields are attributes (greeks.delta),
+        use ._asdict() for a dict
 
     Note:
         - Uses Black-Scholes model (European options)
         - American options may have different greeks (early exercise premium)
         - Approximation for educational/analysis use
+        - Expired (T <= 1e-8) or zero-volatility (vol <= 1e-8) options get intrinsic
+          greeks: delta is the moneyness indicator, the rest are zero
     """
-    # Handle edge cases
-    if time_to_expiry <= 0:
-        # Expired option
+    # Handle edge cases (skips the log/sqrt/exp work below)
+    if time_to_expiry <= _DEGENERATE_TOL or volatility <= _DEGENERATE_TOL:
+        # Expired or no volatility - intrinsic value only
         if option_type == "call":
             delta = 1.0 if spot > strike else 0.0
         else:
             delta = -1.0 if spot < strike else 0.0
-        return Greeks(
-            delta=delta,
-            gamma=0.0,
-            vega=0.0,
-            theta=0.0,
-            rho=0.0,
-        )
+        return Greeks(delta, 0.0, 0.0, 0.0, 0.0)
+
+    # Shared subexpressions (each transcendental evaluated once)
+    sqrt_t = sqrt(time_to_expiry)
+    vol_sqrt_t = volatility * sqrt_t
+    disc_q = exp(-dividend_yield * time_to_expiry)  # Dividend discount factor
+    disc_r = exp(-risk_free_rate * time_to_expiry)  # Rate discount factor
+    spot_q = spot * disc_q
+    strike_r = strike * disc_r
 
     # d1, d2 calculation
     d1 = (
         log(spot / strike)
-        + (risk_free_rate - dividend_yield + 0.5 * volatility**2) * time_to_expiry
-    ) / (volatility * sqrt(time_to_expiry))
-    d2 = d1 - volatility * sqrt(time_to_expiry)
+        + (risk_free_rate - dividend_yield + 0.5 * volatility * volatility) * time_to_expiry
+    ) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    pdf_d1 = _npdf(d1)
 
-    # Greeks (same formulas for calls/puts except delta/rho)
-    if option_type == "call":
-        delta = exp(-dividend_yield * time_to_expiry) * norm.cdf(d1)
-        rho = (
-            strike
-            * time_to_expiry
-            * exp(-risk_free_rate * time_to_expiry)
-            * norm.cdf(d2)
-            / 100
-        )  # /100 for 1% change
-    else:  # put
-        delta = -exp(-dividend_yield * time_to_expiry) * norm.cdf(-d1)
-        rho = (
-            -strike
-            * time_to_expiry
-            * exp(-risk_free_rate * time_to_expiry)
-            * norm.cdf(-d2)
-            / 100
-        )
-
-    # Gamma (same for calls and puts)
-    gamma = exp(-dividend_yield * time_to_expiry) * norm.pdf(d1) / (
-        spot * volatility * sqrt(time_to_expiry)
-    )
+    # Gamma and vega (same for calls and puts) - vega /100 for 1% volatility change
+    gamma = disc_q * pdf_d1 / (spot * vol_sqrt_t)
+    vega = spot_q * pdf_d1 * sqrt_t / 100
 
-    # Vega (same for calls and puts) - /100 for 1% volatility change
-    vega = (
-        spot
-        * exp(-dividend_yield * time_to_expiry)
-        * norm.pdf(d1)
-        * sqrt(time_to_expiry)
-        / 100
-    )
+    # Theta time-decay term (same for calls and puts)
+    decay = -spot_q * pdf_d1 * volatility / (2 * sqrt_t)
 
-    # Theta (different for calls/puts)
+    # Delta, rho, theta (call/put differ by the sign of d1/d2 and the carry terms)
     if option_type == "call":
+        cdf_d1 = _ndtr(d1)
+        cdf_d2 = _ndtr(d2)
+        delta = disc_q * cdf_d1
+        rho = strike_r * time_to_expiry * cdf_d2 / 100  # /100 for 1% change
         theta = (
-            -spot
-            * norm.pdf(d1)
-            * volatility
-            * exp(-dividend_yield * time_to_expiry)
-            / (2 * sqrt(time_to_expiry))
-            - risk_free_rate
-            * strike
-            * exp(-risk_free_rate * time_to_expiry)
-            * norm.cdf(d2)
-            + dividend_yield
-            * spot
-            * exp(-dividend_yield * time_to_expiry)
-            * norm.cdf(d1)
+            decay - risk_free_rate * strike_r * cdf_d2 + dividend_yield * spot_q * cdf_d1
         ) / 365  # Daily theta
-    else:
+    else:  # put
+        cdf_d1 = _ndtr(-d1)
+        cdf_d2 = _ndtr(-d2)
+        delta = -disc_q * cdf_d1
+        rho = -strike_r * time_to_expiry * cdf_d2 / 100
+        theta = (
+            decay + risk_free_rate * strike_r * cdf_d2 - dividend_yield * spot_q * cdf_d1
+        ) / 365
+
+    return Greeks(delta, gamma, vega, theta, rho)
+
+
+def calculate_greeks_batch(  # noqa: PLR0913
+    spot: float,
+    strikes: npt.ArrayLike,
+    time_to_expiry: npt.ArrayLike,  # years, scalar or per strike
+    volatilities: npt.ArrayLike,  # annual, as decimal, per strike
+    *,
+    risk_free_rate: float,
+    dividend_yield: float = 0.0,
+    option_type: str = "call",  # "call" or "put"
+) -> GreeksArrays:
+    """
+    Calculate Black-Scholes greeks for a whole chain at once (NumPy vectorized).
+
+    Same formulas as calculate_greeks(), evaluated over arrays: one ndtr/exp pass
+    per term for the chain instead of one Python call per strike.
+
+    Args:
+        spot: Current stock price
+        strikes: Option strike prices
+        time_to_expiry: Time to expiration in years (broadcast against strikes)
+        volatilities: Implied volatilities as decimals (broadcast against strikes)
+        risk_free_rate: Risk-free rate as decimal (0.045 = 4.5%)
+        dividend_yield: Dividend yield as decimal (0.02 = 2%)
+        option_type: "call" or "put" (applies to every strike)
+
+    Returns:
+        Dict of arrays with keys: delta, gamma, vega, theta, rho
+
+    Note:
+        - Expired or zero-volatility strikes (T or vol <= 1e-8) get calculate_greeks()'s
+          intrinsic delta, zeros otherwise
+        - Strikes whose inputs give no finite greeks (NaN vol, non-positive spot)
+          get all zeros, matching the per-row fallback the options service used
+    """
+    # Vectorized CDF; imported on first chain so module import stays scipy-free
+    from scipy.special import ndtr  # noqa: PLC0415
+
+    strike = np.asarray(strikes, dtype=np.float64)
+    t, vol = np.broadcast_arrays(
+        np.asarray(time_to_expiry, dtype=np.float64),
+        np.asarray(volatilities, dtype=np.float64),
+    )
+    t, vol, strike = np.broadcast_arrays(t, vol, strike)
+    is_call = option_type == "call"
+    expired = (t <= _DEGENERATE_TOL) | (vol <= _DEGENERATE_TOL)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Shared subexpressions (expired rows computed with T=vol=1, then masked out)
+        t_live = np.where(expired, 1.0, t)
+        vol = np.where(expired, 1.0, vol)
+        sqrt_t = np.sqrt(t_live)
+        vol_sqrt_t = vol * sqrt_t
+        disc_q = np.exp(-dividend_yield * t_live)
+        disc_r = np.exp(-risk_free_rate * t_live)
+        spot_q = spot * disc_q
+        strike_r = strike * disc_r
+
+        d1 = (
+            np.log(spot / strike)
+            + (risk_free_rate - dividend_yield + 0.5 * vol * vol) * t_live
+        ) / vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+        pdf_d1 = np.exp(-0.5 * d1 * d1) * _INV_SQRT_2PI
+
+        gamma = disc_q * pdf_d1 / (spot * vol_sqrt_t)
+        vega = spot_q * pdf_d1 * sqrt_t / 100
+        decay = -spot_q * pdf_d1 * vol / (2 * sqrt_t)
+
+        # Call/put differ by the sign of d1/d2 and the carry terms
+        sign = 1.0 if is_call else -1.0
+        cdf_d1 = ndtr(sign * d1)
+        cdf_d2 = ndtr(sign * d2)
+        delta = sign * disc_q * cdf_d1
+        rho = sign * strike_r * t_live * cdf_d2 / 100
         theta = (
-            -spot
-            * norm.pdf(d1)
-            * volatility
-            * exp(-dividend_yield * time_to_expiry)
-            / (2 * sqrt(time_to_expiry))
-            + risk_free_rate
-            * strike
-            * exp(-risk_free_rate * time_to_expiry)
-            * norm.cdf(-d2)
-            - dividend_yield
-            * spot
-            * exp(-dividend_yield * time_to_expiry)
-            * norm.cdf(-d1)
+            decay
+            - sign * risk_free_rate * strike_r * cdf_d2
+            + sign * dividend_yield * spot_q * cdf_d1
         ) / 365
 
-    return Greeks(
-        delta=delta,
-        gamma=gamma,
-        vega=vega,
-        theta=theta,
-        rho=rho,
+    # Rows with any non-finite greek fall back to zeros (as a per-row exception would)
+    greeks = np.stack((delta, gamma, vega, theta, rho))
+    greeks[:, ~np.isfinite(greeks).all(axis=0)] = 0.0
+
+    # Expired / zero volatility: intrinsic delta only
+    if expired.any():
+        greeks[:, expired] = 0.0
+        itm = (spot > strike) if is_call else (spot < strike)
+        greeks[0, expired] = np.where(itm[expired], sign, 0.0)
+
+    return GreeksArrays(
+        delta=greeks[0],
+        gamma=greeks[1],
+        vega=greeks[2],
+        theta=greeks[3],
+        rho=greeks[4],
     )
@@ -5,34 +5,62 @@ Optimized narrow window fetching for 1W, 1M, 1Y momentum.
 Fetches ~22 days total vs 252 days (91% reduction).
 """
 
+from collections.abc import Sequence
 from datetime import datetime, timedelta
+from typing import Any
 from zoneinfo import ZoneInfo
 
 import yfinance as yf  # type: ignore[import-untyped]
 
-from yfinance_ux.fetcher import fetch_price_at_date
+from yfinance_ux.fetcher import fetch_price_at_date, prefetch_prices_at_dates
 
+# US market timezone (constructed once at import)
+_NY_TZ = ZoneInfo("America/New_York")
 
-def calculate_momentum(symbol: str) -> dict[str, float | None]:
+
+def _lookback_dates(now: datetime) -> tuple[datetime, datetime, datetime]:
+    """Target dates for 1Y, 1M, 1W momentum"""
+    return now - timedelta(days=365), now - timedelta(days=30), now - timedelta(days=7)
+
+
+def prefetch_momentum(symbols: Sequence[str], timeout: float | None = None) -> int:
+    """
+    Bulk-load the lookback prices calculate_momentum needs for many symbols
+
+    One yf.download for all symbols warms the fetch_price_at_date memo, so the
+    per-symbol calculate_momentum calls that follow skip their history requests.
+    Waits at most timeout seconds (default: prefetch_prices_at_dates' own limit).
+    Returns the number of prices loaded (0 if the bulk fetch failed or timed out).
+    """
+    targets = _lookback_dates(datetime.now(_NY_TZ))
+    if timeout is None:
+        return prefetch_prices_at_dates(symbols, targets)
+    return prefetch_prices_at_dates(symbols, targets, timeout=timeout)
+
+
+def calculate_momentum(
+    symbol: str,
+    ticker: Any = None,  # yf.Ticker  # noqa: ANN401
+) -> dict[str, float | None]:
     """
     Calculate trailing returns (1W, 1M, 1Y) for momentum analysis
 
     Uses fast_info for current price + narrow window fetches for precise lookback dates
     Fetches ~22 days total vs 252 days (91% reduction)
+
+    Pass the caller's yf.Ticker as `ticker` to reuse its already-loaded fast_info.
     """
     try:
-        ticker = yf.Ticker(symbol)
+        if ticker is None:
+            ticker = yf.Ticker(symbol)
 
         # Get current price from fast_info (no fetch!)
-        current_price = ticker.fast_info.get("lastPrice")
+        current_price = ticker.fast_info.last_price
         if current_price is None:
             return {"momentum_1w": None, "momentum_1m": None, "momentum_1y": None}
 
         # Calculate target dates for precise lookback
-        now = datetime.now(ZoneInfo("America/New_York"))
-        date_1y_ago = now - timedelta(days=365)
-        date_1m_ago = now - timedelta(days=30)
-        date_1w_ago = now - timedelta(days=7)
+        date_1y_ago, date_1m_ago, date_1w_ago = _lookback_dates(datetime.now(_NY_TZ))
 
         # Fetch prices at specific dates (narrow windows, ~7-8 days each)
         price_1y_ago = fetch_price_at_date(symbol, date_1y_ago)
@@ -12,24 +12,29 @@ from yfinance_ux.common.constants import RSI_PERIOD
 
 
 def calculate_rsi(prices: Any, period: int = RSI_PERIOD) -> float | None:  # noqa: ANN401
-    """Calculate RSI (Relative Strength Index) for a price series"""
-    try:
-        # Calculate price changes
-        delta = prices.diff()
-
-        # Separate gains and losses
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-
-        # Calculate average gains and losses
-        avg_gain = gain.rolling(window=period).mean()
-        avg_loss = loss.rolling(window=period).mean()
+    """Calculate RSI (Relative Strength Index) for a price series
 
-        # Calculate RS and RSI
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-
-        # Return most recent RSI value
-        return float(rsi.iloc[-1]) if not np.isnan(rsi.iloc[-1]) else None
+    Simple-average RSI over the last `period` price changes. Works on the raw
+    float64 values (Series or array) - only the final window is evaluated, so
+    there is no rolling pass over the whole series. A missing price counts as
+    no change.
+    """
+    try:
+        values = np.asarray(prices, dtype=np.float64)
+        if period <= 0 or len(values) < period:
+            return None
+
+        # Last `period` price changes (with exactly `period` prices the first bar
+        # has no prior close - it adds nothing to either sum)
+        window = np.diff(values[-(period + 1):])
+
+        # Separate gains and losses (NaN changes count as neither)
+        gain = np.where(window > 0, window, 0.0).sum() / period
+        loss = np.where(window < 0, -window, 0.0).sum() / period
+
+        # Calculate RS and RSI (no losses: RSI 100; no movement at all: undefined)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - (100 / (1 + gain / loss))
+        return float(rsi) if not np.isnan(rsi) else None
     except Exception:
         return None
@@ -5,16 +5,47 @@ Idiosyncratic volatility (stock-specific risk) via factor regression.
 Separates total volatility into market beta and idiosyncratic components.
 """
 
+from typing import Any
+
 import numpy as np
 
-from yfinance_ux.fetcher import fetch_ticker_and_market
+from yfinance_ux.fetcher import fetch_price_history, fetch_ticker_and_market
+
+# Market factor for the regression (fetch_ticker_and_market's default index)
+_MARKET_SYMBOL = "^GSPC"
+
+
+def fetch_market_history() -> Any:  # Returns pd.DataFrame  # noqa: ANN401
+    """12 months of the market index, for calculate_idio_vol(market_hist=...)
 
+    Fetch once and pass to every symbol in a fan-out (the history is also
+    memoized briefly by fetch_price_history).
+    """
+    return fetch_price_history(_MARKET_SYMBOL, months=12)
 
-def calculate_idio_vol(symbol: str) -> dict[str, float | None]:
-    """Calculate idiosyncratic volatility (stock-specific risk after removing market exposure)"""
+
+def calculate_idio_vol(
+    symbol: str,
+    hist: Any = None,  # pd.DataFrame  # noqa: ANN401
+    market_hist: Any = None,  # pd.DataFrame  # noqa: ANN401
+) -> dict[str, float | None]:
+    """Calculate idiosyncratic volatility (stock-specific risk after removing market exposure)
+
+    Pass `hist` (the symbol's daily bars, about a year) and/or `market_hist`
+    (fetch_market_history()) when the caller already has them; missing ones
+    are fetched here. Returns are aligned on the dates both histories share.
+    """
     try:
-        # Fetch ticker and market data in parallel (12 months)
-        hist_ticker, hist_market = fetch_ticker_and_market(symbol, months=12)
+        if hist is not None and hist.empty:
+            # No bars for the symbol - nothing to regress, skip the market fetch
+            return {"idio_vol": None, "total_vol": None}
+        if hist is None and market_hist is None:
+            # Fetch ticker and market data in parallel (12 months)
+            hist, market_hist = fetch_ticker_and_market(
+                symbol, months=12, market_symbol=_MARKET_SYMBOL
+            )
+        hist_ticker = fetch_price_history(symbol, months=12) if hist is None else hist
+        hist_market = fetch_market_history() if market_hist is None else market_hist
 
         min_history_len = 30
         if hist_ticker.empty or hist_market.empty:
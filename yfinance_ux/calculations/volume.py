@@ -5,8 +5,42 @@ from zoneinfo import ZoneInfo
 
 from yfinance_ux.common.dates import is_market_open
 
+# US market timezone (constructed once at import)
+_NY_TZ = ZoneInfo("America/New_York")
 
-def calculate_relative_volume(volume: float | None, avg_volume: float | None) -> float | None:
+
+# Fraction of the session after which partial volume is extrapolated (avoids inflated
+# RVOL at 9:31 AM)
+_MIN_EXTRAPOLATION_FRACTION = 0.1
+
+# Session / futures-cycle lengths, so the fractions below need no datetime arithmetic
+_SECONDS_PER_SESSION = 6.5 * 3600  # 9:30 AM - 4:00 PM ET
+_SECONDS_PER_FUTURES_CYCLE = 24 * 3600  # 6 PM ET settlement to settlement
+
+
+def market_day_fraction(now: datetime | None = None) -> float:
+    """Fraction of the regular session (9:30 AM - 4:00 PM ET) elapsed at `now`
+
+    Returns 0.0 outside regular hours (no extrapolation). Compute once per request
+    and pass to calculate_relative_volume() for every symbol in a fan-out.
+    """
+    if now is None:
+        now = datetime.now(_NY_TZ)
+    if not is_market_open(now):
+        return 0.0
+
+    now = now.astimezone(_NY_TZ)
+    market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
+    if now <= market_open:
+        # Should not reach here (is_market_open() checks now >= market_open)
+        return 0.0
+    elapsed = (now - market_open).total_seconds()
+    return min(elapsed / _SECONDS_PER_SESSION, 1.0)
+
+
+def calculate_relative_volume(
+    volume: float | None, avg_volume: float | None, day_fraction: float | None = None
+) -> float | None:
     """Calculate relative volume with intraday extrapolation.
 
     During market hours, raw volume is partial (e.g., 2hrs into 6.5hr day).
@@ -19,6 +53,7 @@ def calculate_relative_volume(volume: float | None, avg_volume: float | None) ->
     Args:
         volume: Current volume
         avg_volume: Average volume (3-month baseline)
+        day_fraction: market_day_fraction() computed once by the caller (default: now)
 
     Returns:
         Relative volume (extrapolated if intraday), or None if inputs invalid
@@ -26,30 +61,15 @@ def calculate_relative_volume(volume: float | None, avg_volume: float | None) ->
     if volume is None or avg_volume is None or avg_volume <= 0:
         return None
 
-    # During regular market hours (9:30 AM - 4:00 PM ET): extrapolate partial volume
-    if is_market_open():
-        now = datetime.now(ZoneInfo("America/New_York"))
-        market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-        market_close = now.replace(hour=16, minute=0, second=0, microsecond=0)
-
-        if now > market_open:
-            elapsed = (now - market_open).total_seconds()
-            total_seconds = (market_close - market_open).total_seconds()
-            fraction = min(elapsed / total_seconds, 1.0)
-
-            # Extrapolate if we're at least 10% into the day (avoids inflated RVOL at 9:31 AM)
-            if fraction > 0.1:
-                extrapolated_volume = volume / fraction
-                return extrapolated_volume / avg_volume
-            else:
-                # Very early in session: use raw volume
-                return volume / avg_volume
-        else:
-            # Should not reach here (is_market_open() checks now >= market_open)
-            return volume / avg_volume
-    else:
-        # Pre-market or after-hours: use raw volume (no extrapolation)
-        return volume / avg_volume
+    if day_fraction is None:
+        day_fraction = market_day_fraction()
+
+    # During regular hours, at least 10% into the day: extrapolate partial volume
+    if day_fraction > _MIN_EXTRAPOLATION_FRACTION:
+        extrapolated_volume = volume / day_fraction
+        return extrapolated_volume / avg_volume
+    # Very early in session, pre-market or after-hours: use raw volume
+    return volume / avg_volume
 
 
 def calculate_relative_volume_futures(volume: float | None, avg_volume: float | None) -> float | None:
@@ -69,7 +89,7 @@ def calculate_relative_volume_futures(volume: float | None, avg_volume: float |
     if volume is None or avg_volume is None or avg_volume <= 0:
         return None
 
-    now = datetime.now(ZoneInfo("America/New_York"))
+    now = datetime.now(_NY_TZ)
 
     # Futures settlement is 6pm ET
     last_settlement = now.replace(hour=18, minute=0, second=0, microsecond=0)
@@ -80,8 +100,7 @@ def calculate_relative_volume_futures(volume: float | None, avg_volume: float |
 
     # Calculate hours since settlement
     elapsed = (now - last_settlement).total_seconds()
-    total_seconds = 24 * 60 * 60  # 24 hours
-    fraction = min(elapsed / total_seconds, 1.0)
+    fraction = min(elapsed / _SECONDS_PER_FUTURES_CYCLE, 1.0)
 
     # Extrapolate if we're at least 5% into the 24h cycle (avoids inflated RVOL at 6:01 PM)
     if fraction > 0.05:
@@ -24,6 +24,18 @@ IDIO_VOL_LOW_THRESHOLD = 15
 UNUSUAL_VOLUME_THRESHOLD = 2.0  # Relative volume threshold for unusual activity flag
 MAX_REASONABLE_RVOL = 100  # Cap for displaying relative volume (filter corrupted data)
 
+# Ticker screen signal thresholds (annotation labels in formatters)
+PC_RATIO_BULLISH_THRESHOLD = 0.8  # P/C (OI) below this reads bullish
+PC_RATIO_BEARISH_THRESHOLD = 1.2  # P/C (OI) above this reads bearish
+IV_RANK_EXPENSIVE_THRESHOLD = 80  # IV rank at/above this is expensive
+IV_RANK_CHEAP_THRESHOLD = 20  # IV rank at/below this is cheap
+VOL_MOMENTUM_TREND_THRESHOLD = 20  # 1W volume change (+/- %) flagged as a trend
+SHORT_PCT_MODERATE_THRESHOLD = 10  # Short % of float above this is notable
+SHORT_PCT_HIGH_THRESHOLD = 20  # Short % of float above this is squeeze risk
+CONSENSUS_BULLISH_PCT = 60  # Share of buy ratings above this reads bullish
+CONSENSUS_BEARISH_PCT = 40  # Share of sell ratings above this reads bearish
+EARNINGS_MISS_THRESHOLD = -2  # EPS surprise (%) below this is a miss
+
 # Category to symbol mappings (for get_market_snapshot)
 # Aligned with Paleologo factor framework
 CATEGORY_MAPPING: dict[str, list[str]] = {
@@ -5,15 +5,55 @@ Market hours detection for US, European, and Asian markets.
 Used for market status display and timing-aware data fetching.
 """
 
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
+from typing import Protocol
 from zoneinfo import ZoneInfo
 
 from yfinance_ux.common.constants import FRIDAY, SATURDAY, SUNDAY, WEEKEND_START_DAY
 
 
-def is_market_open() -> bool:
-    """Check if US market is currently open (9:30 AM - 4:00 PM ET, Mon-Fri)"""
-    now_et = datetime.now(ZoneInfo("America/New_York"))
+def _now_in(tz_name: str, now: datetime | None) -> datetime:
+    """Current time in tz_name, reusing a caller-supplied instant when given"""
+    if now is None:
+        return datetime.now(ZoneInfo(tz_name))
+    return now.astimezone(ZoneInfo(tz_name))
+
+
+class _MarketCheck(Protocol):
+    """Market-hours predicate, evaluated at `now` (default: current time)"""
+
+    def __call__(self, now: datetime | None = None) -> bool: ...
+
+
+def _per_minute(check: _MarketCheck) -> _MarketCheck:
+    """Memoize a market-hours check per wall-clock minute
+
+    Every open/close boundary falls on a whole minute (all zones used here have
+    whole-minute UTC offsets), so one evaluation at the minute start answers for
+    the whole minute. Lookups within the same minute skip the tz conversion.
+    """
+
+    @lru_cache(maxsize=4)
+    def at_minute(minute: int) -> bool:
+        return check(datetime.fromtimestamp(minute * 60, timezone.utc))
+
+    @wraps(check)
+    def wrapper(now: datetime | None = None) -> bool:
+        stamp = time.time() if now is None else now.timestamp()
+        return at_minute(int(stamp // 60))
+
+    return wrapper
+
+
+@_per_minute
+def is_market_open(now: datetime | None = None) -> bool:
+    """Check if US market is currently open (9:30 AM - 4:00 PM ET, Mon-Fri)
+
+    Pass `now` to evaluate several checks against one instant (one clock read per render).
+    """
+    now_et = _now_in("America/New_York", now)
 
     # Check if weekend
     if now_et.weekday() >= WEEKEND_START_DAY:
@@ -26,14 +66,15 @@ def is_market_open() -> bool:
     return market_open <= now_et < market_close
 
 
-def is_us_market_open() -> bool:
+def is_us_market_open(now: datetime | None = None) -> bool:
     """Check if US market is currently open (9:30 AM - 4:00 PM ET, Mon-Fri)"""
-    return is_market_open()
+    return is_market_open(now)
 
 
-def is_europe_market_open() -> bool:
+@_per_minute
+def is_europe_market_open(now: datetime | None = None) -> bool:
     """Check if European markets are open (9:00 AM - 5:30 PM CET, Mon-Fri)"""
-    now_cet = datetime.now(ZoneInfo("Europe/Paris"))
+    now_cet = _now_in("Europe/Paris", now)
 
     # Check if weekend
     if now_cet.weekday() >= WEEKEND_START_DAY:
@@ -46,9 +87,10 @@ def is_europe_market_open() -> bool:
     return market_open <= now_cet < market_close
 
 
-def is_asia_market_open() -> bool:
+@_per_minute
+def is_asia_market_open(now: datetime | None = None) -> bool:
     """Check if Asian markets are open (9:00 AM - 3:00 PM JST for Tokyo, Mon-Fri)"""
-    now_jst = datetime.now(ZoneInfo("Asia/Tokyo"))
+    now_jst = _now_in("Asia/Tokyo", now)
 
     # Check if weekend
     if now_jst.weekday() >= WEEKEND_START_DAY:
@@ -61,14 +103,15 @@ def is_asia_market_open() -> bool:
     return market_open <= now_jst < market_close
 
 
-def is_futures_open() -> bool:
+@_per_minute
+def is_futures_open(now: datetime | None = None) -> bool:
     """Check if CME futures markets are open
 
     CME futures trade nearly 24/5:
     - Sunday 6:00 PM ET through Friday 5:00 PM ET
     - Daily maintenance: 5:00 PM - 6:00 PM ET
     """
-    now_et = datetime.now(ZoneInfo("America/New_York"))
+    now_et = _now_in("America/New_York", now)
 
     # Friday after 5:00 PM ET - closed until Sunday 6:00 PM ET
     if now_et.weekday() == FRIDAY:
@@ -92,8 +135,17 @@ def is_futures_open() -> bool:
     return not (maintenance_start <= now_et < maintenance_end)
 
 
-def get_market_status(region: str) -> str:
-    """Get market status for a region"""
+def get_market_status(
+    region: str, now: datetime | None = None, is_open_hint: bool | None = None
+) -> str:
+    """Get market status for a region
+
+    Pass `is_open_hint` when the caller already knows whether the region is open
+    (e.g. is_market_open() for "us") to skip re-deriving it.
+    """
+    if is_open_hint is not None:
+        return "Open" if is_open_hint else "Closed"
+
     status_map = {
         "us": is_us_market_open,
         "europe": is_europe_market_open,
@@ -101,7 +153,7 @@ def get_market_status(region: str) -> str:
     }
 
     if region.lower() in status_map:
-        is_open = status_map[region.lower()]()
+        is_open = status_map[region.lower()](now)
         return "Open" if is_open else "Closed"
 
     return ""
@@ -3,7 +3,13 @@ Historical data fetching - optimized date range queries
 Separate from market_data.py business logic
 """
 
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime, timedelta
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -11,6 +17,37 @@ from zoneinfo import ZoneInfo
 import pandas as pd  # type: ignore[import-untyped]
 import yfinance as yf  # type: ignore[import-untyped]
 
+logger = logging.getLogger(__name__)
+
+# US market timezone (constructed once at import)
+_NY_TZ = ZoneInfo("America/New_York")
+
+# fetch_price_at_date memo: (symbol, target day, window) -> close. Lookback windows
+# end in the past, so the price is final and the key's day rolls it over daily.
+# Misses (None) are not stored, so a failed lookup is retried next call.
+_PRICE_AT_DATE_MAX_ENTRIES = 2048
+_price_at_date_cache: OrderedDict[tuple[str, str, int], float] = OrderedDict()
+_price_at_date_lock = threading.Lock()
+
+# Memo keys a bulk prefetch already covered, hit or miss. A target with no bar in
+# its window (new listing, holidays) is never memoized, so without this every
+# call would repeat the download. Keys carry their day; bounded like the memo.
+_price_prefetch_attempted: OrderedDict[tuple[str, str, int], None] = OrderedDict()
+
+# Bulk prefetch downloads run on their own pool, so callers wait at most
+# _PREFETCH_TIMEOUT_SECONDS; a late download still fills the memo when it lands
+_PREFETCH_TIMEOUT_SECONDS = 5.0
+_prefetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="price-prefetch")
+
+# fetch_price_history memo: (symbol, start, end, interval) -> (expires_at_mono, frame).
+# The window ends today, so the last bar can still move - entries live briefly.
+# Repeat lookups within the TTL (the market index behind every idio vol in a
+# batch, rescans in a session) skip the round trip. Empty frames are not stored.
+_HISTORY_TTL_SECONDS = 60.0
+_HISTORY_MAX_ENTRIES = 256
+_history_cache: OrderedDict[tuple[str, str, str, str], tuple[float, Any]] = OrderedDict()
+_history_lock = threading.Lock()
+
 
 def normalize_symbol(symbol: str) -> str | None:
     """
@@ -68,7 +105,7 @@ def calculate_date_range(months: int) -> tuple[str, str]:
     Returns:
         Tuple of (start_date, end_date) as ISO strings
     """
-    end_date = datetime.now(ZoneInfo("America/New_York"))
+    end_date = datetime.now(_NY_TZ)
     # Minimal buffer: ~5 trading days per month are weekends/holidays
     # For 12 months: ~252 trading days = ~365 calendar days
     calendar_days = int(months * 30.5)  # Avg days per month
@@ -95,10 +132,20 @@ def fetch_price_history(
 
     Returns:
         DataFrame with OHLCV data, empty DataFrame on error
+
+    Results are memoized for _HISTORY_TTL_SECONDS; callers get their own copy.
     """
+    start_date, end_date = calculate_date_range(months)
+    key = (symbol, start_date, end_date, interval)
+    now = time.monotonic()
+    with _history_lock:
+        entry = _history_cache.get(key)
+        if entry is not None and entry[0] > now:
+            _history_cache.move_to_end(key)
+            return entry[1].copy()
+
     try:
         ticker = yf.Ticker(symbol)
-        start_date, end_date = calculate_date_range(months)
 
         hist = ticker.history(
             start=start_date,
@@ -106,11 +153,19 @@ def fetch_price_history(
             interval=interval
         )
 
-        return hist if not hist.empty else pd.DataFrame()
+        if hist.empty:
+            return pd.DataFrame()
 
     except Exception:
         return pd.DataFrame()
 
+    with _history_lock:
+        _history_cache[key] = (now + _HISTORY_TTL_SECONDS, hist)
+        _history_cache.move_to_end(key)
+        while len(_history_cache) > _HISTORY_MAX_ENTRIES:
+            _history_cache.popitem(last=False)
+    return hist.copy()
+
 
 def fetch_multiple_histories(
     symbols: list[str],
@@ -238,13 +293,156 @@ def fetch_price_at_date(
 
     Returns:
         Price (float) or None if not available
+
+    Windows that end before today are memoized per (symbol, day, window_days).
     """
+    end_date = target_date + timedelta(days=window_days)
+    end = end_date.strftime("%Y-%m-%d")
+    key = _price_at_date_key(symbol, target_date, window_days)
+    memoize = end_date.date() < datetime.now(end_date.tzinfo).date()
+    if memoize:
+        with _price_at_date_lock:
+            cached = _price_at_date_cache.get(key)
+            if cached is not None:
+                _price_at_date_cache.move_to_end(key)
+        if cached is not None:
+            return cached
+
+    price = _fetch_price_at_date_uncached(symbol, target_date, window_days, end)
+    if memoize and price is not None:
+        with _price_at_date_lock:
+            _price_at_date_cache[key] = price
+            if len(_price_at_date_cache) > _PRICE_AT_DATE_MAX_ENTRIES:
+                _price_at_date_cache.popitem(last=False)
+    return price
+
+
+def _price_at_date_key(
+    symbol: str, target_date: datetime, window_days: int
+) -> tuple[str, str, int]:
+    """fetch_price_at_date memo key"""
+    return (symbol, target_date.strftime("%Y-%m-%d"), window_days)
+
+
+def prefetch_prices_at_dates(
+    symbols: Sequence[str],
+    target_dates: Sequence[datetime],
+    window_days: int = 5,
+    timeout: float | None = _PREFETCH_TIMEOUT_SECONDS,
+) -> int:
+    """
+    Warm the fetch_price_at_date memo for many symbols with one bulk download
+
+    Pulls daily closes spanning every target window in a single yf.download
+    (one history request per symbol instead of one per symbol and date), then
+    stores each symbol's closest close to each target. Symbols already memoized
+    or already attempted for every date are skipped; targets with no close within
+    window_days are left for fetch_price_at_date to look up on its own.
+
+    Args:
+        symbols: Ticker symbols
+        target_dates: Past target dates (windows must end before today)
+        window_days: Window used by the later fetch_price_at_date calls
+        timeout: Seconds to wait for the download (None: no limit). A slow
+            download keeps running and still fills the memo when it lands.
+
+    Returns:
+        Number of prices stored (0 if the download failed or timed out)
+    """
+    if not target_dates:
+        return 0
+    with _price_at_date_lock:
+        pending = [
+            symbol for symbol in dict.fromkeys(symbols)
+            if any(
+                key not in _price_at_date_cache and key not in _price_prefetch_attempted
+                for key in (
+                    _price_at_date_key(symbol, target, window_days) for target in target_dates
+                )
+            )
+        ]
+        # Claimed up front, so concurrent callers don't queue the same download
+        attempted = [
+            _price_at_date_key(symbol, target, window_days)
+            for symbol in pending for target in target_dates
+        ]
+        _price_prefetch_attempted.update(dict.fromkeys(attempted))
+        while len(_price_prefetch_attempted) > _PRICE_AT_DATE_MAX_ENTRIES:
+            _price_prefetch_attempted.popitem(last=False)
+    if not pending:
+        return 0
+
+    future = _prefetch_pool.submit(
+        _prefetch_prices, pending, target_dates, window_days, attempted
+    )
+    try:
+        return future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        logger.debug("Bulk price prefetch still running after %ss", timeout)
+        return 0
+
+
+def _prefetch_prices(
+    pending: list[str],
+    target_dates: Sequence[datetime],
+    window_days: int,
+    attempted: list[tuple[str, str, int]],
+) -> int:
+    """prefetch_prices_at_dates' download and memo fill (run on _prefetch_pool)"""
+    window = timedelta(days=window_days)
+    start = (min(target_dates) - window).strftime("%Y-%m-%d")
+    end = (max(target_dates) + window).strftime("%Y-%m-%d")
+    try:
+        # ignore_tz=False keeps real bar instants (UTC across exchanges), so the
+        # closest-bar pick matches a per-symbol ticker.history() lookup
+        data = yf.download(
+            pending, start=start, end=end, interval="1d", group_by="ticker",
+            auto_adjust=True, ignore_tz=False, threads=True, progress=False,
+        )
+    except Exception as e:
+        logger.debug("Bulk price prefetch failed: %s", e)
+        # Not a verdict on the symbols - let a later call try again
+        with _price_at_date_lock:
+            for key in attempted:
+                _price_prefetch_attempted.pop(key, None)
+        return 0
+    if data is None or data.empty:
+        return 0
+
+    prices: dict[tuple[str, str, int], float] = {}
+    multi = isinstance(data.columns, pd.MultiIndex)
+    for symbol in pending:
+        try:
+            closes = (data[symbol] if multi else data)["Close"].dropna()
+            if closes.empty:
+                continue
+            for target in target_dates:
+                # Closest bar to the target day, as in fetch_price_at_date
+                target_ts = target.replace(hour=0, minute=0, second=0, microsecond=0)
+                diffs = abs(closes.index - target_ts)
+                pos = int(diffs.argmin())
+                if diffs[pos] <= window:
+                    key = _price_at_date_key(symbol, target, window_days)
+                    prices[key] = float(closes.iloc[pos])
+        except (KeyError, TypeError):  # symbol missing, or a tz-naive index
+            continue
+
+    with _price_at_date_lock:
+        _price_at_date_cache.update(prices)
+        while len(_price_at_date_cache) > _PRICE_AT_DATE_MAX_ENTRIES:
+            _price_at_date_cache.popitem(last=False)
+    return len(prices)
+
+
+def _fetch_price_at_date_uncached(
+    symbol: str, target_date: datetime, window_days: int, end: str
+) -> float | None:
+    """Closest close to target_date within the window (None if unavailable)"""
     try:
         ticker = yf.Ticker(symbol)
 
         # Fetch narrow window around target date
         start = (target_date - timedelta(days=window_days)).strftime("%Y-%m-%d")
-        end = (target_date + timedelta(days=window_days)).strftime("%Y-%m-%d")
 
         hist = ticker.history(start=start, end=end)
 
@@ -16,6 +16,7 @@ from yfinance_ux.services.sectors import get_sector_data
 from yfinance_ux.services.tickers import (
     get_ticker_screen_data,
     get_ticker_screen_data_batch,
+    get_ticker_screen_data_batch_stream,
 )
 
 __all__ = [
@@ -28,4 +29,5 @@ __all__ = [
     "get_ticker_history",
     "get_ticker_screen_data",
     "get_ticker_screen_data_batch",
+    "get_ticker_screen_data_batch_stream",
 ]
@@ -6,23 +6,60 @@ and parallel data fetching for multiple symbols.
 """
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime
+from functools import lru_cache, partial
 from typing import Any
 from zoneinfo import ZoneInfo
 
 import yfinance as yf  # type: ignore[import-untyped]
 
-from yfinance_ux.calculations.momentum import calculate_momentum
+from yfinance_ux.calculations.momentum import calculate_momentum, prefetch_momentum
 from yfinance_ux.calculations.volume import (
     calculate_relative_volume,
     calculate_relative_volume_futures,
+    market_day_fraction,
 )
 from yfinance_ux.common.constants import CATEGORY_MAPPING, MARKET_SYMBOLS
 from yfinance_ux.common.dates import is_market_open
 
 logger = logging.getLogger(__name__)
 
+# Thread cap for the parallel fan-outs below - the work is blocking network I/O,
+# so every symbol of a full screen gets its own worker (one wave, not waves of 10)
+_MAX_FETCH_WORKERS = 48
+
+# Wait budget for a fan-out: symbols still pending after this are returned as
+# errors and left behind, so one hung request can't stall the whole screen
+_FETCH_TIMEOUT_SECONDS = 10.0
+
+
+def _collect(
+    executor: ThreadPoolExecutor, future_to_key: dict[Future[dict[str, Any]], str]
+) -> dict[str, dict[str, Any]]:
+    """Gather fan-out results by key within _FETCH_TIMEOUT_SECONDS, then release the pool
+
+    The pool is shut down without waiting: queued fetches are cancelled and a
+    hung one is abandoned (its thread exits when the request returns).
+    """
+    results: dict[str, dict[str, Any]] = {}
+    try:
+        for future in as_completed(future_to_key, timeout=_FETCH_TIMEOUT_SECONDS):
+            key = future_to_key[future]
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                results[key] = {"symbol": key, "error": str(e)}
+    except FuturesTimeoutError:
+        late = [key for key in future_to_key.values() if key not in results]
+        for key in late:
+            results[key] = {"symbol": key, "error": "timeout"}
+        logger.warning("Timed out waiting for %d symbols: %s", len(late), late)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
 
 def get_ticker_data(symbol: str, include_momentum: bool = False) -> dict[str, Any]:
     """Fetch current data for a single ticker"""
@@ -49,9 +86,17 @@ def get_ticker_data(symbol: str, include_momentum: bool = False) -> dict[str, An
         return {"symbol": symbol, "error": str(e)}
 
 
-def get_ticker_full_data(symbol: str) -> dict[str, Any]:
+def get_ticker_full_data(
+    symbol: str,
+    day_fraction: float | None = None,
+    ticker: Any = None,  # yf.Ticker  # noqa: ANN401
+) -> dict[str, Any]:
     """Fetch comprehensive ticker data (price, momentum) for markets() screen using fast_info
 
+    Pass `day_fraction` (market_day_fraction()) when fetching many symbols for one
+    screen, so the session clock is read once instead of per symbol. `ticker` is an
+    optional yf.Ticker for symbol (e.g. from a shared yf.Tickers batch).
+
     RVOL Time Window: Uses 10-day average (fast_info.tenDayAverageVolume)
     - Rationale: FREE - already fetching fast_info for price data, no extra API call
     - Purpose: Quick market scan to spot recent momentum shifts
@@ -61,8 +106,9 @@ def get_ticker_full_data(symbol: str) -> dict[str, Any]:
     Different time windows serve different purposes - this is intentional, not a bug!
     """
     try:
-        logger.debug(f"yfinance API call: yf.Ticker('{symbol}')")
-        ticker = yf.Ticker(symbol)
+        if ticker is None:
+            logger.debug(f"yfinance API call: yf.Ticker('{symbol}')")
+            ticker = yf.Ticker(symbol)
 
         # Futures require special handling - fast_info.previousClose is wrong reference
         # Futures trade 24/7, so we need ticker.info.regularMarketChangePercent which
@@ -80,11 +126,13 @@ def get_ticker_full_data(symbol: str) -> dict[str, Any]:
         else:
             # Use fast_info for equities/ETFs (faster)
             # tenDayAverageVolume comes FREE with this call - no extra API cost
+            # Attribute access skips FastInfo.get's key scan and camelCase mapping
             logger.debug(f"yfinance API call: {symbol}.fast_info")
-            price = ticker.fast_info.get("lastPrice")
-            prev_close = ticker.fast_info.get("previousClose")
-            avg_volume = ticker.fast_info.get("tenDayAverageVolume")  # 10-day avg (FREE)
-            volume_today = ticker.fast_info.get("lastVolume")
+            fast_info = ticker.fast_info
+            price = fast_info.last_price
+            prev_close = fast_info.previous_close
+            avg_volume = fast_info.ten_day_average_volume  # 10-day avg (FREE)
+            volume_today = fast_info.last_volume
 
             # Calculate change percent from fast_info data
             change_pct = None
@@ -97,10 +145,10 @@ def get_ticker_full_data(symbol: str) -> dict[str, Any]:
         if is_futures:
             rel_volume = calculate_relative_volume_futures(volume_today, avg_volume)
         else:
-            rel_volume = calculate_relative_volume(volume_today, avg_volume)
+            rel_volume = calculate_relative_volume(volume_today, avg_volume, day_fraction)
 
-        # Get momentum (already optimized with narrow windows)
-        momentum = calculate_momentum(symbol)
+        # Get momentum (already optimized with narrow windows; reuses fast_info above)
+        momentum = calculate_momentum(symbol, ticker)
 
         logger.debug(f"yfinance API call SUCCESS: {symbol} (price={price}, change={change_pct:.2f}%)")
         return {
@@ -116,61 +164,69 @@ def get_ticker_full_data(symbol: str) -> dict[str, Any]:
         return {"symbol": symbol, "error": str(e)}
 
 
-def get_market_snapshot(
-    categories: list[str],
-    show_momentum: bool = False
-) -> dict[str, dict[str, Any]]:
-    """Get snapshot of multiple market categories"""
-    # Auto-detect: if no categories specified, show comprehensive global view with factors
-    if not categories:
-        if is_market_open():
-            categories = ["us", "volatility", "commodities", "rates", "sectors", "styles",
-                         "crypto", "europe", "asia", "currencies"]
-        else:
-            categories = ["futures", "volatility", "commodities", "rates", "sectors", "styles",
-                         "crypto", "europe", "asia", "currencies"]
+# Default snapshot categories (comprehensive global view with factors)
+_OPEN_CATEGORIES = ("us", "volatility", "commodities", "rates", "sectors", "styles",
+                    "crypto", "europe", "asia", "currencies")
+_CLOSED_CATEGORIES = ("futures", "volatility", "commodities", "rates", "sectors", "styles",
+                      "crypto", "europe", "asia", "currencies")
 
-    # Build symbol list based on categories
-    symbols_to_fetch: list[str] = []
+
+@lru_cache(maxsize=32)
+def _resolve_fetch_list(categories: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """(key, symbol) pairs for categories, resolved once per distinct categories tuple"""
+    # Build symbol key list based on categories - an ordered set, so a key shared
+    # by overlapping categories (or repeated) is fetched once
+    keys_to_fetch: dict[str, None] = {}
     for cat in categories:
         category = cat.lower()
         # Performance: O(1) dict lookup instead of if/elif chain
         if category in CATEGORY_MAPPING:
-            symbols_to_fetch.extend(CATEGORY_MAPPING[category])
+            keys_to_fetch.update(dict.fromkeys(CATEGORY_MAPPING[category]))
         elif category in MARKET_SYMBOLS:
             # Check if it's a specific symbol key
-            symbols_to_fetch.append(category)
+            keys_to_fetch[category] = None
 
     # Build list of (key, symbol) pairs to fetch
-    fetch_list = [
+    return tuple(
         (key, symbol)
-        for key in symbols_to_fetch
+        for key in keys_to_fetch
         if (symbol := MARKET_SYMBOLS.get(key)) is not None
-    ]
-
-    # Fetch data in parallel using ThreadPoolExecutor
-    # Performance: Parallel I/O (network requests) instead of sequential
-    results: dict[str, dict[str, Any]] = {}
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        # Submit all fetch tasks
-        future_to_key = {
-            executor.submit(get_ticker_data, symbol, show_momentum): key
-            for key, symbol in fetch_list
-        }
+    )
 
-        # Collect results as they complete
-        for future in as_completed(future_to_key):
-            key = future_to_key[future]
-            try:
-                results[key] = future.result()
-            except Exception as e:
-                results[key] = {"symbol": key, "error": str(e)}
-
-    return results
 
+def get_market_snapshot(
+    categories: list[str],
+    show_momentum: bool = False
+) -> dict[str, dict[str, Any]]:
+    """Get snapshot of multiple market categories"""
+    # Auto-detect: if no categories specified, show comprehensive global view with factors
+    if not categories:
+        fetch_list = _resolve_fetch_list(
+            _OPEN_CATEGORIES if is_market_open() else _CLOSED_CATEGORIES
+        )
+    else:
+        fetch_list = _resolve_fetch_list(tuple(categories))
 
-def get_ticker_history(symbol: str, period: str = "1mo") -> dict[str, Any]:
-    """Get historical price data for a ticker"""
+    # Fetch data in parallel using ThreadPoolExecutor
+    # Performance: Parallel I/O (network requests) instead of sequential
+    workers = max(1, min(len(fetch_list), _MAX_FETCH_WORKERS))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    future_to_key = {
+        executor.submit(get_ticker_data, symbol, show_momentum): key
+        for key, symbol in fetch_list
+    }
+    return _collect(executor, future_to_key)
+
+
+def get_ticker_history(
+    symbol: str, period: str = "1mo", records: bool = True
+) -> dict[str, Any]:
+    """Get historical price data for a ticker
+
+    `records=True` returns "data" as one dict per row. `records=False` returns it
+    columnar instead - {column: ndarray}, plus "index" as a UTC datetime64[ns]
+    array - skipping the per-row dicts and value boxing for long histories.
+    """
     try:
         ticker = yf.Ticker(symbol)
         hist = ticker.history(period=period)
@@ -178,6 +234,16 @@ def get_ticker_history(symbol: str, period: str = "1mo") -> dict[str, Any]:
         if hist.empty:
             return {"error": f"No historical data found for {symbol}"}
 
+        if not records:
+            return {
+                "symbol": symbol,
+                "period": period,
+                "data": {col: hist[col].to_numpy() for col in hist.columns},
+                "index": hist.index.to_numpy(dtype="datetime64[ns]"),
+                "start_date": hist.index[0].isoformat(),
+                "end_date": hist.index[-1].isoformat(),
+            }
+
         return {
             "symbol": symbol,
             "period": period,
@@ -250,19 +316,18 @@ def get_markets_data() -> dict[str, dict[str, Any]]:
         ("us10y", "^TNX"),
     ]
 
-    # Fetch in parallel
-    results: dict[str, dict[str, Any]] = {}
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        future_to_key = {
-            executor.submit(get_ticker_full_data, symbol): key
-            for key, symbol in symbols_to_fetch
-        }
-
-        for future in as_completed(future_to_key):
-            key = future_to_key[future]
-            try:
-                results[key] = future.result()
-            except Exception as e:
-                results[key] = {"symbol": key, "error": str(e)}
-
-    return results
+    # One yf.Tickers for the whole screen: a single shared session, and each
+    # Ticker's fast_info is loaded once for both price and momentum
+    tickers = yf.Tickers(" ".join(symbol for _, symbol in symbols_to_fetch)).tickers
+
+    # Momentum lookback prices for every symbol in one bulk download
+    prefetch_momentum(list(tickers))
+
+    # Fetch in parallel (session fraction read once for every symbol)
+    fetch = partial(get_ticker_full_data, day_fraction=market_day_fraction())
+    executor = ThreadPoolExecutor(max_workers=min(len(symbols_to_fetch), _MAX_FETCH_WORKERS))
+    future_to_key = {
+        executor.submit(fetch, symbol, ticker=tickers.get(symbol)): key
+        for key, symbol in symbols_to_fetch
+    }
+    return _collect(executor, future_to_key)
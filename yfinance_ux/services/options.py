@@ -11,9 +11,12 @@ from zoneinfo import ZoneInfo
 
 import yfinance as yf  # type: ignore[import-untyped]
 
-from yfinance_ux.calculations.greeks import calculate_greeks
+from yfinance_ux.calculations.greeks import calculate_greeks_batch
 from yfinance_ux.common.symbols import normalize_ticker_symbol
 
+# US market timezone (constructed once at import)
+_NY_TZ = ZoneInfo("America/New_York")
+
 
 def get_risk_free_rate() -> float:
     """
@@ -78,40 +81,26 @@ def get_options_data(symbol: str, expiration: str = "nearest") -> dict[str, Any]
 
         # Days to expiration
         exp_datetime = datetime.strptime(exp_date, "%Y-%m-%d").replace(
-            tzinfo=ZoneInfo("America/New_York")
+            tzinfo=_NY_TZ
         )
-        now = datetime.now(ZoneInfo("America/New_York"))
+        now = datetime.now(_NY_TZ)
         dte = (exp_datetime - now).days
         time_to_expiry = max(dte / 365.0, 0.001)  # Prevent division by zero
 
-        # Calculate greeks for each option
-        def add_greeks(row: Any, option_type: str) -> Any:
-            """Add greeks to option row."""
-            try:
-                greeks = calculate_greeks(
-                    spot=current_price,
-                    strike=row["strike"],
-                    time_to_expiry=time_to_expiry,
-                    volatility=row["impliedVolatility"],
-                    risk_free_rate=risk_free_rate,
-                    dividend_yield=dividend_yield,
-                    option_type=option_type,
-                )
-                row["delta"] = greeks["delta"]
-                row["gamma"] = greeks["gamma"]
-                row["vega"] = greeks["vega"]
-                row["theta"] = greeks["theta"]
-                row["rho"] = greeks["rho"]
-            except Exception:
-                row["delta"] = 0.0
-                row["gamma"] = 0.0
-                row["vega"] = 0.0
-                row["theta"] = 0.0
-                row["rho"] = 0.0
-            return row
-
-        calls = calls.apply(lambda row: add_greeks(row, "call"), axis=1)
-        puts = puts.apply(lambda row: add_greeks(row, "put"), axis=1)
+        # Calculate greeks for the whole chain at once (vectorized over strikes;
+        # strikes with no finite greeks, e.g. zero IV, get zeros)
+        for chain, option_type in ((calls, "call"), (puts, "put")):
+            greeks = calculate_greeks_batch(
+                spot=current_price,
+                strikes=chain["strike"].to_numpy(dtype=float),
+                time_to_expiry=time_to_expiry,
+                volatilities=chain["impliedVolatility"].to_numpy(dtype=float),
+                risk_free_rate=risk_free_rate,
+                dividend_yield=dividend_yield,
+                option_type=option_type,
+            )
+            for name, values in greeks.items():
+                chain[name] = values
 
         # Calculate positioning metrics
         call_oi_total = int(calls["openInterest"].sum())
@@ -209,9 +198,9 @@ def get_options_data(symbol: str, expiration: str = "nearest") -> dict[str, Any]
 
                 # Days to expiration
                 exp_datetime = datetime.strptime(exp, "%Y-%m-%d").replace(
-                    tzinfo=ZoneInfo("America/New_York")
+                    tzinfo=_NY_TZ
                 )
-                now = datetime.now(ZoneInfo("America/New_York"))
+                now = datetime.now(_NY_TZ)
                 dte = (exp_datetime - now).days
 
                 term_structure.append({"expiration": exp, "dte": dte, "iv": iv_exp})
@@ -253,9 +242,9 @@ def get_options_data(symbol: str, expiration: str = "nearest") -> dict[str, Any]
 
                 # DTE
                 exp_datetime = datetime.strptime(exp, "%Y-%m-%d").replace(
-                    tzinfo=ZoneInfo("America/New_York")
+                    tzinfo=_NY_TZ
                 )
-                now = datetime.now(ZoneInfo("America/New_York"))
+                now = datetime.now(_NY_TZ)
                 dte_exp = (exp_datetime - now).days
 
                 all_expirations.append({
@@ -332,13 +321,13 @@ def get_options_data(symbol: str, expiration: str = "nearest") -> dict[str, Any]
 
         # Days to expiration
         exp_datetime = datetime.strptime(exp_date, "%Y-%m-%d").replace(
-            tzinfo=ZoneInfo("America/New_York")
+            tzinfo=_NY_TZ
         )
-        now = datetime.now(ZoneInfo("America/New_York"))
+        now = datetime.now(_NY_TZ)
         dte = (exp_datetime - now).days
 
         # Timestamp
-        now = datetime.now(ZoneInfo("America/New_York"))
+        now = datetime.now(_NY_TZ)
         timestamp = now.strftime("%Y-%m-%d %H:%M %Z")
 
         return {
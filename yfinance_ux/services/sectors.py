@@ -10,7 +10,7 @@ from typing import Any
 
 import yfinance as yf  # type: ignore[import-untyped]
 
-from yfinance_ux.calculations.momentum import calculate_momentum
+from yfinance_ux.calculations.momentum import calculate_momentum, prefetch_momentum
 from yfinance_ux.common.constants import DISPLAY_NAMES, MARKET_SYMBOLS
 from yfinance_ux.services.markets import get_ticker_full_data
 
@@ -47,6 +47,9 @@ def get_sector_data(name: str) -> dict[str, Any]:
         # Get list of symbols for parallel fetch
         symbols = list(holdings_df.head(10).index)
 
+        # Momentum lookback prices for all holdings in one bulk download
+        prefetch_momentum(symbols)
+
         # Fetch all holdings data in parallel using ThreadPoolExecutor
         def fetch_holding_data(symbol: str) -> dict[str, Any]:
             """Fetch price and momentum data for a single holding"""
@@ -54,8 +57,9 @@ def get_sector_data(name: str) -> dict[str, Any]:
                 ticker = yf.Ticker(symbol)
 
                 # Use fast_info instead of info (much faster)
-                price = ticker.fast_info.get("lastPrice")
-                prev_close = ticker.fast_info.get("previousClose")
+                fast_info = ticker.fast_info
+                price = fast_info.last_price
+                prev_close = fast_info.previous_close
 
                 # Calculate change percent
                 change_pct = None
@@ -5,182 +5,229 @@ Comprehensive ticker analysis: price, factors, valuation, technicals, calendar,
 Supports both single and batch fetching (batch uses yf.Tickers for efficiency).
 """
 
-from datetime import datetime
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any
-from zoneinfo import ZoneInfo
 
+import pandas as pd
 import yfinance as yf  # type: ignore[import-untyped]
 
-from yfinance_ux.calculations.momentum import calculate_momentum
+from yfinance_ux.calculations.momentum import calculate_momentum, prefetch_momentum
 from yfinance_ux.calculations.technical import calculate_rsi
-from yfinance_ux.calculations.volatility import calculate_idio_vol
-from yfinance_ux.calculations.volume import calculate_relative_volume
+from yfinance_ux.calculations.volatility import calculate_idio_vol, fetch_market_history
+from yfinance_ux.calculations.volume import calculate_relative_volume, market_day_fraction
 from yfinance_ux.common.constants import RSI_PERIOD
 from yfinance_ux.common.symbols import normalize_ticker_symbol
 from yfinance_ux.services.options import get_options_data
 
+# One daily history per symbol feeds RSI, 1W volume momentum and idio vol
+# (idio vol regresses a year of returns; RSI/volume only read the last bars)
+_HISTORY_PERIOD = "1y"
 
-def get_ticker_screen_data(symbol: str) -> dict[str, Any]:
-    """Fetch comprehensive ticker data for ticker() screen
+# Momentum of a symbol with no price history (calculate_momentum's miss result)
+_NO_MOMENTUM: dict[str, float | None] = {
+    "momentum_1w": None, "momentum_1m": None, "momentum_1y": None,
+}
 
-    RVOL Time Window: Uses 3-month average (info.averageVolume)
-    - Rationale: FREE - already fetching info for P/E, market cap, earnings, etc.
-    - Purpose: Detailed analysis with stable baseline to filter noise
-    - Trade-off: Less sensitive to recent shifts, but more reliable context
 
-    Note: markets() screen uses 10-day average (fast_info.tenDayAverageVolume) for quick scans.
-    Different time windows serve different purposes - this is intentional, not a bug!
+def _history(ticker: Any) -> Any:  # noqa: ANN401
+    """Daily bars over _HISTORY_PERIOD, empty DataFrame if unavailable"""
+    try:
+        return ticker.history(period=_HISTORY_PERIOD, interval="1d")
+    except Exception:
+        return pd.DataFrame()
+
+
+def _history_stats(hist: Any) -> tuple[float | None, float | None]:  # noqa: ANN401
+    """(RSI, 1W volume momentum) from the latest daily OHLCV bars, (None, None) if unavailable"""
+    rsi = None
+    vol_momentum_1w = None
+    try:
+        if not hist.empty and len(hist) >= RSI_PERIOD:
+            rsi = calculate_rsi(hist["Close"].to_numpy())
+
+            # Calculate volume momentum (1W = 5 trading days)
+            # Shows if volume is trending up/down vs recent activity
+            # - Positive: Volume increasing (activity picking up)
+            # - Negative: Volume decreasing (cooling off)
+            # - Complements rel_volume: rel_volume = long-term context (vs 3mo avg)
+            #                           vol_momentum = short-term trend (vs last week)
+            # Example: (0.93x 3mo, +33% 1W) = near average overall, but heating up recently
+            if "Volume" in hist.columns and len(hist) >= 6:  # noqa: PLR2004
+                volumes = hist["Volume"].to_numpy()
+                recent_vol = volumes[-1]  # Today
+                week_ago_vol = volumes[-6]  # 5 trading days ago
+                if week_ago_vol > 0:
+                    vol_momentum_1w = ((recent_vol - week_ago_vol) / week_ago_vol) * 100
+    except Exception:
+        pass
+    return rsi, vol_momentum_1w
+
+
+def _prefetch_histories(symbols: list[str]) -> dict[str, Any]:
+    """_HISTORY_PERIOD of daily bars for many symbols in one bulk download
+
+    yf.download fetches the histories together instead of one ticker.history()
+    round trip per batch row. Symbols missing from the result (or the whole
+    batch, if the download fails) are left out; the caller falls back to
+    ticker.history() for them.
     """
     try:
-        symbol = normalize_ticker_symbol(symbol)
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        data = yf.download(
+            symbols, period=_HISTORY_PERIOD, interval="1d", group_by="ticker",
+            auto_adjust=True, ignore_tz=False, threads=True, progress=False,
+        )
+    except Exception:
+        return {}
+    if data is None or data.empty:
+        return {}
+    if not isinstance(data.columns, pd.MultiIndex):
+        return {symbols[0]: data} if len(symbols) == 1 else {}
+
+    frames: dict[str, Any] = {}
+    available = set(data.columns.get_level_values(0))
+    for symbol in symbols:
+        if symbol in available:
+            # Bulk frames are aligned on the union of bar instants (tz kept, as in
+            # ticker.history(), so idio vol can align them with the market index);
+            # drop the padding rows
+            hist = data[symbol].dropna(subset=["Close"])
+            if not hist.empty:
+                frames[symbol] = hist
+    return frames
 
-        # Basic price data
-        price = info.get("regularMarketPrice") or info.get("currentPrice")
-        change = info.get("regularMarketChange")
-        change_pct = info.get("regularMarketChangePercent")
-        market_cap = info.get("marketCap")
-        volume = info.get("volume")
-        avg_volume = info.get("averageVolume")  # 3-month avg (FREE with info call)
-        name = info.get("longName") or info.get("shortName") or symbol
 
-        # Volume analytics - extrapolate intraday volume
-        rel_volume = calculate_relative_volume(volume, avg_volume)
+def _records(df: Any, index: bool = False) -> list[dict[str, Any]]:  # noqa: ANN401
+    """Rows of df as dicts, like df.to_dict("records") (df.reset_index() first if index)
 
-        # Factor exposures
-        beta_spx = info.get("beta")
+    Zips the column names over itertuples() (native Python values, same as
+    to_dict) without building the reset_index() copy.
+    """
+    columns = df.columns.tolist()
+    if index:
+        columns.insert(0, "index" if df.index.name is None else df.index.name)
+    return [dict(zip(columns, row, strict=True)) for row in df.itertuples(index=index, name=None)]
 
-        # Valuation
-        trailing_pe = info.get("trailingPE")
-        forward_pe = info.get("forwardPE")
-        dividend_yield = info.get("dividendYield")
 
-        # Short interest (positioning)
-        short_pct_float = info.get("shortPercentOfFloat")
-        short_ratio = info.get("shortRatio")
+def _calendar(ticker: Any) -> Any:  # noqa: ANN401
+    """Calendar data (earnings and dividend dates), None if unavailable"""
+    try:
+        return ticker.calendar
+    except Exception:
+        return None  # Calendar not available for non-stocks (indices, ETFs, etc.)
 
-        # Technicals
-        fifty_day_avg = info.get("fiftyDayAverage")
-        two_hundred_day_avg = info.get("twoHundredDayAverage")
-        fifty_two_week_high = info.get("fiftyTwoWeekHigh")
-        fifty_two_week_low = info.get("fiftyTwoWeekLow")
 
-        # Get momentum
-        momentum = calculate_momentum(symbol)
+def _insider_transactions(ticker: Any) -> list[dict[str, Any]] | None:  # noqa: ANN401
+    """Most recent 10 insider transactions"""
+    try:
+        insider_df = ticker.insider_transactions
+        if not insider_df.empty:
+            return _records(insider_df.head(10))
+    except Exception:
+        pass
+    return None
 
-        # Get idio vol
-        vol_data = calculate_idio_vol(symbol)
 
-        # Calculate RSI and volume momentum
-        rsi = None
-        vol_momentum_1w = None
-        try:
-            hist = ticker.history(period="1mo", interval="1d")
-            if not hist.empty and len(hist) >= RSI_PERIOD:
-                rsi = calculate_rsi(hist["Close"])
-
-                # Calculate volume momentum (1W = 5 trading days)
-                # Shows if volume is trending up/down vs recent activity
-                # - Positive: Volume increasing (activity picking up)
-                # - Negative: Volume decreasing (cooling off)
-                # - Complements rel_volume: rel_volume = long-term context (vs 3mo avg)
-                #                           vol_momentum = short-term trend (vs last week)
-                # Example: (0.93x 3mo, +33% 1W) = near average overall, but heating up recently
-                if "Volume" in hist.columns and len(hist) >= 6:
-                    recent_vol = hist["Volume"].iloc[-1]  # Today
-                    week_ago_vol = hist["Volume"].iloc[-6]  # 5 trading days ago
-                    if week_ago_vol > 0:
-                        vol_momentum_1w = ((recent_vol - week_ago_vol) / week_ago_vol) * 100
-        except Exception:
-            pass
-
-        # Get calendar data (earnings and dividend dates)
-        calendar = None
-        try:  # noqa: SIM105
-            calendar = ticker.calendar
-        except Exception:
-            pass  # Calendar not available for non-stocks (indices, ETFs, etc.)
-
-        # Get options data
-        options_data = get_options_data(symbol, "nearest")
-
-        # Get insider transactions
-        insider_transactions = None
-        try:
-            insider_df = ticker.insider_transactions
-            if not insider_df.empty:
-                # Get most recent 10 transactions
-                insider_transactions = insider_df.head(10).to_dict('records')
-        except Exception:
-            pass
-
-        # Get analyst data
-        analyst_recommendations = None
-        analyst_price_targets = None
-        try:
-            # Recommendations summary (current month)
-            recs = ticker.recommendations
-            if recs is not None and not recs.empty:
-                analyst_recommendations = recs.iloc[0].to_dict()
-        except Exception:
-            pass
+def _analyst_recommendations(ticker: Any) -> dict[str, Any] | None:  # noqa: ANN401
+    """Recommendations summary (current month)"""
+    try:
+        recs = ticker.recommendations
+        if recs is not None and not recs.empty:
+            return dict(recs.iloc[0].to_dict())
+    except Exception:
+        pass
+    return None
 
-        try:
-            # Price targets consensus
-            analyst_price_targets = ticker.analyst_price_targets
-        except Exception:
-            pass
 
-        # Get earnings history
-        earnings_history = None
-        try:
-            earnings_df = ticker.earnings_history
-            if not earnings_df.empty:
-                # Get last 4 quarters, reset index to include quarter date
-                earnings_history = (
-                    earnings_df.tail(4).reset_index().to_dict('records')
-                )
-        except Exception:
-            pass
-
-        # Get recent upgrades/downgrades (last 10)
-        recent_upgrades = None
+def _analyst_price_targets(ticker: Any) -> Any:  # noqa: ANN401
+    """Price targets consensus"""
+    try:
+        return ticker.analyst_price_targets
+    except Exception:
+        return None
+
+
+def _earnings_history(ticker: Any) -> list[dict[str, Any]] | None:  # noqa: ANN401
+    """Last 4 quarters, index reset to include the quarter date"""
+    try:
+        earnings_df = ticker.earnings_history
+        if not earnings_df.empty:
+            return _records(earnings_df.tail(4), index=True)
+    except Exception:
+        pass
+    return None
+
+
+def _recent_upgrades(ticker: Any) -> list[dict[str, Any]] | None:  # noqa: ANN401
+    """Recent upgrades/downgrades (last 10)"""
+    try:
+        upgrades_df = ticker.upgrades_downgrades
+        if upgrades_df is not None and not upgrades_df.empty:
+            return _records(upgrades_df.head(10), index=True)
+    except Exception:
+        pass
+    return None
+
+
+# Independent per-ticker lookups for the ticker() screen, fetched concurrently.
+# Each runs on its own yf.Ticker (the lazy scrapers on one Ticker aren't
+# thread-safe; HTTP goes through yfinance's shared session either way).
+_SCREEN_LOOKUPS = (
+    _calendar,
+    _insider_transactions,
+    _analyst_recommendations,
+    _analyst_price_targets,
+    _earnings_history,
+    _recent_upgrades,
+)
+
+
+def get_ticker_screen_data(symbol: str) -> dict[str, Any]:
+    """Fetch comprehensive ticker data for ticker() screen
+
+    The info fetch and the other independent lookups (history, calendar, options,
+    insiders, analysts, earnings, momentum) run concurrently. One year of daily
+    bars feeds RSI, volume momentum and idio vol.
+
+    RVOL Time Window: Uses 3-month average (info.averageVolume)
+    - Rationale: FREE - already fetching info for P/E, market cap, earnings, etc.
+    - Purpose: Detailed analysis with stable baseline to filter noise
+    - Trade-off: Less sensitive to recent shifts, but more reliable context
+
+    Note: markets() screen uses 10-day average (fast_info.tenDayAverageVolume) for quick scans.
+    Different time windows serve different purposes - this is intentional, not a bug!
+    """
+    try:
+        symbol = normalize_ticker_symbol(symbol)
+        executor = ThreadPoolExecutor(max_workers=len(_SCREEN_LOOKUPS) + 4)
         try:
-            upgrades_df = ticker.upgrades_downgrades
-            if upgrades_df is not None and not upgrades_df.empty:
-                recent_upgrades = upgrades_df.head(10).reset_index().to_dict('records')
-        except Exception:
-            pass
+            lookups = [executor.submit(fn, yf.Ticker(symbol)) for fn in _SCREEN_LOOKUPS]
+            history_future = executor.submit(_history, yf.Ticker(symbol))
+            market_future = executor.submit(fetch_market_history)
+            momentum_future = executor.submit(calculate_momentum, symbol)
+            options_future = executor.submit(get_options_data, symbol, "nearest")
+            info = yf.Ticker(symbol).info
+            (
+                calendar,
+                insider_transactions,
+                analyst_recommendations,
+                analyst_price_targets,
+                earnings_history,
+                recent_upgrades,
+            ) = (future.result() for future in lookups)
+            row = _screen_row(
+                symbol, info, momentum=momentum_future.result(), hist=history_future.result(),
+                market_hist=market_future.result(), calendar=calendar,
+            )
+            options_data = options_future.result()
+        finally:
+            # On failure (e.g. info raising for a bad symbol) answer at once instead
+            # of waiting on the lookups still in flight, such as the options chain
+            executor.shutdown(wait=False, cancel_futures=True)
 
         return {
-            "symbol": symbol,
-            "name": name,
-            "price": price,
-            "change": change,
-            "change_percent": change_pct,
-            "market_cap": market_cap,
-            "volume": volume,
-            "avg_volume": avg_volume,
-            "rel_volume": rel_volume,
-            "vol_momentum_1w": vol_momentum_1w,
-            "beta_spx": beta_spx,
-            "trailing_pe": trailing_pe,
-            "forward_pe": forward_pe,
-            "dividend_yield": dividend_yield,
-            "short_pct_float": short_pct_float,
-            "short_ratio": short_ratio,
-            "fifty_day_avg": fifty_day_avg,
-            "two_hundred_day_avg": two_hundred_day_avg,
-            "fifty_two_week_high": fifty_two_week_high,
-            "fifty_two_week_low": fifty_two_week_low,
-            "momentum_1w": momentum.get("momentum_1w"),
-            "momentum_1m": momentum.get("momentum_1m"),
-            "momentum_1y": momentum.get("momentum_1y"),
-            "idio_vol": vol_data.get("idio_vol"),
-            "total_vol": vol_data.get("total_vol"),
-            "rsi": rsi,
-            "calendar": calendar,
+            **row,
             "options_data": options_data,
             "insider_transactions": insider_transactions,
             "analyst_recommendations": analyst_recommendations,
@@ -192,119 +239,133 @@ def get_ticker_screen_data(symbol: str) -> dict[str, Any]:
         return {"symbol": symbol, "error": str(e)}
 
 
-def get_ticker_screen_data_batch(symbols: list[str]) -> list[dict[str, Any]]:
-    """Fetch comprehensive ticker data for multiple symbols using batch API"""
+def get_ticker_screen_data_batch(
+    symbols: list[str], max_workers: int = 8
+) -> list[dict[str, Any]]:
+    """Fetch comprehensive ticker data for multiple symbols using batch API
+
+    Symbols are processed in parallel on up to `max_workers` threads (each row
+    makes several blocking yfinance calls); results keep the input order.
+    """
+    return list(get_ticker_screen_data_batch_stream(symbols, max_workers))
+
+
+def get_ticker_screen_data_batch_stream(
+    symbols: list[str], max_workers: int = 8
+) -> Iterator[dict[str, Any]]:
+    """Yield get_ticker_screen_data_batch rows in input order as they complete
+
+    The batch-wide prefetches run on the first next(); after that each row is
+    yielded as soon as it and every row before it are done, instead of after
+    the whole batch.
+    """
     if not symbols:
-        return []
+        return
 
-    # Normalize all symbols
-    symbols = [normalize_ticker_symbol(s) for s in symbols]
+    # Normalize all symbols (upper-cased: yf.Tickers keys its Ticker objects that way)
+    symbols = [normalize_ticker_symbol(s).upper() for s in symbols]
 
     # Batch fetch all tickers at once (single request to Yahoo, not N separate requests)
     tickers_obj = yf.Tickers(" ".join(symbols))
 
-    results = []
-    for symbol in symbols:
-        try:
-            ticker_obj = tickers_obj.tickers[symbol]
-            info = ticker_obj.info
-
-            # Basic price data
-            price = info.get("regularMarketPrice") or info.get("currentPrice")
-            change = info.get("regularMarketChange")
-            change_pct = info.get("regularMarketChangePercent")
-            market_cap = info.get("marketCap")
-            volume = info.get("volume")
-            avg_volume = info.get("averageVolume")
-            name = info.get("longName") or info.get("shortName") or symbol
-
-            # Volume analytics - extrapolate intraday volume
-            rel_volume = calculate_relative_volume(volume, avg_volume)
-
-            # Factor exposures
-            beta_spx = info.get("beta")
-
-            # Valuation
-            trailing_pe = info.get("trailingPE")
-            forward_pe = info.get("forwardPE")
-            dividend_yield = info.get("dividendYield")
-
-            # Short interest (positioning)
-            short_pct_float = info.get("shortPercentOfFloat")
-            short_ratio = info.get("shortRatio")
-
-            # Technicals
-            fifty_day_avg = info.get("fiftyDayAverage")
-            two_hundred_day_avg = info.get("twoHundredDayAverage")
-            fifty_two_week_high = info.get("fiftyTwoWeekHigh")
-            fifty_two_week_low = info.get("fiftyTwoWeekLow")
-
-            # Get momentum
-            momentum = calculate_momentum(symbol)
-
-            # Get idio vol
-            vol_data = calculate_idio_vol(symbol)
-
-            # Calculate RSI and volume momentum
-            rsi = None
-            vol_momentum_1w = None
-            try:
-                hist = ticker_obj.history(period="1mo", interval="1d")
-                if not hist.empty and len(hist) >= RSI_PERIOD:
-                    rsi = calculate_rsi(hist["Close"])
-
-                    # Calculate volume momentum (1W = 5 trading days)
-                    # Shows if volume is trending up/down vs recent activity
-                    # - Positive: Volume increasing (activity picking up)
-                    # - Negative: Volume decreasing (cooling off)
-                    # - Complements rel_volume: rel_volume = long-term context (vs 3mo avg)
-                    #                           vol_momentum = short-term trend (vs last week)
-                    # Example: (0.93x 3mo, +33% 1W) = near average overall, but heating up recently
-                    if "Volume" in hist.columns and len(hist) >= 6:
-                        recent_vol = hist["Volume"].iloc[-1]  # Today
-                        week_ago_vol = hist["Volume"].iloc[-6]  # 5 trading days ago
-                        if week_ago_vol > 0:
-                            vol_momentum_1w = ((recent_vol - week_ago_vol) / week_ago_vol) * 100
-            except Exception:
-                pass
-
-            # Get calendar data (earnings and dividend dates)
-            calendar = None
-            try:  # noqa: SIM105
-                calendar = ticker_obj.calendar
-            except Exception:
-                pass  # Calendar not available for non-stocks (indices, ETFs, etc.)
-
-            results.append({
-                "symbol": symbol,
-                "name": name,
-                "price": price,
-                "change": change,
-                "change_percent": change_pct,
-                "market_cap": market_cap,
-                "volume": volume,
-                "avg_volume": avg_volume,
-                "rel_volume": rel_volume,
-                "vol_momentum_1w": vol_momentum_1w,
-                "beta_spx": beta_spx,
-                "trailing_pe": trailing_pe,
-                "forward_pe": forward_pe,
-                "dividend_yield": dividend_yield,
-                "short_pct_float": short_pct_float,
-                "short_ratio": short_ratio,
-                "fifty_day_avg": fifty_day_avg,
-                "two_hundred_day_avg": two_hundred_day_avg,
-                "fifty_two_week_high": fifty_two_week_high,
-                "fifty_two_week_low": fifty_two_week_low,
-                "momentum_1w": momentum.get("momentum_1w"),
-                "momentum_1m": momentum.get("momentum_1m"),
-                "momentum_1y": momentum.get("momentum_1y"),
-                "idio_vol": vol_data.get("idio_vol"),
-                "total_vol": vol_data.get("total_vol"),
-                "rsi": rsi,
-                "calendar": calendar,
-            })
-        except Exception as e:
-            results.append({"symbol": symbol, "error": str(e)})
-
-    return results
+    # Momentum lookback prices for the whole batch in one bulk download
+    prefetch_momentum(symbols)
+
+    # RSI / volume momentum / idio vol histories for the whole batch in one bulk
+    # download, regressed against one market index history
+    histories = _prefetch_histories(symbols)
+    market_hist = fetch_market_history()
+
+    # Session fraction for RVOL extrapolation, read once for the whole batch
+    day_fraction = market_day_fraction()
+
+    # Parallel I/O per symbol; map (not as_completed) preserves the input order
+    # and hands back each row as soon as the rows ahead of it are done
+    screen_row = partial(
+        _screen_batch_row, tickers=tickers_obj.tickers, day_fraction=day_fraction,
+        histories=histories, market_hist=market_hist,
+    )
+    executor = ThreadPoolExecutor(max_workers=max(1, min(len(symbols), max_workers)))
+    try:
+        yield from executor.map(screen_row, symbols)
+    finally:
+        # Consumer stopped early (close/GC) - don't block on rows still in flight
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _screen_batch_row(
+    symbol: str, tickers: dict[str, Any], day_fraction: float,
+    histories: dict[str, Any] | None = None, market_hist: Any = None,  # noqa: ANN401
+) -> dict[str, Any]:
+    """One get_ticker_screen_data_batch row from the batch's yf.Tickers (error dict on failure)"""
+    try:
+        ticker_obj = tickers[symbol]
+        hist = (histories or {}).get(symbol)
+        if hist is None:
+            hist = _history(ticker_obj)
+        info = ticker_obj.info
+        # No daily bars at all (bad symbol, delisted): skip momentum's price lookups
+        momentum = _NO_MOMENTUM if hist.empty else calculate_momentum(symbol, ticker_obj)
+        return _screen_row(
+            symbol, info, momentum=momentum, hist=hist,
+            market_hist=market_hist, calendar=_calendar(ticker_obj), day_fraction=day_fraction,
+        )
+    except Exception as e:
+        return {"symbol": symbol, "error": str(e)}
+
+
+def _screen_row(  # noqa: PLR0913
+    symbol: str,
+    info: dict[str, Any],
+    *,
+    momentum: dict[str, float | None],
+    hist: Any,  # pd.DataFrame  # noqa: ANN401
+    market_hist: Any,  # pd.DataFrame  # noqa: ANN401
+    calendar: Any,  # noqa: ANN401
+    day_fraction: float | None = None,
+) -> dict[str, Any]:
+    """Screen fields shared by the single and batch screens, from fetched inputs
+
+    hist is the symbol's daily bars (RSI, volume momentum, idio vol);
+    day_fraction is the batch's market_day_fraction() (default: now).
+    """
+    volume = info.get("volume")
+    avg_volume = info.get("averageVolume")  # 3-month avg (FREE with info call)
+    rsi, vol_momentum_1w = _history_stats(hist)
+    vol_data = calculate_idio_vol(symbol, hist, market_hist)
+
+    return {
+        # Basic price data
+        "symbol": symbol,
+        "name": info.get("longName") or info.get("shortName") or symbol,
+        "price": info.get("regularMarketPrice") or info.get("currentPrice"),
+        "change": info.get("regularMarketChange"),
+        "change_percent": info.get("regularMarketChangePercent"),
+        "market_cap": info.get("marketCap"),
+        "volume": volume,
+        "avg_volume": avg_volume,
+        # Volume analytics - extrapolate intraday volume
+        "rel_volume": calculate_relative_volume(volume, avg_volume, day_fraction),
+        "vol_momentum_1w": vol_momentum_1w,
+        # Factor exposures
+        "beta_spx": info.get("beta"),
+        # Valuation
+        "trailing_pe": info.get("trailingPE"),
+        "forward_pe": info.get("forwardPE"),
+        "dividend_yield": info.get("dividendYield"),
+        # Short interest (positioning)
+        "short_pct_float": info.get("shortPercentOfFloat"),
+        "short_ratio": info.get("shortRatio"),
+        # Technicals
+        "fifty_day_avg": info.get("fiftyDayAverage"),
+        "two_hundred_day_avg": info.get("twoHundredDayAverage"),
+        "fifty_two_week_high": info.get("fiftyTwoWeekHigh"),
+        "fifty_two_week_low": info.get("fiftyTwoWeekLow"),
+        "momentum_1w": momentum.get("momentum_1w"),
+        "momentum_1m": momentum.get("momentum_1m"),
+        "momentum_1y": momentum.get("momentum_1y"),
+        "idio_vol": vol_data.get("idio_vol"),
+        "total_vol": vol_data.get("total_vol"),
+        "rsi": rsi,
+        "calendar": calendar,
+    }